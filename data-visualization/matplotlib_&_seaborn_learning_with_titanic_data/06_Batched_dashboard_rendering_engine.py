@@ -0,0 +1,271 @@
+# Import libraries
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import matplotlib
+matplotlib.use('Agg')  # Headless backend: renders to files, safe inside worker processes
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+
+# ==========================================================
+# 1. Dashboard spec: what to draw, not how to compute it
+# ==========================================================
+
+@dataclass(frozen=True)
+class Query:
+    """A data query feeding one or more panels.
+
+    Frozen (hashable) so identical queries from different panels and
+    different figures collapse to ONE cache entry.
+
+    op:     'mean' | 'sum' | 'count' | 'values'
+    column: column the op applies to
+    by:     groupby keys (empty tuple = no grouping)
+    where:  equality filters as ((column, value), ...)
+    """
+    op: str
+    column: str
+    by: Tuple[str, ...] = ()
+    where: Tuple[Tuple[str, object], ...] = ()
+
+
+@dataclass
+class Panel:
+    """One subplot: plot kind, the queries it reads and its styling."""
+    title: str
+    kind: str                      # 'bar' | 'hist' | 'scatter' | 'grouped_bar'
+    queries: Tuple[Query, ...]
+    style: Dict = field(default_factory=dict)
+    xlabel: str = ''
+    ylabel: str = ''
+
+
+@dataclass
+class DashboardSpec:
+    """A whole figure: grid layout, panels and output file."""
+    name: str
+    title: str
+    panels: List[Panel]
+    nrows: int = 2
+    ncols: int = 2
+    figsize: Tuple[float, float] = (14, 10)
+    dpi: int = 100
+
+
+# ==========================================================
+# 2. Aggregate computation: each distinct query runs once
+# ==========================================================
+
+def compute_query(df: pd.DataFrame, query: Query):
+    """Evaluate a Query on the raw DataFrame (returns small, picklable results)."""
+    data = df
+    for col, value in query.where:
+        data = data[data[col] == value]
+    if query.op == 'values':
+        return data[query.column].to_numpy()
+    if not query.by:
+        return getattr(data[query.column], query.op)()
+    grouped = data.groupby(list(query.by))[query.column]
+    result = getattr(grouped, query.op)()
+    return result.unstack() if len(query.by) > 1 else result
+
+
+class AggregateCache:
+    """Computes every distinct Query across a batch of dashboards exactly once."""
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.results: Dict[Query, object] = {}
+        self.requested = 0
+
+    def prepare(self, dashboards: List[DashboardSpec]) -> Dict[Query, object]:
+        for dashboard in dashboards:
+            for panel in dashboard.panels:
+                for query in panel.queries:
+                    self.requested += 1
+                    if query not in self.results:
+                        self.results[query] = compute_query(self.df, query)
+        return self.results
+
+
+# ==========================================================
+# 3. Rendering: pure function of (spec, precomputed data)
+# ==========================================================
+
+def draw_panel(ax, panel: Panel, data: List[object]) -> None:
+    """Draw one panel from already-computed query results."""
+    style = dict(panel.style)
+    if panel.kind == 'bar':
+        series = data[0]
+        labels = style.pop('labels', [str(i) for i in series.index])
+        ax.bar(labels, series.values, edgecolor='black', **style)
+        for i, value in enumerate(series.values):
+            ax.text(i, value + 0.02, f'{value:.2f}', ha='center', va='bottom', fontsize=9)
+    elif panel.kind == 'grouped_bar':
+        table = data[0]
+        x = np.arange(len(table.index))
+        width = 0.8 / len(table.columns)
+        colors = style.pop('colors', [None] * len(table.columns))
+        for i, col in enumerate(table.columns):
+            ax.bar(x + i * width, table[col].values, width, label=str(col),
+                   color=colors[i], edgecolor='black', **style)
+        ax.set_xticks(x + width * (len(table.columns) - 1) / 2)
+        ax.set_xticklabels([str(i) for i in table.index])
+        ax.legend()
+    elif panel.kind == 'hist':
+        values = data[0]
+        ax.hist(values[~np.isnan(values)], edgecolor='black', **style)
+    elif panel.kind == 'scatter':
+        x, y, c = data
+        ax.scatter(x, y, c=c, **style)
+    else:
+        raise ValueError(f"Unknown panel kind: {panel.kind}")
+    ax.set_title(panel.title, fontweight='bold')
+    ax.set_xlabel(panel.xlabel)
+    ax.set_ylabel(panel.ylabel)
+    ax.grid(True, alpha=0.3)
+
+
+def render_dashboard(spec: DashboardSpec, data: Dict[Query, object], output_dir: str) -> str:
+    """Render one figure to PNG; runs in a worker process with the Agg backend."""
+    fig, axes = plt.subplots(spec.nrows, spec.ncols, figsize=spec.figsize)
+    fig.suptitle(spec.title, fontsize=16, fontweight='bold')
+    flat_axes = np.atleast_1d(axes).ravel()
+    for ax, panel in zip(flat_axes, spec.panels):
+        draw_panel(ax, panel, [data[q] for q in panel.queries])
+    for ax in flat_axes[len(spec.panels):]:
+        ax.axis('off')
+    fig.tight_layout()
+    path = os.path.join(output_dir, f'{spec.name}.png')
+    fig.savefig(path, dpi=spec.dpi, bbox_inches='tight', facecolor='white')
+    plt.close(fig)  # Free memory: workers render many figures
+    return path
+
+
+def _render_job(job):
+    spec, data, output_dir = job
+    return render_dashboard(spec, data, output_dir)
+
+
+class DashboardEngine:
+    """Batch renderer: shared aggregates + process pool.
+
+    1) AggregateCache computes each distinct Query once for the whole batch.
+    2) Each figure only receives the results its panels need (not the raw data).
+    3) Figures render in parallel worker processes using the Agg backend.
+    """
+
+    def __init__(self, df: pd.DataFrame, output_dir: str, max_workers: Optional[int] = None):
+        self.df = df
+        self.output_dir = output_dir
+        self.max_workers = max_workers
+        os.makedirs(output_dir, exist_ok=True)
+
+    def render(self, dashboards: List[DashboardSpec], parallel: bool = True) -> List[str]:
+        cache = AggregateCache(self.df)
+        results = cache.prepare(dashboards)
+        print(f"   Queries requested: {cache.requested}, distinct computed: {len(results)}")
+
+        jobs = []
+        for spec in dashboards:
+            needed = {q: results[q] for panel in spec.panels for q in panel.queries}
+            jobs.append((spec, needed, self.output_dir))
+
+        if not parallel or len(jobs) == 1:
+            return [_render_job(job) for job in jobs]
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(_render_job, jobs))
+
+
+# ==========================================================
+# 4. Titanic dashboards (panels from labs 03, 04 and 05)
+# ==========================================================
+
+def titanic_dashboard(name: str, title: str, where=()) -> DashboardSpec:
+    """The 2x2 OO-interface dashboard from lab 03, optionally filtered."""
+    where = tuple(where)
+    return DashboardSpec(
+        name=name,
+        title=title,
+        panels=[
+            Panel('Age Distribution', 'hist', (Query('values', 'Age', where=where),),
+                  style={'bins': 15, 'color': 'lightblue', 'alpha': 0.7},
+                  xlabel='Age (Years)', ylabel='Count'),
+            Panel('Survival Rate by Class', 'bar', (Query('mean', 'Survived', ('Pclass',), where),),
+                  style={'color': ['gold', 'silver', 'brown'], 'alpha': 0.7},
+                  xlabel='Passenger Class', ylabel='Survival Rate'),
+            Panel('Survival Rate by Class & Gender', 'grouped_bar',
+                  (Query('mean', 'Survived', ('Pclass', 'Sex'), where),),
+                  style={'colors': ['#FF69B4', '#4169E1'], 'alpha': 0.8},
+                  xlabel='Passenger Class', ylabel='Survival Rate'),
+            Panel('Age vs Fare (by Survival)', 'scatter',
+                  (Query('values', 'Age', where=where), Query('values', 'Fare', where=where),
+                   Query('values', 'Survived', where=where)),
+                  style={'cmap': 'RdYlGn', 'alpha': 0.6, 's': 15},
+                  xlabel='Age (Years)', ylabel='Fare (£)'),
+        ],
+    )
+
+
+def build_report(ports, sexes) -> List[DashboardSpec]:
+    """One overview figure plus one per embarkation port and per port/sex slice."""
+    dashboards = [titanic_dashboard('overview', 'Titanic Overview')]
+    for port in ports:
+        dashboards.append(titanic_dashboard(f'port_{port}', f'Embarked at {port}', [('Embarked', port)]))
+        for sex in sexes:
+            dashboards.append(titanic_dashboard(
+                f'port_{port}_{sex}', f'Embarked at {port} - {sex}', [('Embarked', port), ('Sex', sex)]))
+    # Nightly reports re-render the same views for several audiences
+    return [
+        DashboardSpec(f'{d.name}_{audience}', f'{d.title} ({audience})', d.panels)
+        for audience in ('board', 'ops', 'web')
+        for d in dashboards
+    ]
+
+
+def render_serial_naive(df: pd.DataFrame, dashboards: List[DashboardSpec], output_dir: str) -> None:
+    """Baseline: recompute every panel's aggregates inside every figure (labs 03-05 style)."""
+    os.makedirs(output_dir, exist_ok=True)
+    for spec in dashboards:
+        data = {q: compute_query(df, q) for panel in spec.panels for q in panel.queries}
+        render_dashboard(spec, data, output_dir)
+
+
+if __name__ == '__main__':
+    print("🎯 Batched dashboard rendering: shared aggregates + process pool")
+
+    data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'titanic_data.csv')
+    titanic_data = pd.read_csv(data_path)
+    print(f"Data sample: {len(titanic_data)} passengers")
+
+    ports = sorted(titanic_data['Embarked'].dropna().unique())
+    report = build_report(ports, ['female', 'male'])
+    print(f"📋 Report spec: {len(report)} figures × 4 panels")
+
+    print("\n⏱️ Baseline: serial, aggregates recomputed per figure")
+    start = time.time()
+    render_serial_naive(titanic_data, report, 'dashboard_exports_serial')
+    serial_time = time.time() - start
+    print(f"   {serial_time:.2f}s")
+
+    print("\n⏱️ Engine: distinct aggregates once, figures in a process pool")
+    start = time.time()
+    engine = DashboardEngine(titanic_data, 'dashboard_exports')
+    paths = engine.render(report)
+    engine_time = time.time() - start
+    print(f"   {engine_time:.2f}s for {len(paths)} figures ({serial_time/engine_time:.1f}x faster)")
+
+    print("\n✅ Example outputs:")
+    for path in paths[:3]:
+        print(f"   {path}")
+
+    print("\n📚 Key Learning:")
+    print("• Describe dashboards as data (panels + queries + style), then render")
+    print("• Hashable queries let many panels/figures share ONE computed aggregate")
+    print("• Agg backend + ProcessPoolExecutor renders figures on all CPU cores")
+    print("• Always plt.close(fig) when rendering in a loop to keep memory flat")
@@ -0,0 +1,317 @@
+# Import libraries
+import hashlib
+import json
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+import matplotlib
+matplotlib.use('Agg')  # Headless backend: we only write files
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image
+
+
+# ==========================================================
+# 1. Export targets (the four savefig calls from lab 05)
+# ==========================================================
+
+@dataclass(frozen=True)
+class ExportTarget:
+    """One output file: raster targets ('png') or vector targets ('pdf', 'svg')."""
+    path: str
+    fmt: str
+    dpi: int = 300
+
+    @property
+    def is_raster(self) -> bool:
+        return self.fmt == 'png'
+
+
+LAB05_TARGETS = [
+    ExportTarget('titanic_analysis_presentation.png', 'png', dpi=300),
+    ExportTarget('titanic_analysis_publication.pdf', 'pdf', dpi=300),
+    ExportTarget('titanic_analysis_web.svg', 'svg'),
+    ExportTarget('titanic_analysis_web.png', 'png', dpi=150),
+]
+
+
+# ==========================================================
+# 2. Change detection: hash of data inputs + style
+# ==========================================================
+
+def fingerprint(inputs, style: Dict) -> str:
+    """Stable hash of the figure's data inputs and style settings."""
+    digest = hashlib.sha256()
+    for item in inputs:
+        if isinstance(item, (pd.DataFrame, pd.Series)):
+            digest.update(pd.util.hash_pandas_object(item, index=True).to_numpy().tobytes())
+            labels = item.columns if isinstance(item, pd.DataFrame) else [item.name]
+            digest.update(repr(list(labels)).encode())
+        elif isinstance(item, np.ndarray):
+            digest.update(item.tobytes())
+        else:
+            digest.update(repr(item).encode())
+    digest.update(json.dumps(style, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+# ==========================================================
+# 3. Vector formats: each one saved in its own process
+# ==========================================================
+
+def _save_vector(job) -> str:
+    """Worker: unpickle the figure and write one vector format."""
+    figure_bytes, target = job
+    fig = pickle.loads(figure_bytes)
+    fig.savefig(target.path, format=target.fmt, dpi=target.dpi,
+                bbox_inches='tight', facecolor='white', edgecolor='none')
+    plt.close(fig)
+    return target.path
+
+
+class MultiFormatExporter:
+    """Export one figure to many formats with a single raster draw.
+
+    - Raster (PNG): the figure is drawn ONCE at the highest requested dpi,
+      cropped to the tight bounding box, and every lower-dpi PNG is a
+      high-quality resample of that buffer (no re-draw).
+    - Vector (PDF/SVG): the figure is pickled and each format is written
+      by its own worker process, in parallel with the raster pass.
+    - Skipping: a manifest stores the fingerprint (data + style) of each
+      output; if nothing changed and the files exist, the figure is not
+      even built.
+    """
+
+    def __init__(self, output_dir: str, manifest_name: str = '.export_manifest.json',
+                 max_workers: Optional[int] = None):
+        self.output_dir = output_dir
+        self.manifest_path = os.path.join(output_dir, manifest_name)
+        self.max_workers = max_workers
+        os.makedirs(output_dir, exist_ok=True)
+        self.manifest = self._load_manifest()
+
+    # ---------- Manifest ----------
+
+    def _load_manifest(self) -> Dict[str, str]:
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save_manifest(self) -> None:
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2)
+
+    def _full_path(self, target: ExportTarget) -> str:
+        return os.path.join(self.output_dir, target.path)
+
+    def _stale_targets(self, targets: List[ExportTarget], key: str) -> List[ExportTarget]:
+        return [
+            t for t in targets
+            if self.manifest.get(t.path) != key or not os.path.exists(self._full_path(t))
+        ]
+
+    # ---------- Raster: draw once, resample ----------
+
+    def _export_rasters(self, fig, targets: List[ExportTarget], pad_inches: float = 0.1) -> None:
+        base_dpi = max(t.dpi for t in targets)
+        fig.set_dpi(base_dpi)
+        fig.patch.set_facecolor('white')
+        canvas = FigureCanvasAgg(fig)
+        canvas.draw()  # The one and only raster draw
+        rgba = np.asarray(canvas.buffer_rgba())
+
+        # Crop to the tight bbox (what bbox_inches='tight' does), in pixels
+        bbox = fig.get_tightbbox(canvas.get_renderer()).padded(pad_inches)
+        height = rgba.shape[0]
+        x0 = max(0, int(np.floor(bbox.x0 * base_dpi)))
+        x1 = min(rgba.shape[1], int(np.ceil(bbox.x1 * base_dpi)))
+        top = max(0, int(np.floor(height - bbox.y1 * base_dpi)))
+        bottom = min(height, int(np.ceil(height - bbox.y0 * base_dpi)))
+        image = Image.fromarray(rgba[top:bottom, x0:x1]).convert('RGB')
+
+        for target in targets:
+            if target.dpi == base_dpi:
+                out = image
+            else:
+                scale = target.dpi / base_dpi
+                size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+                out = image.resize(size, Image.LANCZOS)
+            out.save(self._full_path(target), format='PNG', dpi=(target.dpi, target.dpi))
+
+    # ---------- Vector: parallel workers ----------
+
+    def _start_vectors(self, fig, targets: List[ExportTarget]):
+        """Pickle the figure and submit one worker per vector format.
+
+        Returns the pool (or None) so the raster pass can run in the main
+        process while the workers write PDF/SVG.
+        """
+        if not targets:
+            return None, []
+        figure_bytes = pickle.dumps(fig)
+        pool = ProcessPoolExecutor(max_workers=self.max_workers or len(targets))
+        futures = [
+            pool.submit(_save_vector, (figure_bytes, ExportTarget(self._full_path(t), t.fmt, t.dpi)))
+            for t in targets
+        ]
+        return pool, futures
+
+    # ---------- Public API ----------
+
+    def export(self, build_figure: Callable[[], plt.Figure], targets: List[ExportTarget],
+               inputs=(), style: Optional[Dict] = None) -> List[str]:
+        """Build (only if needed) and export a figure to every stale target.
+
+        Args:
+            build_figure: Zero-argument callable returning a matplotlib Figure.
+            targets: Output files to produce.
+            inputs: Data the figure depends on (DataFrames, arrays, scalars).
+            style: Style settings the figure depends on (style name, palette...).
+
+        Returns:
+            The list of paths actually written (empty if everything was current).
+        """
+        key = fingerprint(inputs, style or {})
+        stale = self._stale_targets(targets, key)
+        if not stale:
+            return []
+
+        fig = build_figure()
+        pool = None
+        try:
+            # Pickle for the vector workers before the raster pass changes the dpi
+            pool, futures = self._start_vectors(fig, [t for t in stale if not t.is_raster])
+            rasters = [t for t in stale if t.is_raster]
+            if rasters:
+                self._export_rasters(fig, rasters)
+            for future in futures:
+                future.result()
+        finally:
+            if pool is not None:
+                pool.shutdown()
+            plt.close(fig)
+
+        for target in stale:
+            self.manifest[target.path] = key
+        self._save_manifest()
+        return [self._full_path(t) for t in stale]
+
+
+# ==========================================================
+# 4. The publication-ready figure from lab 05
+# ==========================================================
+
+STYLE = {
+    'style': 'seaborn-v0_8-white',
+    'class_colors': ['#FFD700', '#C0C0C0', '#CD7F32'],
+    'gender_colors': ['#FF69B4', '#4169E1'],
+    'hist_color': '#2E86AB',
+}
+
+
+def build_publication_figure(titanic_data: pd.DataFrame, style: Dict) -> plt.Figure:
+    """Same 2x2 figure as lab 05.4, built from the DataFrame and style dict."""
+    with plt.style.context(style['style']):
+        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+        fig.suptitle('Titanic Analysis - Publication Ready Export',
+                     fontsize=18, fontweight='bold', y=0.98)
+
+        titanic_data['Age'].plot(kind='hist', bins=15, ax=axes[0, 0],
+                                 color=style['hist_color'], alpha=0.8, edgecolor='white')
+        axes[0, 0].set_title('Age Distribution', fontsize=14, fontweight='bold')
+        axes[0, 0].set_xlabel('Age (Years)')
+        axes[0, 0].set_ylabel('Count')
+        axes[0, 0].grid(axis='y', alpha=0.3)
+
+        survival_by_class = titanic_data.groupby('Pclass')['Survived'].mean()
+        survival_by_class.plot(kind='bar', ax=axes[0, 1], color=style['class_colors'], edgecolor='black')
+        axes[0, 1].set_title('Survival Rate by Class', fontsize=14, fontweight='bold')
+        axes[0, 1].set_xlabel('Passenger Class')
+        axes[0, 1].set_ylabel('Survival Rate')
+        axes[0, 1].set_xticklabels(['1st', '2nd', '3rd'], rotation=0)
+        axes[0, 1].set_ylim(0, 1)
+
+        gender_survival = titanic_data.groupby('Sex')['Survived'].mean()
+        gender_survival.plot(kind='bar', ax=axes[1, 0], color=style['gender_colors'], edgecolor='black')
+        axes[1, 0].set_title('Survival Rate by Gender', fontsize=14, fontweight='bold')
+        axes[1, 0].set_xlabel('Gender')
+        axes[1, 0].set_ylabel('Survival Rate')
+        axes[1, 0].set_xticklabels(['Female', 'Male'], rotation=0)
+        axes[1, 0].set_ylim(0, 1)
+
+        scatter = axes[1, 1].scatter(titanic_data['Age'], titanic_data['Fare'],
+                                     c=titanic_data['Survived'], cmap='RdYlGn',
+                                     alpha=0.7, edgecolors='black', linewidth=0.3)
+        axes[1, 1].set_title('Age vs Fare by Survival', fontsize=14, fontweight='bold')
+        axes[1, 1].set_xlabel('Age (Years)')
+        axes[1, 1].set_ylabel('Fare (£)')
+        axes[1, 1].grid(True, alpha=0.3)
+        cbar = fig.colorbar(scatter, ax=axes[1, 1], shrink=0.8)
+        cbar.set_label('Survival Status', fontsize=10)
+        cbar.set_ticks([0, 1])
+        cbar.set_ticklabels(['Did not survive', 'Survived'])
+
+        fig.tight_layout()
+    return fig
+
+
+def export_naive(fig, output_dir: str) -> None:
+    """Lab 05 approach: four savefig calls, four full draws."""
+    for target in LAB05_TARGETS:
+        fig.savefig(os.path.join(output_dir, target.path), format=target.fmt, dpi=target.dpi,
+                    bbox_inches='tight', facecolor='white', edgecolor='none')
+
+
+if __name__ == '__main__':
+    print("🎯 Single-render, multi-format export")
+
+    data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'titanic_data.csv')
+    titanic_data = pd.read_csv(data_path)
+    print(f"Data sample: {len(titanic_data)} passengers")
+
+    print("\n⏱️ Baseline: savefig x4 (each call re-draws the figure)")
+    os.makedirs('exports_naive', exist_ok=True)
+    fig = build_publication_figure(titanic_data, STYLE)
+    start = time.time()
+    export_naive(fig, 'exports_naive')
+    naive_time = time.time() - start
+    plt.close(fig)
+    print(f"   {naive_time:.2f}s")
+
+    exporter = MultiFormatExporter('exports')
+    exporter.manifest.clear()  # Force a full export for the timing demo
+
+    print("\n⏱️ Exporter: one raster draw + parallel vector workers")
+    start = time.time()
+    written = exporter.export(lambda: build_publication_figure(titanic_data, STYLE),
+                              LAB05_TARGETS, inputs=(titanic_data,), style=STYLE)
+    export_time = time.time() - start
+    print(f"   {export_time:.2f}s (includes building the figure)")
+    for path in written:
+        print(f"   ✅ {path} ({os.path.getsize(path) / 1024:.0f} KB)")
+
+    print("\n⏱️ Re-run with unchanged data and style")
+    start = time.time()
+    written = exporter.export(lambda: build_publication_figure(titanic_data, STYLE),
+                              LAB05_TARGETS, inputs=(titanic_data,), style=STYLE)
+    print(f"   {len(written)} files written in {(time.time() - start)*1000:.1f}ms (all up to date)")
+
+    print("\n⏱️ Re-run after a style change")
+    new_style = dict(STYLE, hist_color='#A23B72')
+    written = exporter.export(lambda: build_publication_figure(titanic_data, new_style),
+                              LAB05_TARGETS, inputs=(titanic_data,), style=new_style)
+    print(f"   {len(written)} files re-exported")
+
+    print("\n📚 Key Learning:")
+    print("• Every savefig() call re-draws the whole figure")
+    print("• Draw the raster once at the highest dpi, then resample for smaller PNGs")
+    print("• Figures are picklable, so vector formats can be written in parallel processes")
+    print("• Hash data + style to skip exports whose inputs did not change")
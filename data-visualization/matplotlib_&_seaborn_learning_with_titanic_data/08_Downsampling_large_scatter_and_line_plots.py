@@ -0,0 +1,215 @@
+# Import libraries
+import os
+import time
+
+import matplotlib
+matplotlib.use('Agg')  # Headless backend: we compare render time and file size
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.colors import LogNorm
+
+
+# ==========================================================
+# 1. 2D density grid for scatter plots
+# ==========================================================
+
+def density_grid(x, y, bins=(200, 150), value=None, bounds=None):
+    """Bin points into a 2D grid with np.histogram2d.
+
+    Args:
+        x, y: Point coordinates (NaN pairs are dropped).
+        bins: Grid cells along (x, y) - choose roughly the panel size in pixels.
+        value: Optional per-point value (e.g. Survived); when given, the
+            per-cell MEAN of value is returned alongside the counts.
+        bounds: ((xmin, xmax), (ymin, ymax)); defaults to the data range.
+
+    Returns:
+        (counts, mean_value or None, xedges, yedges)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    keep = ~(np.isnan(x) | np.isnan(y))
+    if bounds is None:
+        bounds = ((x[keep].min(), x[keep].max()), (y[keep].min(), y[keep].max()))
+    counts, xedges, yedges = np.histogram2d(x[keep], y[keep], bins=bins, range=bounds)
+    mean_value = None
+    if value is not None:
+        weights = np.asarray(value, dtype=float)[keep]
+        totals, _, _ = np.histogram2d(x[keep], y[keep], bins=(xedges, yedges), weights=weights)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean_value = totals / counts
+    return counts, mean_value, xedges, yedges
+
+
+def plot_large_scatter(ax, x, y, c=None, max_points=20_000, bins=(200, 150), cmap='RdYlGn', **scatter_kwargs):
+    """Scatter for small data, density image for big data.
+
+    Below max_points this is a normal ax.scatter. Above it, points are
+    binned and drawn as ONE image, so draw time and file size depend on
+    the grid size, not on the number of rows.
+
+    - Without c: cells are colored by point count (log scale).
+    - With c (e.g. Survived 0/1): cells are colored by the mean of c and
+      faded by count, so sparse cells look lighter.
+    """
+    if len(x) <= max_points:
+        return ax.scatter(x, y, c=c, cmap=cmap if c is not None else None, **scatter_kwargs)
+
+    counts, mean_value, xedges, yedges = density_grid(x, y, bins=bins, value=c)
+    extent = (xedges[0], xedges[-1], yedges[0], yedges[-1])
+    if mean_value is None:
+        masked = np.ma.masked_equal(counts.T, 0)
+        return ax.imshow(masked, origin='lower', extent=extent, aspect='auto',
+                         cmap='viridis', norm=LogNorm(vmin=1, vmax=counts.max()),
+                         interpolation='nearest')
+
+    rgba = plt.get_cmap(cmap)(np.nan_to_num(mean_value.T))
+    alpha = np.log1p(counts.T) / np.log1p(counts.max())
+    rgba[..., 3] = np.where(counts.T > 0, 0.25 + 0.75 * alpha, 0.0)
+    return ax.imshow(rgba, origin='lower', extent=extent, aspect='auto', interpolation='nearest')
+
+
+# ==========================================================
+# 2. Line decimation: min-max and LTTB
+# ==========================================================
+
+def minmax_decimate(x, y, n_buckets):
+    """Keep the min and max of each bucket (exact visual envelope).
+
+    At one bucket per pixel column, the decimated line covers exactly the
+    same pixels as the full line. Vectorized: one reshape + argmin/argmax.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(y) <= 2 * n_buckets:
+        return x, y
+    size = len(y) // n_buckets
+    usable = size * n_buckets
+    blocks = y[:usable].reshape(n_buckets, size)
+    starts = np.arange(n_buckets) * size
+    lo = starts + blocks.argmin(axis=1)
+    hi = starts + blocks.argmax(axis=1)
+    parts = [lo, hi]
+    if usable < len(y):
+        # Leftover points form one last, shorter bucket
+        tail = y[usable:]
+        parts.append(np.array([usable + tail.argmin(), usable + tail.argmax()]))
+    idx = np.unique(np.concatenate(parts))
+    return x[idx], y[idx]
+
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last points, then from each bucket picks the point
+    forming the largest triangle with the previously kept point and the
+    average of the next bucket. Preserves the visual shape with n_out points.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        next_stop = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[stop:next_stop].mean()
+        avg_y = y[stop:next_stop].mean()
+        # Twice the triangle area for every candidate in this bucket
+        area = np.abs((x[a] - avg_x) * (y[start:stop] - y[a]) - (x[a] - x[start:stop]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        keep[i + 1] = a
+    return x[keep], y[keep]
+
+
+def plot_large_line(ax, x, y, width_px=1200, method='minmax', **plot_kwargs):
+    """Draw a long line with at most ~2 points per pixel column."""
+    if method == 'lttb':
+        xs, ys = lttb(x, y, width_px)
+    else:
+        xs, ys = minmax_decimate(x, y, width_px)
+    return ax.plot(xs, ys, **plot_kwargs)
+
+
+# ==========================================================
+# 3. Demo: millions of Titanic-like passengers
+# ==========================================================
+
+def make_big_titanic(titanic_data: pd.DataFrame, n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """Bootstrap the real passengers with jitter to get a large sample."""
+    rng = np.random.default_rng(seed)
+    base = titanic_data[['Age', 'Fare', 'Survived']].dropna()
+    picks = rng.integers(0, len(base), n_rows)
+    big = base.iloc[picks].reset_index(drop=True)
+    big['Age'] = np.clip(big['Age'] + rng.normal(0, 1.5, n_rows), 0, 80)
+    big['Fare'] = np.clip(big['Fare'] * rng.lognormal(0, 0.1, n_rows), 0, 520)
+    return big
+
+
+def timed_save(fig, path):
+    start = time.time()
+    fig.savefig(path, dpi=100, bbox_inches='tight')
+    elapsed = time.time() - start
+    plt.close(fig)
+    return elapsed, os.path.getsize(path) / 1024
+
+
+if __name__ == '__main__':
+    print("🎯 Downsampling large scatter and line plots")
+
+    data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'titanic_data.csv')
+    titanic_data = pd.read_csv(data_path)
+    output_dir = 'downsampling_exports'
+    os.makedirs(output_dir, exist_ok=True)
+
+    n_rows = 2_000_000
+    big = make_big_titanic(titanic_data, n_rows)
+    print(f"Synthetic sample: {n_rows:,} passengers")
+
+    print("\n⏱️ Scatter: Age vs Fare colored by survival (SVG, where every point is stored)")
+    sample = big.iloc[:200_000]  # Full scatter of 2M points as SVG is too slow to demo
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.scatter(sample['Age'], sample['Fare'], c=sample['Survived'], cmap='RdYlGn', s=4, alpha=0.5)
+    ax.set_title(f'Raw scatter ({len(sample):,} points)')
+    raw_time, raw_size = timed_save(fig, os.path.join(output_dir, 'scatter_raw.svg'))
+    print(f"   Raw ({len(sample):,} points):   {raw_time:6.2f}s, {raw_size:9.0f} KB")
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    start = time.time()
+    plot_large_scatter(ax, big['Age'], big['Fare'], c=big['Survived'])
+    bin_time = time.time() - start
+    ax.set_title(f'Density scatter ({n_rows:,} points, 200×150 grid)')
+    ax.set_xlabel('Age (Years)')
+    ax.set_ylabel('Fare (£)')
+    density_time, density_size = timed_save(fig, os.path.join(output_dir, 'scatter_density.svg'))
+    print(f"   Density ({n_rows:,} points): {bin_time + density_time:6.2f}s, {density_size:9.0f} KB")
+
+    print("\n⏱️ Line: cumulative survivors in boarding order (PNG)")
+    cumulative = big['Survived'].cumsum().to_numpy() - np.arange(n_rows) * big['Survived'].mean()
+    order = np.arange(n_rows)
+
+    fig, ax = plt.subplots(figsize=(12, 4))
+    ax.plot(order, cumulative, linewidth=0.8)
+    full_time, full_size = timed_save(fig, os.path.join(output_dir, 'line_full.png'))
+
+    for method in ('minmax', 'lttb'):
+        fig, ax = plt.subplots(figsize=(12, 4))
+        start = time.time()
+        plot_large_line(ax, order, cumulative, width_px=1200, method=method, linewidth=0.8)
+        reduce_time = time.time() - start
+        ax.set_title(f'{method} decimation: {n_rows:,} → {len(ax.lines[0].get_xdata()):,} points')
+        t, size = timed_save(fig, os.path.join(output_dir, f'line_{method}.png'))
+        print(f"   {method:<6}: {reduce_time + t:6.2f}s ({len(ax.lines[0].get_xdata()):,} points)")
+    print(f"   full  : {full_time:6.2f}s ({n_rows:,} points)")
+
+    print("\n📚 Key Learning:")
+    print("• A screen has ~10⁶ pixels; drawing 10⁷ points cannot show more detail")
+    print("• np.histogram2d turns any number of points into one fixed-size image")
+    print("• Min-max decimation keeps the exact pixel envelope of a line")
+    print("• LTTB keeps the visual shape with a fixed number of points")
@@ -0,0 +1,224 @@
+# Import libraries
+import os
+import time
+from typing import Dict, Optional, Sequence, Tuple
+
+import matplotlib
+matplotlib.use('Agg')  # Headless backend: figures are written to files
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+
+# ==========================================================
+# 1. HistogramEngine: bin once, derive every variant
+# ==========================================================
+
+class HistogramEngine:
+    """Fine-grained bin counts for one column, optionally per group.
+
+    The raw values are binned ONCE into narrow fixed-width bins (e.g. half
+    a year of Age). Every histogram variant is then derived from those
+    counts alone:
+
+    - coarser bins: sum neighbouring fine bins (np.add.reduceat)
+    - density: counts / (total * bin width)
+    - cumulative: np.cumsum
+    - per-group / overlapping / stacked: pick or sum group rows
+
+    Drawing uses ax.stairs, so the raw data is never touched again.
+    update() accepts chunks, so the counts can be built from a stream
+    (e.g. pd.read_csv(..., chunksize=...)).
+    """
+
+    def __init__(self, column: str, low: float, high: float, fine_width: float,
+                 by: Sequence[str] = ()):
+        self.column = column
+        self.by = tuple(by)
+        self.n_fine = int(round((high - low) / fine_width))
+        self.edges = low + fine_width * np.arange(self.n_fine + 1)
+        self.fine_width = fine_width
+        self.counts: Dict[Tuple, np.ndarray] = {}
+        self.missing: Dict[Tuple, int] = {}
+        self.rows_seen = 0
+
+    # ---------- Building (one pass per chunk) ----------
+
+    def update(self, chunk: pd.DataFrame) -> 'HistogramEngine':
+        """Add a chunk of rows to the counts."""
+        values = chunk[self.column].to_numpy(dtype=float)
+        # Clip into the outer bins so min/max are never lost
+        fine = np.clip(((values - self.edges[0]) // self.fine_width), 0, self.n_fine - 1)
+        if self.by:
+            keys = pd.MultiIndex.from_frame(chunk[list(self.by)])
+            codes, uniques = pd.factorize(keys)
+        else:
+            codes, uniques = np.zeros(len(chunk), dtype=int), [()]
+        grouped = codes >= 0  # Rows with a missing group key are skipped
+        present = grouped & ~np.isnan(values)
+
+        # One bincount for all groups at once: index = group * n_fine + bin
+        flat = codes[present] * self.n_fine + fine[present].astype(int)
+        table = np.bincount(flat, minlength=len(uniques) * self.n_fine).reshape(len(uniques), self.n_fine)
+        missing = np.bincount(codes[grouped & ~present], minlength=len(uniques))
+        for i, key in enumerate(uniques):
+            key = tuple(key) if self.by else ()
+            self.counts[key] = self.counts.get(key, 0) + table[i]
+            self.missing[key] = self.missing.get(key, 0) + int(missing[i])
+        self.rows_seen += len(chunk)
+        return self
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, column: str, low: float, high: float,
+                   fine_width: float, by: Sequence[str] = ()) -> 'HistogramEngine':
+        return cls(column, low, high, fine_width, by).update(df)
+
+    # ---------- Deriving variants (no raw data) ----------
+
+    def select(self, **where) -> np.ndarray:
+        """Fine counts summed over every group matching the given key values."""
+        total = np.zeros(self.n_fine, dtype=np.int64)
+        for key, counts in self.counts.items():
+            named = dict(zip(self.by, key))
+            if all(named.get(col) == value for col, value in where.items()):
+                total += counts
+        return total
+
+    def rebin(self, fine_counts: np.ndarray, bins: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Merge fine bins into about `bins` coarse bins aligned to fine edges."""
+        starts = np.unique(np.round(np.linspace(0, self.n_fine, bins + 1)[:-1]).astype(int))
+        coarse = np.add.reduceat(fine_counts, starts)
+        edges = np.append(self.edges[starts], self.edges[-1])
+        return coarse, edges
+
+    def histogram(self, bins: Optional[int] = None, density: bool = False,
+                  cumulative: bool = False, **where) -> Tuple[np.ndarray, np.ndarray]:
+        """Counts (or density / cumulative values) and edges for one variant."""
+        values = self.select(**where)
+        edges = self.edges
+        if bins is not None:
+            values, edges = self.rebin(values, bins)
+        values = values.astype(float)
+        if cumulative:
+            values = np.cumsum(values)
+        if density:
+            total = values[-1] if cumulative else values.sum()
+            values = values / total if cumulative else values / (total * np.diff(edges))
+        return values, edges
+
+    # ---------- Drawing ----------
+
+    def draw(self, ax, bins: Optional[int] = None, density: bool = False, cumulative: bool = False,
+             orientation: str = 'vertical', where: Optional[Dict] = None, **style):
+        """Draw one variant with ax.stairs (fill=True looks like plt.hist bars)."""
+        values, edges = self.histogram(bins, density, cumulative, **(where or {}))
+        style.setdefault('fill', True)
+        ax.stairs(values, edges, orientation=orientation, **style)
+        return values, edges
+
+    def draw_stacked(self, ax, groups: Sequence[Dict], colors: Sequence[str], labels: Sequence[str],
+                     bins: Optional[int] = None, **style):
+        """Stacked histogram: each layer starts where the previous one ended."""
+        base = None
+        for where, color, label in zip(groups, colors, labels):
+            values, edges = self.histogram(bins, **where)
+            bottom = np.zeros_like(values) if base is None else base
+            ax.stairs(bottom + values, edges, baseline=bottom, fill=True, color=color, label=label, **style)
+            base = bottom + values
+
+
+# ==========================================================
+# 2. Demo: the lab 02 histogram variants
+# ==========================================================
+
+if __name__ == '__main__':
+    print("🎯 Precomputed histogram engine: bin once, draw many variants")
+
+    data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'titanic_data.csv')
+    titanic_data = pd.read_csv(data_path)
+    output_dir = 'histogram_exports'
+    os.makedirs(output_dir, exist_ok=True)
+
+    start = time.time()
+    age_hist = HistogramEngine.from_frame(titanic_data, 'Age', low=0, high=80, fine_width=0.5,
+                                          by=('Sex', 'Pclass', 'Survived'))
+    print(f"Binned {age_hist.rows_seen} rows into {age_hist.n_fine} fine bins × "
+          f"{len(age_hist.counts)} groups in {(time.time() - start)*1000:.2f}ms")
+
+    # Sanity check against np.histogram on the same coarse edges
+    coarse, edges = age_hist.histogram(bins=20)
+    expected, _ = np.histogram(titanic_data['Age'].dropna(), bins=edges)
+    assert np.array_equal(coarse, expected)
+    female, edges = age_hist.histogram(bins=16, Sex='female')
+    expected, _ = np.histogram(titanic_data.loc[titanic_data['Sex'] == 'female', 'Age'].dropna(), bins=edges)
+    assert np.array_equal(female, expected)
+    print("✅ Derived histograms equal np.histogram on the raw data")
+
+    # Bin count comparison (lab 02: 10, 20 and 5 bins)
+    fig, axes = plt.subplots(1, 3, figsize=(15, 5))
+    for ax, bins, color in zip(axes, [10, 20, 5], ['lightblue', 'lightgreen', 'lightcoral']):
+        age_hist.draw(ax, bins=bins, color=color, edgecolor='black')
+        ax.set_title(f'{bins} Bins')
+        ax.set_xlabel('Age')
+    axes[0].set_ylabel('Count')
+    fig.tight_layout()
+    fig.savefig(os.path.join(output_dir, 'age_bin_sizes.png'), dpi=100)
+    plt.close(fig)
+
+    # Density, cumulative and horizontal variants
+    fig, axes = plt.subplots(1, 3, figsize=(15, 5))
+    age_hist.draw(axes[0], bins=20, density=True, color='steelblue', alpha=0.8)
+    axes[0].set_title('Density (area = 1)')
+    age_hist.draw(axes[1], bins=40, cumulative=True, density=True, color='#FF6B35', alpha=0.8)
+    axes[1].set_title('Cumulative Distribution')
+    age_hist.draw(axes[2], bins=20, orientation='horizontal', color='green', alpha=0.6, edgecolor='black')
+    axes[2].set_title('Horizontal Orientation')
+    fig.tight_layout()
+    fig.savefig(os.path.join(output_dir, 'age_variants.png'), dpi=100)
+    plt.close(fig)
+
+    # Overlapping (by gender) and stacked (by survival) comparisons
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    age_hist.draw(axes[0], bins=16, where={'Sex': 'male'}, color='lightblue', alpha=0.7, label='Male')
+    age_hist.draw(axes[0], bins=16, where={'Sex': 'female'}, color='pink', alpha=0.7, label='Female')
+    axes[0].set_title('Age Distribution by Gender (overlapping)')
+    axes[0].legend()
+    age_hist.draw_stacked(axes[1], [{'Survived': 0}, {'Survived': 1}], ['red', 'green'],
+                          ['Did not survive', 'Survived'], bins=16, alpha=0.7)
+    axes[1].set_title('Age Distribution by Survival (stacked)')
+    axes[1].legend()
+    fig.tight_layout()
+    fig.savefig(os.path.join(output_dir, 'age_groups.png'), dpi=100)
+    plt.close(fig)
+    print(f"✅ 9 histogram variants drawn from one set of counts → {output_dir}/")
+
+    print("\n⏱️ Streaming chunks: build the same counts without loading the whole file")
+    streamed = HistogramEngine('Age', low=0, high=80, fine_width=0.5, by=('Sex', 'Pclass', 'Survived'))
+    for chunk in pd.read_csv(data_path, chunksize=100, usecols=['Age', 'Sex', 'Pclass', 'Survived']):
+        streamed.update(chunk)
+    assert all(np.array_equal(streamed.counts[k], age_hist.counts[k]) for k in age_hist.counts)
+    print(f"   {streamed.rows_seen} rows streamed in chunks of 100 → identical counts")
+
+    print("\n⏱️ 12 variants on 5,000,000 rows: re-binning raw data vs derived counts")
+    rng = np.random.default_rng(1)
+    big_ages = pd.DataFrame({'Age': rng.gamma(6.0, 5.0, 5_000_000).clip(0, 79.9)})
+    variants = [5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55, 60]
+
+    start = time.time()
+    for bins in variants:
+        np.histogram(big_ages['Age'], bins=bins, range=(0, 80))
+    raw_time = time.time() - start
+
+    start = time.time()
+    big_hist = HistogramEngine.from_frame(big_ages, 'Age', low=0, high=80, fine_width=0.1)
+    for bins in variants:
+        big_hist.histogram(bins=bins)
+    engine_time = time.time() - start
+    print(f"   np.histogram per variant: {raw_time*1000:.1f}ms")
+    print(f"   engine (one pass + {len(variants)} rebins): {engine_time*1000:.1f}ms")
+
+    print("\n📚 Key Learning:")
+    print("• Bin the raw data once into narrow bins; coarser bins are sums of neighbours")
+    print("• Density and cumulative views are arithmetic on counts, not new passes")
+    print("• ax.stairs draws a histogram straight from (counts, edges)")
+    print("• Chunked updates give the same counts without holding all rows in memory")
@@ -0,0 +1,292 @@
+print("=== SORTED & BINNED INDEXES FOR RANGE QUERIES ===")
+print("Session 6: Answer range filters and top-k with searchsorted")
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+print("\n🎯 Goal: Sort each numeric column ONCE, then answer every range/top-k query by binary search")
+print("💡 Script 03 re-scans Age for every between() and re-sorts Fare for every ranking")
+
+# Load the raw Titanic data (kept next to the other CSV exports)
+data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'titanic_data.csv')
+titanic_df = pd.read_csv(data_path)
+print(f"\n✅ Loaded {titanic_df.shape[0]} passengers × {titanic_df.shape[1]} columns")
+
+
+print("\n📊 1. The SortedColumnIndex class")
+
+class SortedColumnIndex:
+    """Sorted-permutation index over one numeric column.
+
+    The column is argsorted once. Every query then becomes one or two
+    np.searchsorted calls on the sorted values, returning row positions
+    (usable with df.iloc / df.take). Missing values (NaN) are kept aside,
+    so they never match a range, like Series.between().
+
+    Appending rows merges the new (sorted) batch into the existing order
+    instead of re-sorting the whole column.
+    """
+
+    def __init__(self, values):
+        values = np.asarray(values, dtype=float)
+        missing = np.isnan(values)
+        rows = np.flatnonzero(~missing)
+        order = np.argsort(values[rows], kind='stable')
+        self.sorted_values = values[rows][order]
+        self.order = rows[order]
+        self.missing_rows = np.flatnonzero(missing)
+        self.n_rows = len(values)
+
+    def __len__(self):
+        return self.n_rows
+
+    # ---------- Range queries ----------
+
+    def _bounds(self, low, high, inclusive='both'):
+        """Return [start, stop) positions in sorted_values for low..high."""
+        left_side = 'left' if inclusive in ('both', 'left') else 'right'
+        right_side = 'right' if inclusive in ('both', 'right') else 'left'
+        start = 0 if low is None else np.searchsorted(self.sorted_values, low, side=left_side)
+        stop = len(self.sorted_values) if high is None else np.searchsorted(self.sorted_values, high, side=right_side)
+        return start, max(start, stop)
+
+    def between(self, low=None, high=None, inclusive='both'):
+        """Row positions with low <= value <= high (same semantics as Series.between)."""
+        start, stop = self._bounds(low, high, inclusive)
+        return np.sort(self.order[start:stop])
+
+    def count_between(self, low=None, high=None, inclusive='both'):
+        """Number of rows in the range, without materializing them."""
+        start, stop = self._bounds(low, high, inclusive)
+        return int(stop - start)
+
+    def greater_than(self, value):
+        return self.between(low=value, inclusive='right')
+
+    def less_than(self, value):
+        return self.between(high=value, inclusive='left')
+
+    # ---------- Ranking queries ----------
+
+    def top_k(self, k, largest=True):
+        """Row positions of the k largest (or smallest) values, best first."""
+        k = min(k, len(self.sorted_values))
+        if largest:
+            # Reverse the sorted order, keeping ties in original row order
+            stop = len(self.sorted_values)
+            tail_values = self.sorted_values[stop - k:]
+            tail_rows = self.order[stop - k:]
+            ranked = np.lexsort((tail_rows, -tail_values))
+            return tail_rows[ranked]
+        return self.order[:k]
+
+    def quantile(self, q):
+        """Linear-interpolated quantile read straight from the sorted values."""
+        values = self.sorted_values
+        position = q * (len(values) - 1)
+        lower = int(np.floor(position))
+        upper = min(lower + 1, len(values) - 1)
+        return float(values[lower] + (values[upper] - values[lower]) * (position - lower))
+
+    def bin_counts(self, edges):
+        """Counts per [edge_i, edge_i+1) bin using searchsorted on the edges."""
+        cuts = np.searchsorted(self.sorted_values, edges, side='left')
+        return np.diff(cuts)
+
+    # ---------- Incremental maintenance ----------
+
+    def append(self, new_values):
+        """Register rows appended to the end of the DataFrame.
+
+        The new batch is sorted on its own (m log m) and merged into the
+        existing order with searchsorted + np.insert (n + m), so the full
+        column is never re-sorted.
+        """
+        new_values = np.asarray(new_values, dtype=float)
+        new_rows = np.arange(self.n_rows, self.n_rows + len(new_values))
+        missing = np.isnan(new_values)
+        self.missing_rows = np.concatenate([self.missing_rows, new_rows[missing]])
+
+        batch_values = new_values[~missing]
+        batch_rows = new_rows[~missing]
+        batch_order = np.argsort(batch_values, kind='stable')
+        batch_values = batch_values[batch_order]
+        batch_rows = batch_rows[batch_order]
+
+        # side='right' keeps older rows ahead of newer ones on ties (stable)
+        positions = np.searchsorted(self.sorted_values, batch_values, side='right')
+        self.sorted_values = np.insert(self.sorted_values, positions, batch_values)
+        self.order = np.insert(self.order, positions, batch_rows)
+        self.n_rows += len(new_values)
+
+
+class PartitionedSortedIndex:
+    """One SortedColumnIndex per category value (e.g. a Fare index per Pclass).
+
+    Answers "sort by category, then by value" and per-category top-k
+    queries by concatenating the already-sorted partitions.
+    """
+
+    def __init__(self, groups, values):
+        groups = np.asarray(groups)
+        values = np.asarray(values, dtype=float)
+        self.partitions = {}
+        self.row_maps = {}
+        for group in np.unique(groups):
+            rows = np.flatnonzero(groups == group)
+            self.partitions[group] = SortedColumnIndex(values[rows])
+            self.row_maps[group] = rows
+        self.n_rows = len(values)
+
+    def sorted_rows(self, ascending_groups=True, ascending_values=True):
+        """Row positions ordered by group, then by value (NaN last in each group)."""
+        pieces = []
+        for group in sorted(self.partitions, reverse=not ascending_groups):
+            index = self.partitions[group]
+            if ascending_values:
+                local = index.order
+            else:
+                local = index.top_k(len(index.sorted_values), largest=True)
+            pieces.append(self.row_maps[group][local])
+            pieces.append(self.row_maps[group][index.missing_rows])
+        return np.concatenate(pieces)
+
+    def top_k(self, group, k, largest=True):
+        index = self.partitions[group]
+        return self.row_maps[group][index.top_k(k, largest=largest)]
+
+    def append(self, groups, values):
+        groups = np.asarray(groups)
+        values = np.asarray(values, dtype=float)
+        new_rows = np.arange(self.n_rows, self.n_rows + len(values))
+        for group in np.unique(groups):
+            mask = groups == group
+            if group not in self.partitions:
+                self.partitions[group] = SortedColumnIndex(values[mask])
+                self.row_maps[group] = new_rows[mask]
+            else:
+                self.partitions[group].append(values[mask])
+                self.row_maps[group] = np.concatenate([self.row_maps[group], new_rows[mask]])
+        self.n_rows += len(values)
+
+print("✅ SortedColumnIndex and PartitionedSortedIndex defined")
+
+
+print("\n📊 2. Building the indexes (one sort per column)")
+
+start = time.time()
+age_index = SortedColumnIndex(titanic_df['Age'])
+fare_index = SortedColumnIndex(titanic_df['Fare'])
+class_fare_index = PartitionedSortedIndex(titanic_df['Pclass'], titanic_df['Fare'])
+build_time = time.time() - start
+
+print(f"Indexed Age: {len(age_index.sorted_values)} values, {len(age_index.missing_rows)} missing")
+print(f"Indexed Fare: {len(fare_index.sorted_values)} values, {len(fare_index.missing_rows)} missing")
+print(f"Fare partitions by class: {sorted(class_fare_index.partitions)}")
+print(f"Build time: {build_time*1000:.3f}ms")
+
+
+print("\n📊 3. Range filters: Age.between() vs searchsorted")
+
+for low, high in [(0, 12), (18, 30), (30, 50), (60, 80)]:
+    pandas_rows = titanic_df.index[titanic_df['Age'].between(low, high)].to_numpy()
+    index_rows = age_index.between(low, high)
+    assert np.array_equal(pandas_rows, index_rows)
+    print(f"  Age {low:>2}-{high:<2}: {len(index_rows):>3} passengers (matches pandas ✅)")
+
+older = titanic_df.iloc[age_index.greater_than(30)]
+print(f"Passengers over 30: {len(older)} (pandas: {(titanic_df['Age'] > 30).sum()})")
+
+age_edges = [0, 12, 18, 35, 60, 81]
+age_labels = ['Child', 'Teen', 'Adult', 'Middle', 'Senior']
+print("\nAge bins counted from the index (no pd.cut needed):")
+for label, count in zip(age_labels, age_index.bin_counts(age_edges)):
+    print(f"  {label:<7}: {count}")
+
+
+print("\n📊 4. Fare percentile thresholds without re-sorting")
+
+for q in [0.25, 0.5, 0.75, 0.9]:
+    threshold = fare_index.quantile(q)
+    pandas_threshold = titanic_df['Fare'].quantile(q)
+    above = fare_index.count_between(low=threshold, inclusive='right')
+    print(f"  {int(q*100):>2}th percentile: £{threshold:7.2f} (pandas £{pandas_threshold:7.2f}) → {above} fares above")
+
+
+print("\n📊 5. Top-k and sort-by-class-then-fare")
+
+top_fares = titanic_df.iloc[fare_index.top_k(5)]
+print("Most expensive tickets (top 5):")
+print(top_fares[['Name', 'Fare', 'Pclass', 'Survived']])
+
+pandas_order = titanic_df.sort_values(by=['Pclass', 'Fare'], ascending=[True, False], kind='stable').index.to_numpy()
+index_order = class_fare_index.sorted_rows(ascending_groups=True, ascending_values=False)
+assert np.array_equal(pandas_order, index_order)
+print("\nSorted by class (1→3), then by highest fare within class (matches sort_values ✅):")
+print(titanic_df.iloc[index_order[:10]][['Name', 'Pclass', 'Fare', 'Survived']])
+
+print("\nCheapest 3 tickets in each class:")
+for pclass in sorted(class_fare_index.partitions):
+    rows = class_fare_index.top_k(pclass, 3, largest=False)
+    print(f"  Class {pclass}: {titanic_df['Fare'].iloc[rows].round(2).tolist()}")
+
+
+print("\n📊 6. Incremental maintenance when rows are appended")
+
+new_passengers = pd.DataFrame({
+    'PassengerId': [892, 893, 894, 895],
+    'Survived': [0, 1, 0, 1],
+    'Pclass': [3, 3, 2, 1],
+    'Name': ['Kelly, Mr. James', 'Wilkes, Mrs. James', 'Myles, Mr. Thomas', 'Astor, Mrs. Ava'],
+    'Sex': ['male', 'female', 'male', 'female'],
+    'Age': [34.5, 47.0, np.nan, 29.0],
+    'Fare': [7.83, 7.0, 9.69, 600.0],
+})
+titanic_df = pd.concat([titanic_df, new_passengers], ignore_index=True)
+age_index.append(new_passengers['Age'])
+fare_index.append(new_passengers['Fare'])
+class_fare_index.append(new_passengers['Pclass'], new_passengers['Fare'])
+
+assert np.array_equal(age_index.between(18, 30), titanic_df.index[titanic_df['Age'].between(18, 30)].to_numpy())
+pandas_order = titanic_df.sort_values(by=['Pclass', 'Fare'], ascending=[True, False], kind='stable').index.to_numpy()
+assert np.array_equal(class_fare_index.sorted_rows(ascending_values=False), pandas_order)
+print(f"Appended {len(new_passengers)} rows; indexes now cover {len(age_index)} rows (still match pandas ✅)")
+print(f"New most expensive ticket: {titanic_df['Name'].iloc[fare_index.top_k(1)[0]]}")
+
+
+print("\n📊 7. Performance comparison on a larger dataset")
+
+rng = np.random.default_rng(42)
+big_ages = pd.Series(rng.uniform(0, 80, 1_000_000))
+big_index = SortedColumnIndex(big_ages)
+ranges = [(low, low + 10) for low in range(0, 70, 5)]
+
+start = time.time()
+scan_counts = [int(big_ages.between(low, high).sum()) for low, high in ranges]
+scan_time = time.time() - start
+
+start = time.time()
+index_counts = [big_index.count_between(low, high) for low, high in ranges]
+index_time = time.time() - start
+
+assert scan_counts == index_counts
+print(f"{len(ranges)} range counts over 1,000,000 rows")
+print(f"Full scan with between(): {scan_time*1000:.2f}ms")
+print(f"searchsorted on index:    {index_time*1000:.3f}ms")
+
+start = time.time()
+big_index.append(rng.uniform(0, 80, 10_000))
+append_time = time.time() - start
+start = time.time()
+SortedColumnIndex(np.concatenate([big_ages.to_numpy(), rng.uniform(0, 80, 10_000)]))
+rebuild_time = time.time() - start
+print(f"Append 10,000 rows: merge {append_time*1000:.2f}ms vs full re-sort {rebuild_time*1000:.2f}ms")
+
+
+print("\n🎉 Key takeaways:")
+print("• Sort once, then every range/threshold/top-k query is a binary search")
+print("• Partition by a small category (Pclass) to answer 'sort by class, then fare'")
+print("• Appends merge a sorted batch in, so the index never needs a full rebuild")
@@ -0,0 +1,211 @@
+print("=== GROUP FEATURES WITH FACTORIZE + BINCOUNT ===")
+print("Session 7: Family/ticket group features without groupby + merge")
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+print("\n🎯 Goal: Factorize the group key ONCE, aggregate with np.bincount, scatter back by code")
+print("💡 Script 05 (LastName survival) and script 08 (Family_Name stats + merge) re-group and re-join every time")
+
+data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'titanic_data.csv')
+titanic_df = pd.read_csv(data_path)
+titanic_df['Family_Name'] = titanic_df['Name'].str.split(',').str[0].str.strip()
+print(f"\n✅ Loaded {titanic_df.shape[0]} passengers, {titanic_df['Family_Name'].nunique()} family names")
+
+
+print("\n📊 1. The GroupFeatureEngine class")
+
+class GroupFeatureEngine:
+    """Per-group aggregates computed from integer codes.
+
+    pd.factorize turns the key column into codes 0..n_groups-1 once.
+    Each aggregate is then a single np.bincount over those codes, and
+    broadcasting it back to the rows is plain fancy indexing
+    (aggregate[codes]) - no sort, no hash join, no merge.
+
+    Rows with a missing key get code -1 and receive NaN features.
+    """
+
+    def __init__(self, keys):
+        self.codes, self.uniques = pd.factorize(pd.Series(keys), sort=False)
+        self.n_groups = len(self.uniques)
+        self.valid = self.codes >= 0
+        self._valid_codes = self.codes[self.valid]
+        self._cache = {}
+
+    # ---------- Aggregates (one value per group) ----------
+
+    def _values(self, values):
+        values = np.asarray(values, dtype=float)[self.valid]
+        present = ~np.isnan(values)
+        return values, present
+
+    def size(self):
+        """Rows per group (the 'count' of groupby().size())."""
+        if 'size' not in self._cache:
+            self._cache['size'] = np.bincount(self._valid_codes, minlength=self.n_groups)
+        return self._cache['size']
+
+    def count(self, values):
+        """Non-missing values per group."""
+        _, present = self._values(values)
+        return np.bincount(self._valid_codes, weights=present, minlength=self.n_groups)
+
+    def sum(self, values):
+        values, present = self._values(values)
+        return np.bincount(self._valid_codes, weights=np.where(present, values, 0.0), minlength=self.n_groups)
+
+    def mean(self, values):
+        """Group mean skipping NaN, like groupby().mean()."""
+        values, present = self._values(values)
+        totals = np.bincount(self._valid_codes, weights=np.where(present, values, 0.0), minlength=self.n_groups)
+        counts = np.bincount(self._valid_codes, weights=present, minlength=self.n_groups)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return totals / counts
+
+    def mode(self, values):
+        """Most frequent value per group (smallest value wins ties, like Series.mode().iloc[0]).
+
+        Missing values are skipped (dropna=True); a group with no values gets NaN.
+        """
+        value_codes, value_uniques = pd.factorize(pd.Series(values)[self.valid], sort=True)
+        present = value_codes >= 0  # factorize gives NaN the code -1
+        n_values = len(value_uniques)
+        table = np.bincount(self._valid_codes[present] * n_values + value_codes[present],
+                            minlength=self.n_groups * n_values).reshape(self.n_groups, n_values)
+        uniques = np.asarray(value_uniques)
+        empty = table.sum(axis=1) == 0
+        if not empty.any():
+            return uniques[table.argmax(axis=1)]
+        out = np.full(self.n_groups, np.nan, dtype=float if uniques.dtype.kind in 'biuf' else object)
+        if n_values:
+            out[~empty] = uniques[table[~empty].argmax(axis=1)]
+        return out
+
+    # ---------- Scatter back to rows ----------
+
+    def scatter(self, aggregate):
+        """Broadcast a per-group array back to one value per row."""
+        aggregate = np.asarray(aggregate)
+        if self.valid.all():
+            return aggregate[self.codes]
+        out = np.full(len(self.codes), np.nan)
+        out[self.valid] = aggregate[self._valid_codes]
+        return out
+
+    def to_frame(self, **aggregates):
+        """Per-group table indexed by the original key values."""
+        return pd.DataFrame(aggregates, index=pd.Index(self.uniques, name='key'))
+
+print("✅ GroupFeatureEngine defined")
+
+
+print("\n📊 2. Family survival (script 05) without isin + groupby")
+
+family = GroupFeatureEngine(titanic_df['Family_Name'])
+family_size = family.size()
+family_survivors = family.sum(titanic_df['Survived'])
+family_rate = family.mean(titanic_df['Survived'])
+
+family_survival = family.to_frame(
+    Family_Size=family_size,
+    Survivors=family_survivors.astype(int),
+    Survival_Rate=family_rate,
+)
+family_survival = family_survival[family_survival['Family_Size'] >= 2]
+family_survival = family_survival.sort_values('Survival_Rate', ascending=False)
+print("Top 10 families by survival rate:")
+print(family_survival.head(10).round(3))
+
+# Same answer as the groupby version from script 05
+pandas_survival = titanic_df.groupby('Family_Name')['Survived'].agg(['count', 'sum', 'mean'])
+pandas_survival = pandas_survival[pandas_survival['count'] >= 2]
+check = family_survival.join(pandas_survival, how='inner')
+assert len(check) == len(pandas_survival)
+assert np.allclose(check['Survival_Rate'], check['mean'])
+print(f"✅ {len(check)} families match the groupby result")
+
+
+print("\n📊 3. Family statistics as row features (script 08) without merge")
+
+engine_features = pd.DataFrame({
+    'Family_Count': family.scatter(family_size),
+    'Family_Survived': family.scatter(family_survivors),
+    'Family_Survival_Rate': family.scatter(family_rate),
+    'Family_Avg_Fare': family.scatter(family.mean(titanic_df['Fare'])),
+    'Family_Class': family.scatter(family.mode(titanic_df['Pclass'])),
+}, index=titanic_df.index)
+
+# Reference: script 08's groupby + merge
+family_name_stats = titanic_df.groupby('Family_Name').agg({
+    'PassengerId': 'count',
+    'Survived': ['sum', 'mean'],
+    'Fare': 'mean',
+    'Pclass': lambda x: x.mode().iloc[0] if len(x.mode()) > 0 else x.iloc[0]
+})
+family_name_stats.columns = list(engine_features.columns)
+merged = titanic_df[['Family_Name']].merge(family_name_stats, left_on='Family_Name', right_index=True, how='left')
+assert np.allclose(merged[engine_features.columns].to_numpy(float), engine_features.to_numpy(float))
+print("✅ Scattered features equal the merged features row for row")
+
+titanic_df = titanic_df.join(engine_features)
+print(titanic_df[['Name', 'Family_Count', 'Family_Survival_Rate', 'Family_Avg_Fare', 'Family_Class']].head())
+
+
+print("\n📊 4. Ticket groups: one engine per key, reused for every feature")
+
+ticket = GroupFeatureEngine(titanic_df['Ticket'])
+titanic_df['Ticket_Group_Size'] = ticket.scatter(ticket.size())
+titanic_df['Fare_Per_Ticket_Member'] = titanic_df['Fare'] / titanic_df['Ticket_Group_Size']
+titanic_df['Ticket_Avg_Age'] = ticket.scatter(ticket.mean(titanic_df['Age']))
+print(f"Shared tickets: {(titanic_df['Ticket_Group_Size'] > 1).sum()} passengers")
+
+# Embarked has missing values: mode() skips them, and a ticket with none known gets NaN
+titanic_df['Ticket_Embarked'] = ticket.scatter(ticket.mode(titanic_df['Embarked']))
+pandas_embarked = titanic_df.groupby('Ticket')['Embarked'].agg(lambda x: x.mode().iloc[0] if x.notna().any() else np.nan)
+assert titanic_df['Ticket_Embarked'].equals(titanic_df['Ticket'].map(pandas_embarked).rename('Ticket_Embarked'))
+print(f"✅ Ticket_Embarked matches groupby mode ({titanic_df['Ticket_Embarked'].isna().sum()} passengers with no known port)")
+print(titanic_df[['Ticket', 'Ticket_Group_Size', 'Fare', 'Fare_Per_Ticket_Member', 'Ticket_Avg_Age']].head())
+
+
+print("\n📊 5. Performance: groupby + merge vs factorize + bincount")
+
+rng = np.random.default_rng(7)
+n_rows = 1_000_000
+big_df = pd.DataFrame({
+    'Family_Name': rng.integers(0, 100_000, n_rows).astype(str),
+    'Survived': rng.integers(0, 2, n_rows),
+    'Fare': rng.gamma(2.0, 15.0, n_rows),
+})
+
+start = time.time()
+stats = big_df.groupby('Family_Name').agg(
+    Family_Count=('Survived', 'size'),
+    Family_Survival_Rate=('Survived', 'mean'),
+    Family_Avg_Fare=('Fare', 'mean'),
+)
+merged_big = big_df.merge(stats, left_on='Family_Name', right_index=True, how='left')
+merge_time = time.time() - start
+
+start = time.time()
+big_engine = GroupFeatureEngine(big_df['Family_Name'])
+scattered_big = pd.DataFrame({
+    'Family_Count': big_engine.scatter(big_engine.size()),
+    'Family_Survival_Rate': big_engine.scatter(big_engine.mean(big_df['Survived'])),
+    'Family_Avg_Fare': big_engine.scatter(big_engine.mean(big_df['Fare'])),
+}, index=big_df.index)
+engine_time = time.time() - start
+
+assert np.allclose(merged_big['Family_Avg_Fare'], scattered_big['Family_Avg_Fare'])
+print(f"{n_rows:,} rows, {big_engine.n_groups:,} groups, 3 features")
+print(f"groupby + merge:        {merge_time*1000:.1f}ms")
+print(f"factorize + bincount:   {engine_time*1000:.1f}ms")
+
+
+print("\n🎉 Key takeaways:")
+print("• Factorize the key once; every aggregate is one bincount over the codes")
+print("• aggregate[codes] broadcasts group stats back to rows - no merge, no sort")
+print("• Keep one engine per key (family, ticket) and reuse it for every feature")
@@ -7,14 +7,33 @@ Users select length and inclusion of uppercase, digits, and symbols
 character from every enabled class and returns three passwords per run.
 
 Security notes:
-- Uses secrets.SystemRandom for OS-backed CSPRNG.
+- Uses secrets.token_bytes (OS-backed CSPRNG) with unbiased rejection
+  sampling for every character, position and class pick.
+- Bulk generation (generate_many) draws one block with secrets.token_bytes
+  and maps it onto the pool with unbiased rejection sampling.
 - Avoids the non-cryptographic random module for any selection or shuffle.
+- Parallel provisioning runs generate_many in worker processes; each one
+  reads its own OS CSPRNG (os.urandom), nothing is seeded or shared.
 """
 
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from itertools import combinations, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple, Union
+import argparse
+import hashlib
+import math
+import mmap
+import os
 import secrets
 import string
+import struct
+import sys
+import time
+
+# Bytes fetched from the OS CSPRNG per reservoir refill in generate_one().
+_RESERVOIR_BYTES = 4096
 
 
 @dataclass
@@ -54,6 +73,331 @@ class PasswordPolicy:
                 f"length must be >= {enabled_classes} to include one from each enabled class"
             )
 
+    def classes(self) -> Dict[str, str]:
+        """Enabled character classes as {name: characters}."""
+        flags = {
+            "lowercase": self.use_lowercase,
+            "uppercase": self.use_uppercase,
+            "digits": self.use_digits,
+            "symbols": self.use_symbols,
+        }
+        return {name: chars for name, chars in CHARACTER_CLASSES.items() if flags[name]}
+
+    def entropy_bits(self) -> float:
+        """Exact entropy in bits of a uniform draw from all passwords this policy allows."""
+        return EntropyEngine().bits(self)
+
+
+CHARACTER_CLASSES: Dict[str, str] = {
+    "lowercase": string.ascii_lowercase,
+    "uppercase": string.ascii_uppercase,
+    "digits": string.digits,
+    "symbols": string.punctuation,
+}
+
+
+@lru_cache(maxsize=None)
+def count_valid_passwords(class_sizes: Tuple[int, ...], length: int) -> int:
+    """Exact number of passwords with at least one character from every class.
+
+    Inclusion-exclusion over the classes: all strings over the pool, minus
+    those missing class i, plus those missing classes i and j, and so on:
+
+        N = sum over subsets S of (-1)^|S| * (pool - size(S)) ** length
+
+    Args:
+        class_sizes: Sizes of the enabled (disjoint) classes, sorted so that
+            equivalent policies share one cache entry.
+        length: Password length.
+    """
+    pool = sum(class_sizes)
+    total = 0
+    for r in range(len(class_sizes) + 1):
+        for missing in combinations(class_sizes, r):
+            total += (-1) ** r * (pool - sum(missing)) ** length
+    return total
+
+
+class EntropyEngine:
+    """Exact policy entropy and shortest-policy search.
+
+    Entropy is log2 of the number of valid passwords (count_valid_passwords,
+    memoized per class sizes and length). That is the entropy of
+    generate_many(), which draws uniformly from all valid passwords;
+    generate_one() forces one character per class and is slightly below it.
+    """
+
+    @staticmethod
+    def _sizes(classes: Iterable[str]) -> Tuple[int, ...]:
+        return tuple(sorted(len(CHARACTER_CLASSES[name]) for name in classes))
+
+    def count(self, policy: PasswordPolicy) -> int:
+        """Number of distinct passwords the policy allows (0 if infeasible)."""
+        sizes = self._sizes(policy.classes())
+        if not sizes or policy.length < len(sizes):
+            return 0
+        return count_valid_passwords(sizes, policy.length)
+
+    def bits(self, policy: PasswordPolicy) -> float:
+        """Exact entropy in bits (math.log2 is exact enough on Python's big ints)."""
+        n = self.count(policy)
+        return math.log2(n) if n else 0.0
+
+    def min_length(self, classes: Iterable[str], target_bits: float) -> int:
+        """Shortest length whose valid-password count reaches 2 ** target_bits.
+
+        The count grows with length, and pool ** length bounds it from
+        above, so the scan starts at ceil(target / log2(pool)) and usually
+        stops after one or two steps. Counts are compared in log space, so
+        any float target works (2 ** 1024 would overflow a float).
+        """
+        sizes = self._sizes(classes)
+        if not sizes:
+            raise ValueError("at least one character class is required")
+        length = max(len(sizes), math.ceil(target_bits / math.log2(sum(sizes))))
+        while math.log2(count_valid_passwords(sizes, length)) < target_bits:
+            length += 1
+        return length
+
+    def shortest_policy(
+        self,
+        target_bits: float,
+        require: Iterable[str] = ("lowercase",),
+        forbid: Iterable[str] = (),
+    ) -> PasswordPolicy:
+        """Find the shortest policy with at least target_bits of entropy.
+
+        Every combination of classes that includes `require` and avoids
+        `forbid` is tried; among those reaching the target at the minimal
+        length, the one with the most entropy wins.
+
+        Args:
+            target_bits: Required strength in bits (e.g. 80).
+            require: Class names every password must contain.
+            forbid: Class names that must not be used (e.g. "symbols" for
+                systems that reject punctuation).
+
+        Raises:
+            ValueError: If a class name is unknown, both required and forbidden,
+                or no combination is allowed.
+        """
+        require, forbid = set(require), set(forbid)
+        unknown = (require | forbid) - set(CHARACTER_CLASSES)
+        if unknown:
+            raise ValueError(f"unknown character class(es): {', '.join(sorted(unknown))}")
+        if require & forbid:
+            raise ValueError(f"class(es) both required and forbidden: {', '.join(sorted(require & forbid))}")
+        optional = [name for name in CHARACTER_CLASSES if name not in require | forbid]
+        best: Optional[Tuple[int, float, PasswordPolicy]] = None
+        for r in range(len(optional) + 1):
+            for extra in combinations(optional, r):
+                classes = require | set(extra)
+                if not classes:
+                    continue
+                length = self.min_length(classes, target_bits)
+                policy = PasswordPolicy(
+                    length=length,
+                    use_lowercase="lowercase" in classes,
+                    use_uppercase="uppercase" in classes,
+                    use_digits="digits" in classes,
+                    use_symbols="symbols" in classes,
+                )
+                bits = self.bits(policy)
+                if best is None or (length, -bits) < (best[0], -best[1]):
+                    best = (length, bits, policy)
+        if best is None:
+            raise ValueError("no character classes allowed")
+        return best[2]
+
+
+class BloomFilter:
+    """Bit array with k hash probes per item, stored in a memory-mapped file.
+
+    Membership costs k bit reads no matter how many items were added, and
+    only the touched pages are read from disk, so a filter built from a
+    500M-entry wordlist (~1.7 GB at a 1e-6 false-positive rate) is checked
+    without loading it into RAM. False positives are possible, false
+    negatives are not.
+
+    File layout: 32-byte header (magic, bits m, probes k, items added)
+    followed by m / 8 bytes of bits. Filters made with path=None live in an
+    anonymous mapping (used for per-batch deduplication).
+    """
+
+    MAGIC = b"PWBLOOM1"
+    HEADER = struct.Struct("<8sQQQ")
+
+    def __init__(self, mm: mmap.mmap, path: Optional[str] = None) -> None:
+        magic, self.bits, self.probes, self.count = self.HEADER.unpack_from(mm, 0)
+        if magic != self.MAGIC:
+            raise ValueError(f"{path or 'buffer'} is not a Bloom filter file")
+        self._mm = mm
+        self.path = path
+
+    @staticmethod
+    def size_for(capacity: int, fp_rate: float) -> Tuple[int, int]:
+        """Optimal (bits, probes) for capacity items at fp_rate."""
+        if not 0 < fp_rate < 1:
+            raise ValueError("fp_rate must be between 0 and 1")
+        capacity = max(capacity, 1)
+        bits = max(64, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        probes = max(1, round(bits / capacity * math.log(2)))
+        return bits, probes
+
+    @classmethod
+    def create(cls, capacity: int, fp_rate: float = 1e-6, path: Optional[str] = None) -> "BloomFilter":
+        """Empty writable filter for capacity items (in a file, or anonymous if path is None)."""
+        bits, probes = cls.size_for(capacity, fp_rate)
+        size = cls.HEADER.size + (bits + 7) // 8
+        if path is None:
+            mm = mmap.mmap(-1, size)
+        else:
+            with open(path, "w+b") as f:
+                f.truncate(size)  # Sparse zeros; pages are allocated as bits are set
+                mm = mmap.mmap(f.fileno(), size)
+        cls.HEADER.pack_into(mm, 0, cls.MAGIC, bits, probes, 0)
+        return cls(mm, path)
+
+    @classmethod
+    def open(cls, path: str) -> "BloomFilter":
+        """Map an existing filter file read-only."""
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mm, path)
+
+    @classmethod
+    def build(
+        cls, wordlist: str, path: str, fp_rate: float = 1e-6, capacity: Optional[int] = None
+    ) -> "BloomFilter":
+        """Build a filter file from a wordlist (one password per line), streaming.
+
+        The wordlist is read line by line in binary mode and never held in
+        memory. Without capacity, one extra pass counts the lines first.
+        """
+        if capacity is None:
+            with open(wordlist, "rb") as f:
+                capacity = sum(1 for _ in f)
+        bloom = cls.create(capacity, fp_rate, path)
+        with open(wordlist, "rb") as f:
+            for line in f:
+                word = line.rstrip(b"\r\n")
+                if word:
+                    bloom.add(word)
+        bloom.flush()
+        return bloom
+
+    def _hashes(self, item) -> Tuple[int, int]:
+        # Double hashing: probe i is bit (h1 + i * h2) % bits, from one 128-bit digest
+        if isinstance(item, str):
+            item = item.encode("utf-8")
+        digest = int.from_bytes(hashlib.blake2b(item, digest_size=16).digest(), "little")
+        return digest >> 64, (digest & 0xFFFFFFFFFFFFFFFF) | 1
+
+    def add(self, item) -> bool:
+        """Set item's bits; returns True if they were all set already (probably seen)."""
+        pos, step = self._hashes(item)
+        mm, offset, bits = self._mm, self.HEADER.size, self.bits
+        seen = True
+        for _ in range(self.probes):
+            pos %= bits
+            index = offset + (pos >> 3)
+            byte = mm[index]
+            mask = 1 << (pos & 7)
+            if not byte & mask:
+                mm[index] = byte | mask
+                seen = False
+            pos += step
+        if not seen:
+            self.count += 1
+        return seen
+
+    def __contains__(self, item) -> bool:
+        pos, step = self._hashes(item)
+        mm, offset, bits = self._mm, self.HEADER.size, self.bits
+        for _ in range(self.probes):
+            pos %= bits
+            if not mm[offset + (pos >> 3)] >> (pos & 7) & 1:
+                return False  # Usually after one or two probes for a non-member
+            pos += step
+        return True
+
+    def flush(self) -> None:
+        """Write the item count into the header and flush the mapping to disk."""
+        self.HEADER.pack_into(self._mm, 0, self.MAGIC, self.bits, self.probes, self.count)
+        if self.path is not None:
+            self._mm.flush()
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+class PasswordScreen:
+    """Optional screening stage for PasswordGenerator.
+
+    A password is rejected (and the generator draws another one) if it is
+    in the breached-password filter or, with unique=True, if it already
+    appeared in the current batch. Batch deduplication uses an in-memory
+    Bloom filter sized for the batch, so memory stays bounded; a false
+    positive discards a password that was not a repeat. When the batch
+    takes up a large share of all passwords the policy allows, an exact
+    set is used instead: there, false positives could reject the last
+    unseen passwords and the batch would never complete.
+
+    Args:
+        breached: Filter built from a breached-password list (see
+            BloomFilter.build), or None to skip that check.
+        unique: Reject repeats within a batch.
+        fp_rate: False-positive rate of the per-batch dedup filter. A false
+            positive only discards a good password, so a loose rate (fewer
+            probes per password) is the faster choice.
+    """
+
+    def __init__(
+        self, breached: Optional[BloomFilter] = None, unique: bool = True, fp_rate: float = 1e-3
+    ) -> None:
+        self.breached = breached
+        self.unique = unique
+        self.fp_rate = fp_rate
+        self.rejected = 0
+        self._seen: Optional[Union[BloomFilter, Set[str]]] = None
+
+    def start_batch(self, size: int, space: Optional[int] = None) -> None:
+        """Forget earlier passwords; the next size accepted ones will not repeat.
+
+        Args:
+            size: Passwords in the batch.
+            space: Number of distinct passwords the policy allows, if known.
+                Batches over half of it are deduplicated exactly.
+        """
+        if not self.unique:
+            self._seen = None
+        elif space is not None and 2 * size > space:
+            self._seen = set()
+        else:
+            self._seen = BloomFilter.create(size, self.fp_rate)
+
+    def is_breached(self, password: str) -> bool:
+        return self.breached is not None and password in self.breached
+
+    def accept(self, password: str) -> bool:
+        """True if the password passes; it then counts as seen in this batch."""
+        if self.is_breached(password) or self._repeated(password):
+            self.rejected += 1
+            return False
+        return True
+
+    def _repeated(self, password: str) -> bool:
+        # Record the password as seen; True if it (probably, for a Bloom filter) was already
+        seen = self._seen
+        if seen is None:
+            return False
+        if isinstance(seen, set):
+            if password in seen:
+                return True
+            seen.add(password)
+            return False
+        return seen.add(password)
+
 
 class PasswordGenerator:
     """Secure password generator enforcing a PasswordPolicy.
@@ -62,7 +406,7 @@ class PasswordGenerator:
       - Builds the allowed character pool from policy flags.
       - Ensures coverage: at least one char from each enabled class.
       - Fills remaining length from the whole pool.
-      - Shuffles positions via a cryptographically secure PRNG.
+      - Randomizes positions via a cryptographically secure PRNG.
 
     Example:
         policy = PasswordPolicy(length=14, use_uppercase=True, use_digits=True, use_symbols=True)
@@ -70,60 +414,177 @@ class PasswordGenerator:
         passwords = gen.generate_three()
     """
 
-    def __init__(self, policy: PasswordPolicy) -> None:
+    def __init__(self, policy: PasswordPolicy, screen: Optional[PasswordScreen] = None) -> None:
         """Initialize with a validated policy and prepare character sets.
 
         Args:
             policy: The generation policy to enforce.
+            screen: Optional screening stage (breach list, batch dedup).
 
         Raises:
             ValueError: If policy is invalid or no character classes are enabled.
         """
         self.policy = policy
         self.policy.validate()
+        self.screen = screen
 
-        # OS-backed CSPRNG for both choice and shuffle (security-critical).
-        self._rand = secrets.SystemRandom()
-
-        # Assemble per-class sets as strings; disable by emptying.
-        self._lower = string.ascii_lowercase if self.policy.use_lowercase else ""
-        self._upper = string.ascii_uppercase if self.policy.use_uppercase else ""
-        self._digits = string.digits if self.policy.use_digits else ""
-        self._symbols = string.punctuation if self.policy.use_symbols else ""
-
-        # Global pool for general draws.
-        self._pool = "".join([self._lower, self._upper, self._digits, self._symbols])
-        if not self._pool:
+        # Per-class character sets and the global pool, precompiled to bytes.
+        self._class_bytes = [chars.encode("ascii") for chars in self.policy.classes().values()]
+        pool = b"".join(self._class_bytes)
+        if not pool:
             raise ValueError("No character classes enabled")
+        self._pool = pool
+
+        # Byte -> pool char table for bulk draws. Bytes at or above the
+        # largest multiple of len(pool) are deleted instead of mapped, so the
+        # remaining ones cover every pool character equally often (no modulo bias).
+        limit = 256 - 256 % len(pool)
+        self._byte_table = bytes(pool[b % len(pool)] for b in range(256))
+        self._byte_reject = bytes(range(limit, 256))
+
+        # State for generate_one(): the password is written into a reused
+        # bytearray from two reservoirs refilled a block at a time, so the
+        # per-password work is slicing, a few byte lookups and one decode.
+        self._buf = bytearray(self.policy.length)
+        self._chars = b""  # pool characters, already mapped by translate()
+        self._chars_at = 0
+        self._spare = b""  # raw bytes for position and per-class picks
+        self._spare_at = 0
+
+    def _below(self, bound: int) -> int:
+        """Uniform int in [0, bound) from the spare-byte reservoir.
+
+        Bytes at or above the largest multiple of bound are skipped (no
+        modulo bias); bounds above 256 fall back to secrets.randbelow.
+        """
+        if bound > 256:
+            return secrets.randbelow(bound)
+        limit = 256 - 256 % bound
+        spare, at = self._spare, self._spare_at
+        while True:
+            if at == len(spare):
+                spare, at = secrets.token_bytes(_RESERVOIR_BYTES), 0
+                self._spare = spare
+            b = spare[at]
+            at += 1
+            if b < limit:
+                self._spare_at = at
+                return b % bound
 
     def generate_one(self) -> str:
         """Generate a single password satisfying the policy.
 
         Process:
-            1) One required character from each enabled class.
-            2) Remaining characters from the full pool.
-            3) Secure shuffle to randomize positions.
+            1) Fill the buffer with characters from the full pool.
+            2) Overwrite distinct random positions with one required
+               character from each enabled class.
+            3) Decode the buffer once.
+
+        Placing the required characters at uniformly chosen distinct
+        positions gives the same distribution as the classic "required +
+        tail, then shuffle" construction. Reuses internal buffers, so one
+        generator must not be shared between threads.
+
+        With a screen, passwords found in its breached-password filter are
+        replaced by fresh ones.
 
         Returns:
             A password of length == policy.length.
         """
-        required: List[str] = []
+        password = self._generate_one()
+        while self.screen is not None and self.screen.is_breached(password):
+            self.screen.rejected += 1
+            password = self._generate_one()
+        return password
+
+    def _generate_one(self) -> str:
+        length = self.policy.length
+        buf = self._buf
+        at = self._chars_at
+        if len(self._chars) - at < length:
+            fresh = secrets.token_bytes(max(_RESERVOIR_BYTES, 2 * length))
+            self._chars = self._chars[at:] + fresh.translate(self._byte_table, self._byte_reject)
+            at = 0
+            if len(self._chars) < length:  # Astronomically unlikely: short block
+                self._chars_at = at
+                return self._generate_one()
+        buf[:] = self._chars[at:at + length]
+        self._chars_at = at + length
+
+        taken = 0  # Bitmask of positions holding a required character
+        for chars in self._class_bytes:
+            pos = self._below(length)
+            while taken >> pos & 1:
+                pos = self._below(length)
+            taken |= 1 << pos
+            buf[pos] = chars[self._below(len(chars))]
+        return buf.decode("ascii")
+
+    def generate_many(self, n: int) -> List[str]:
+        """Generate n passwords from a few large CSPRNG draws.
+
+        Process:
+            1) secrets.token_bytes pulls one block of random bytes (one
+               syscall for many passwords instead of one per character).
+            2) bytes.translate maps the block onto the pool in C, deleting
+               bytes that would cause modulo bias (rejection sampling).
+            3) The character stream is cut into passwords; a password that
+               misses an enabled class is rejected and replaced from the
+               stream, until n passwords are collected.
+
+        Rejecting whole passwords (instead of forcing one character per
+        class and shuffling) yields a uniform draw from all passwords the
+        policy allows. With a screen, candidates it rejects (breached, or
+        repeated within this call) are replaced from the stream as well.
 
-        if self._lower:
-            required.append(self._rand.choice(self._lower))
-        if self._upper:
-            required.append(self._rand.choice(self._upper))
-        if self._digits:
-            required.append(self._rand.choice(self._digits))
-        if self._symbols:
-            required.append(self._rand.choice(self._symbols))
+        Args:
+            n: Number of passwords to generate (>= 0).
 
-        remaining = max(0, self.policy.length - len(required))
-        tail = [self._rand.choice(self._pool) for _ in range(remaining)]
+        Returns:
+            A list of n passwords, each of length == policy.length.
 
-        chars = required + tail
-        self._rand.shuffle(chars)  # secure, unbiased permutation
-        return "".join(chars)
+        Raises:
+            ValueError: If n is negative, or the screen requires unique
+                passwords and the policy allows fewer than n.
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        self._start_batch(n)
+        return self._fill(n)
+
+    def _start_batch(self, n: int) -> None:
+        if self.screen is None:
+            return
+        space = EntropyEngine().count(self.policy) if self.screen.unique else None
+        if space is not None and n > space:
+            raise ValueError(f"policy allows fewer than {n} distinct passwords")
+        self.screen.start_batch(n, space)
+
+    def _fill(self, n: int) -> List[str]:
+        """generate_many() without starting a new screening batch."""
+        screen = self.screen
+        length = self.policy.length
+        passwords: List[str] = []
+        yield_rate = 0.5  # Share of drawn bytes that end up in accepted passwords; refined per block
+        leftover = b""  # Tail of the previous block, too short for a password on its own
+        while len(passwords) < n:
+            needed = n - len(passwords)
+            block_size = min(1 << 20, int(needed * length / yield_rate) + length)  # Bounded memory
+            chars = leftover + secrets.token_bytes(block_size).translate(self._byte_table, self._byte_reject)
+            leftover = chars[len(chars) - len(chars) % length:]  # Passwords longer than a block span several
+            for start in range(0, len(chars) - length + 1, length):
+                candidate = chars[start:start + length]
+                # Deleting a class's bytes shortens the candidate iff it contains that class
+                if all(len(candidate.translate(None, cls)) < length for cls in self._class_bytes):
+                    password = candidate.decode("ascii")
+                    if screen is not None and not screen.accept(password):
+                        continue
+                    passwords.append(password)
+                    if len(passwords) == n:
+                        break
+            accepted = needed - (n - len(passwords))
+            yield_rate = max(accepted * length / block_size, 0.01)
+        return passwords
 
     def generate_three(self) -> List[str]:
         """Generate exactly three passwords.
@@ -131,7 +592,163 @@ class PasswordGenerator:
         Returns:
             A list with three independently generated passwords.
         """
-        return [self.generate_one() for _ in range(3)]
+        return self.generate_many(3)
+
+    # ---------- Provisioning (parallel, streaming) ----------
+
+    def _provision_blocks(
+        self, count: int, workers: Optional[int], chunk_size: int
+    ) -> Iterator[str]:
+        """Yield newline-joined blocks of passwords as workers finish them.
+
+        At most 2 * workers chunks are in flight, so memory stays bounded
+        by the chunk size no matter how large count is.
+
+        With a screen the whole run is one batch: workers screen against
+        the breached filter (they map the same file), and the parent drops
+        repeats across chunks and tops each block up in-process.
+        """
+        if count < 0:
+            raise ValueError("count must be non-negative")
+        sizes = iter([chunk_size] * (count // chunk_size) + ([count % chunk_size] if count % chunk_size else []))
+        workers = workers or os.cpu_count() or 1
+        self._start_batch(count)
+        if workers == 1 or count <= chunk_size:
+            for size in sizes:
+                yield "\n".join(self._fill(size))
+            return
+        breached = self.screen.breached.path if self.screen is not None and self.screen.breached else None
+        pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            pending = {
+                pool.submit(_generate_block, self.policy, size, breached) for size in islice(sizes, 2 * workers)
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield self._dedupe_block(future.result())
+                    size = next(sizes, None)
+                    if size:
+                        pending.add(pool.submit(_generate_block, self.policy, size, breached))
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _dedupe_block(self, block: str) -> str:
+        """Drop passwords already seen in this batch and top the block back up."""
+        screen = self.screen
+        if screen is None or not screen.unique:
+            return block
+        passwords = block.split("\n")
+        kept = [p for p in passwords if screen.accept(p)]
+        if len(kept) < len(passwords):
+            kept += self._fill(len(passwords) - len(kept))
+        return "\n".join(kept)
+
+    def provision(
+        self, count: int, workers: Optional[int] = None, chunk_size: int = 50_000
+    ) -> Iterator[str]:
+        """Stream count passwords generated across a process pool.
+
+        A generator, not a list: passwords are yielded as worker chunks
+        complete (in completion order), so callers can write them out in
+        bounded memory.
+
+        Args:
+            count: Total number of passwords.
+            workers: Worker processes (default: CPU count; 1 = in-process).
+            chunk_size: Passwords generated per worker task.
+        """
+        for block in self._provision_blocks(count, workers, chunk_size):
+            yield from block.split("\n")
+
+    def provision_to(
+        self,
+        out: TextIO,
+        count: int,
+        workers: Optional[int] = None,
+        chunk_size: int = 50_000,
+    ) -> "ProvisionReport":
+        """Write count passwords to out (one per line) and report throughput.
+
+        Whole worker blocks are written at once, so the parent process only
+        copies text; generation happens in the workers.
+
+        Returns:
+            A ProvisionReport with count, elapsed seconds and passwords/sec.
+        """
+        start = time.perf_counter()
+        for block in self._provision_blocks(count, workers, chunk_size):
+            out.write(block)
+            out.write("\n")
+        out.flush()
+        return ProvisionReport(count=count, seconds=time.perf_counter() - start)
+
+
+@dataclass
+class ProvisionReport:
+    """Throughput of one provisioning run."""
+    count: int
+    seconds: float
+
+    @property
+    def per_second(self) -> float:
+        return self.count / self.seconds if self.seconds > 0 else float("inf")
+
+    def __str__(self) -> str:
+        return f"{self.count:,} passwords in {self.seconds:.2f}s ({self.per_second:,.0f} passwords/sec)"
+
+
+def _generate_one_lists(rand: secrets.SystemRandom, policy: PasswordPolicy) -> str:
+    """The original generate_one(): lists of 1-char strings, shuffle, join.
+
+    Kept only as the baseline for benchmark_generate_one().
+    """
+    classes = list(policy.classes().values())
+    pool = "".join(classes)
+    required: List[str] = [rand.choice(chars) for chars in classes]
+    tail = [rand.choice(pool) for _ in range(max(0, policy.length - len(required)))]
+    chars = required + tail
+    rand.shuffle(chars)
+    return "".join(chars)
+
+
+def benchmark_generate_one(policy: PasswordPolicy, n: int = 100_000) -> Dict[str, float]:
+    """Time n calls of the list-based baseline and of generate_one().
+
+    Returns:
+        Passwords per second for "lists" and "bytes", plus their "speedup".
+    """
+    rand = secrets.SystemRandom()
+    start = time.perf_counter()
+    for _ in range(n):
+        _generate_one_lists(rand, policy)
+    lists = n / (time.perf_counter() - start)
+
+    gen = PasswordGenerator(policy)
+    generate_one = gen.generate_one
+    start = time.perf_counter()
+    for _ in range(n):
+        generate_one()
+    table = n / (time.perf_counter() - start)
+    return {"lists": lists, "bytes": table, "speedup": table / lists}
+
+
+# Breached-password filters already mapped in this (worker) process, by path.
+_open_filters: Dict[str, BloomFilter] = {}
+
+
+def _generate_block(policy: PasswordPolicy, n: int, breached: Optional[str] = None) -> str:
+    """Worker process: generate n passwords with this process's CSPRNG, newline-joined.
+
+    With breached (a filter file path), passwords on the breach list are
+    replaced; deduplication across blocks is left to the parent.
+    """
+    screen = None
+    if breached is not None:
+        if breached not in _open_filters:
+            _open_filters[breached] = BloomFilter.open(breached)
+        screen = PasswordScreen(_open_filters[breached], unique=False)
+    return "\n".join(PasswordGenerator(policy, screen).generate_many(n))
 
 
 def _prompt_bool(msg: str, default: bool) -> bool:
@@ -174,8 +791,96 @@ def _prompt_int(msg: str, default: int) -> int:
         return default
 
 
+def _policy_from_args(args: argparse.Namespace) -> PasswordPolicy:
+    return PasswordPolicy(
+        length=args.length,
+        use_lowercase=True,
+        use_uppercase=not args.no_upper,
+        use_digits=not args.no_digits,
+        use_symbols=not args.no_symbols,
+    )
+
+
+def benchmark_main(args: argparse.Namespace) -> None:
+    """Print generate_one() throughput against the list-based baseline."""
+    try:
+        result = benchmark_generate_one(_policy_from_args(args), args.benchmark)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return
+    print(f"generate_one x {args.benchmark:,} (length {args.length})")
+    print(f"  lists + shuffle + join: {result['lists']:12,.0f} passwords/sec")
+    print(f"  bytes tables + buffer:  {result['bytes']:12,.0f} passwords/sec")
+    print(f"  speedup: {result['speedup']:.1f}x")
+
+
+def _screen_from_args(args: argparse.Namespace) -> Optional[PasswordScreen]:
+    if args.breached is None and not args.unique:
+        return None
+    breached = BloomFilter.open(args.breached) if args.breached else None
+    return PasswordScreen(breached, unique=args.unique)
+
+
+def build_filter_main(args: argparse.Namespace) -> None:
+    """Build a breached-password Bloom filter file from a wordlist."""
+    wordlist, path = args.build_filter
+    start = time.perf_counter()
+    try:
+        bloom = BloomFilter.build(wordlist, path, fp_rate=args.fp_rate)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return
+    print(
+        f"{bloom.count:,} entries -> {path} ({os.path.getsize(path) / 2**20:,.1f} MiB, "
+        f"{bloom.probes} probes, fp rate {args.fp_rate:g}) in {time.perf_counter() - start:.1f}s"
+    )
+    bloom.close()
+
+
+def provision_main(args: argparse.Namespace) -> None:
+    """Non-interactive provisioning: stream passwords to a file or stdout."""
+    policy = _policy_from_args(args)
+    try:
+        gen = PasswordGenerator(policy, _screen_from_args(args))
+        if args.out:
+            with open(args.out, "w", encoding="ascii") as f:
+                report = gen.provision_to(f, args.provision, workers=args.workers)
+        else:
+            report = gen.provision_to(sys.stdout, args.provision, workers=args.workers)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return
+    print(report, file=sys.stderr)  # stderr keeps stdout clean for the passwords
+
+
 def main() -> None:
-    """Interactive entry point."""
+    """Interactive entry point (or provisioning mode with --provision)."""
+    parser = argparse.ArgumentParser(description="Secure Password Generator (OOP, secrets)")
+    parser.add_argument("--provision", type=int, metavar="N", help="generate N passwords non-interactively")
+    parser.add_argument("--benchmark", type=int, metavar="N", help="time N generate_one() calls against the old path")
+    parser.add_argument("--length", type=int, default=16, help="password length for --provision/--benchmark (default: 16)")
+    parser.add_argument("--no-upper", action="store_true", help="exclude uppercase letters")
+    parser.add_argument("--no-digits", action="store_true", help="exclude digits")
+    parser.add_argument("--no-symbols", action="store_true", help="exclude symbols")
+    parser.add_argument("--out", help="output file (default: stdout)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--breached", metavar="FILTER", help="reject passwords found in this Bloom filter file")
+    parser.add_argument("--unique", action="store_true", help="never repeat a password within the run")
+    parser.add_argument(
+        "--build-filter", nargs=2, metavar=("WORDLIST", "FILTER"), help="build a breached-password filter and exit"
+    )
+    parser.add_argument("--fp-rate", type=float, default=1e-6, help="false-positive rate for --build-filter (default: 1e-6)")
+    args = parser.parse_args()
+    if args.build_filter is not None:
+        build_filter_main(args)
+        return
+    if args.benchmark is not None:
+        benchmark_main(args)
+        return
+    if args.provision is not None:
+        provision_main(args)
+        return
+
     print("Secure Password Generator (OOP, secrets)")
 
     length = _prompt_int("Password length", 12)
@@ -192,11 +897,12 @@ def main() -> None:
     )
 
     try:
-        gen = PasswordGenerator(policy)
+        gen = PasswordGenerator(policy, _screen_from_args(args))
         pwds = gen.generate_three()
         print("\nGenerated passwords:")
         for i, p in enumerate(pwds, start=1):
             print(f"{i}. {p}")
+        print(f"Policy strength: {policy.entropy_bits():.1f} bits of entropy")
     except ValueError as e:
         print(f"Error: {e}")
 
@@ -0,0 +1,30 @@
+"""
+Tests for main.py.
+
+Run from this folder:
+    python -m unittest test_main
+"""
+
+import unittest
+
+from main import EntropyEngine, PasswordGenerator, PasswordPolicy, PasswordScreen
+
+PIN = PasswordPolicy(length=3, use_lowercase=False, use_uppercase=False, use_digits=True, use_symbols=False)
+
+
+class UniqueBatchTests(unittest.TestCase):
+    """With unique=True a batch may use up every password the policy allows."""
+
+    def test_batch_of_every_password(self) -> None:
+        count = EntropyEngine().count(PIN)
+        passwords = PasswordGenerator(PIN, PasswordScreen(unique=True)).generate_many(count)
+        self.assertEqual(sorted(passwords), [f"{i:03d}" for i in range(count)])
+
+    def test_batch_larger_than_policy(self) -> None:
+        gen = PasswordGenerator(PIN, PasswordScreen(unique=True))
+        with self.assertRaises(ValueError):
+            gen.generate_many(EntropyEngine().count(PIN) + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
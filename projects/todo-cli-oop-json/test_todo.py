@@ -0,0 +1,131 @@
+"""
+Multi-process tests for todo.py.
+
+Run from this folder:
+    python -m unittest test_todo
+"""
+
+from pathlib import Path
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from todo import JournalStorage, JsonStorage, SQLiteStorage, ToDoList
+
+HERE = Path(__file__).resolve().parent
+PROMPT = b"Enter your choice (1-10): "
+BACKENDS = {"json": JsonStorage, "journal": JournalStorage, "sqlite": SQLiteStorage}
+
+
+def open_cli(storage: str, data_file: Path) -> subprocess.Popen:
+    """Start todo.py as its own process, reading menu choices from a pipe."""
+    return subprocess.Popen(
+        [sys.executable, "-u", str(HERE / "todo.py"), "--storage", storage, "--file", str(data_file),
+         "--commit-window", "0"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, cwd=HERE,
+    )
+
+
+def wait_for_prompt(proc: subprocess.Popen) -> bytes:
+    """Read the CLI's output until it asks for the next menu choice."""
+    out = b""
+    while not out.endswith(PROMPT):
+        chunk = os.read(proc.stdout.fileno(), 4096)
+        if not chunk:
+            raise AssertionError(f"todo.py exited early:\n{out.decode('utf-8', 'replace')}")
+        out += chunk
+    return out
+
+
+def run_cli(storage: str, data_file: Path, keys: str) -> None:
+    """Run a whole CLI session (keys must end with the Exit choice)."""
+    result = subprocess.run(
+        [sys.executable, str(HERE / "todo.py"), "--storage", storage, "--file", str(data_file),
+         "--commit-window", "0"],
+        input=keys.encode("utf-8"), capture_output=True, cwd=HERE, timeout=60,
+    )
+    assert result.returncode == 0, result.stdout.decode("utf-8", "replace")
+
+
+class TwoProcessTests(unittest.TestCase):
+    """Process A loads the list, process B changes it, then A exits or saves."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+        self.addCleanup(self._tmp.cleanup)
+
+    def _seed(self, storage: str) -> Path:
+        folder = Path(tempfile.mkdtemp(prefix=storage, dir=self.dir))
+        data_file = folder / ("tasks.db" if storage == "sqlite" else "tasks.json")
+        todo = ToDoList(storage=BACKENDS[storage](data_file))
+        todo.add_many(["A1", "A2"])
+        todo.close()
+        return data_file
+
+    def _tasks(self, storage: str, data_file: Path):
+        todo = ToDoList(storage=BACKENDS[storage](data_file))
+        try:
+            return [(t.description, t.completed) for t in todo.list()]
+        finally:
+            todo.close()
+
+    def test_cli_exit_keeps_other_process_writes(self) -> None:
+        for storage in BACKENDS:
+            with self.subTest(storage=storage):
+                data_file = self._seed(storage)
+                a = open_cli(storage, data_file)
+                try:
+                    wait_for_prompt(a)  # A has loaded A1, A2
+                    run_cli(storage, data_file, "1\nB3\n3\n1\n10\n")  # B adds B3, toggles task 1
+                    a.stdin.write(b"10\n")
+                    a.stdin.close()
+                    self.assertEqual(a.wait(timeout=60), 0)
+                finally:
+                    a.stdout.close()
+                    if a.poll() is None:
+                        a.kill()
+                self.assertEqual(
+                    self._tasks(storage, data_file), [("A1", True), ("A2", False), ("B3", False)]
+                )
+
+    def test_save_reloads_before_writing(self) -> None:
+        for storage in BACKENDS:
+            with self.subTest(storage=storage):
+                data_file = self._seed(storage)
+                a = ToDoList(storage=BACKENDS[storage](data_file))
+                run_cli(storage, data_file, "1\nB3\n3\n2\n10\n")
+                a.save()
+                a.close()
+                self.assertEqual(
+                    self._tasks(storage, data_file), [("A1", False), ("A2", True), ("B3", False)]
+                )
+
+
+class SearchTests(unittest.TestCase):
+    """filter() gives the same answers on every backend, for any Unicode text."""
+
+    TASKS = ["Straße fegen", "STRASSE messen", "École", "ÉCOLE privée", "ΣΊΣΥΦΟΣ", "Buy milk", "ﬁle taxes"]
+    KEYWORDS = ["strasse", "STRASSE", "straße", "ss", "école", "ÉCO", "σίσυφος", "σ", "file", "milk", "xyz"]
+
+    def test_backends_agree(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            results = {}
+            for storage, backend in BACKENDS.items():
+                todo = ToDoList(storage=backend(Path(tmp) / storage))
+                todo.add_many(self.TASKS)
+                todo.toggle(2)
+                results[storage] = [
+                    [t.description for t in todo.filter(keyword, completed)]
+                    for keyword in self.KEYWORDS for completed in (None, True, False)
+                ]
+                todo.close()
+        self.assertEqual(results["json"][0], ["Straße fegen", "STRASSE messen"])
+        self.assertEqual(results["journal"], results["json"])
+        self.assertEqual(results["sqlite"], results["json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
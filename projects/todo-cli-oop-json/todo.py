@@ -3,29 +3,56 @@ To-Do List (OOP) with JSON persistence and undo.
 
 Features:
 - Task model (description, completed)
-- ToDoList manager (CRUD, search/filter, undo via in-memory snapshots)
+- ToDoList manager (CRUD, search/filter, bounded undo/redo via inverse ops)
+- Batch API (with todo.batch(), add_many/toggle_many/delete_many): one undo
+  entry and one storage write for many changes, rolled back on error
 - JSON storage (tasks.json) with UTF-8 reading/writing
+- Optional journaled storage (tasks.json + tasks.json.journal) for large lists
+- Optional SQLite storage (tasks.db) with FTS5 keyword search for huge lists
 - Minimal CLI for interactive use
 
 Design notes:
-- Snapshots use deepcopy to guarantee undo restores object identity/values.
-- File is rewritten atomically per save to maintain a single source of truth.
+- Undo stores the inverse op of each change (e.g. "re-insert task X at i")
+  in a bounded deque, so history costs O(change), not O(list) per step.
+- File is rewritten atomically per save (temp file + fsync + os.replace +
+  directory fsync), so a crash leaves either the old or the new file. An
+  optional group-commit window coalesces bursts into one durable write.
+- Every mutation is described by a small JSON-friendly "op" dict, applied by
+  apply_op(); the journal backend appends those ops instead of rewriting.
+- Search uses an inverted trigram index kept up to date on every op and
+  built a step per search, so selective filter() calls cost O(matches);
+  short or very common keywords use a plain scan.
 """
 
+from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, List
-import copy
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+from itertools import compress
+from typing import Callable, Deque, Dict, Iterable, Iterator, Optional, List, Set, Tuple, Union
+import argparse
 import json
+import os
+import sqlite3
+import sys
+import threading
+
+try:
+    import fcntl  # POSIX file locking for multi-process access
+except ImportError:  # Windows: locking degrades to in-process only
+    fcntl = None
 
 
 # -------------------------
 # Domain Model
 # -------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Task:
-    """A single to-do item.
+    """A single to-do item (slotted: no per-instance __dict__).
 
     Attributes:
         description: Human-readable task text (non-empty when persisted).
@@ -61,93 +88,1446 @@ class Task:
         return Task(desc, comp)
 
 
-# -------------------------
-# Application Model (Manager)
-# -------------------------
+class TaskView(Sequence):
+    """Read-only lazy view of selected positions of a task container.
 
-class ToDoList:
-    """Manage a collection of Task objects with JSON persistence and undo."""
+    Task objects are materialized one at a time on access, so listing or
+    filtering a large store does not build a list of Task copies. A view
+    reflects the container until its next mutation.
+    """
 
-    def __init__(self, data_file: Path = Path("tasks.json")) -> None:
-        """Initialize the manager and eagerly load from disk if present.
+    __slots__ = ("_tasks", "_positions")
+
+    def __init__(self, tasks, positions: Sequence[int]) -> None:
+        self._tasks = tasks
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return TaskView(self._tasks, self._positions[i])
+        return self._tasks[self._positions[i]]
+
+    def __iter__(self) -> Iterator[Task]:
+        return (self._tasks[p] for p in self._positions)
+
+
+class BitArray:
+    """Growable packed array of 0/1 flags, 8 per byte, with list-style insert/delete.
+
+    Single flags are read and written with O(1) bit operations. Inserting
+    or deleting shifts only the bytes after the position, through one
+    big-int shift. Whole-array conversions (popcount, one byte per flag
+    for itertools.compress) run in C via int.from_bytes/format, with no
+    Python loop per flag. Bits past the last flag are always zero.
+    """
+
+    __slots__ = ("_bytes", "_len")
+
+    _TO_FLAGS = bytes.maketrans(b"01", b"\x00\x01")
+    _TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+    def __init__(self, flags: bytes = b"") -> None:
+        """Pack flags given as one 0/1 byte each."""
+        self._len = len(flags)
+        self._bytes = bytearray()
+        if flags:
+            value = int(bytes(flags).translate(self._TO_DIGITS)[::-1], 2)
+            self._bytes += value.to_bytes((self._len + 7) // 8, "little")
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _check(self, i: int) -> int:
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("bit index out of range")
+        return i
+
+    def __getitem__(self, i: int) -> int:
+        if not 0 <= i < self._len:
+            i = self._check(i)
+        return (self._bytes[i >> 3] >> (i & 7)) & 1
+
+    def __setitem__(self, i: int, value: bool) -> None:
+        i = self._check(i)
+        if value:
+            self._bytes[i >> 3] |= 1 << (i & 7)
+        else:
+            self._bytes[i >> 3] &= ~(1 << (i & 7)) & 0xFF
+
+    def insert(self, i: int, value: bool) -> None:
+        i = max(0, min(i, self._len))
+        if self._len == len(self._bytes) * 8:
+            self._bytes.append(0)
+        if i == self._len:  # Append: no bits to shift
+            self._len += 1
+            if value:
+                self._bytes[i >> 3] |= 1 << (i & 7)
+            return
+        start, bit = i >> 3, i & 7
+        tail = int.from_bytes(self._bytes[start:], "little")
+        low = tail & ((1 << bit) - 1)
+        tail = ((tail >> bit) << (bit + 1)) | (bool(value) << bit) | low
+        self._bytes[start:] = tail.to_bytes(len(self._bytes) - start, "little")
+        self._len += 1
+
+    def __delitem__(self, i: int) -> None:
+        i = self._check(i)
+        start, bit = i >> 3, i & 7
+        tail = int.from_bytes(self._bytes[start:], "little")
+        low = tail & ((1 << bit) - 1)
+        tail = ((tail >> (bit + 1)) << bit) | low
+        self._bytes[start:] = tail.to_bytes(len(self._bytes) - start, "little")
+        self._len -= 1
+        del self._bytes[(self._len + 7) // 8:]
+
+    def count(self) -> int:
+        """Number of set flags."""
+        return int.from_bytes(self._bytes, "little").bit_count()
+
+    def flags(self) -> bytes:
+        """One 0/1 byte per flag (for compress() and bytes.translate)."""
+        if not self._len:
+            return b""
+        digits = format(int.from_bytes(self._bytes, "little"), f"0{self._len}b")
+        return digits[::-1].encode("ascii").translate(self._TO_FLAGS)
+
+
+class TaskStore:
+    """Columnar in-memory task container used by the JSON/journal backends.
+
+    Tasks are stored as columns rather than one object each:
+
+    - descriptions: a list of interned strings (repeated texts share memory)
+    - completed: a BitArray, one bit per task
+    - order keys: an array('q') of gapped integer keys, ascending = list order
+
+    Task objects are only created when read (store[i], iteration, views).
+    Bulk deletes such as clear_completed compact all three columns in one
+    pass with itertools.compress over a keep mask.
+
+    It also keeps an inverted index for filter(): postings map each
+    3-character substring ("trigram") of the normalized description to a
+    sorted array('q') of the order keys of tasks containing it. Keys do not
+    shift on insert/delete, so every mutation updates only the changed
+    task's postings, and a matching key maps back to a position by
+    bisection. The index grows incrementally: each search indexes up to
+    INDEX_STEP more tasks (in list order), and tasks not indexed yet are
+    scanned, so no single search pays for the whole list. Keywords shorter
+    than a trigram, and trigrams present in more than DENSE of all tasks,
+    are answered by a scan, which is faster there. SQLiteTaskList
+    implements the same methods on disk.
+    """
+
+    GAP = 1 << 20
+    GRAM = 3
+    INDEX_STEP = 1024
+    DENSE = 0.25
+    _ALL = (1 << 63) - 1  # _indexed_below once every task is indexed
+    _FLIP = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+
+    def __init__(self, tasks: Iterable[Task] = ()) -> None:
+        self._desc: List[str] = []
+        self._done = BitArray()
+        self._keys = array("q")
+        self._postings: Dict[str, array] = {}
+        self._indexed_below: Optional[int] = None  # tasks with smaller keys are indexed
+        for task in tasks:
+            self.append(task)
+
+    @staticmethod
+    def _norm(s: str) -> str:
+        return s.strip().casefold()
+
+    @staticmethod
+    def _norm_all(descriptions: Iterable[str]) -> Iterator[str]:
+        """_norm() over many descriptions, without a Python call per item."""
+        return map(str.casefold, map(str.strip, descriptions))
+
+    @classmethod
+    def _grams(cls, description: str) -> Set[str]:
+        text = cls._norm(description)
+        return {text[i:i + cls.GRAM] for i in range(len(text) - cls.GRAM + 1)}
+
+    # ---------- Index maintenance ----------
+
+    def _indexed(self, key: int) -> bool:
+        return self._indexed_below is not None and key < self._indexed_below
+
+    def _index_add(self, key: int, description: str) -> None:
+        if not self._indexed(key):
+            return  # Picked up when the index grows past it
+        for gram in self._grams(description):
+            postings = self._postings.get(gram)
+            if postings is None:
+                self._postings[gram] = array("q", (key,))
+            else:
+                postings.insert(bisect_left(postings, key), key)
+
+    def _index_remove(self, key: int, description: str) -> None:
+        self._index_remove_many([key], [description])
+
+    def _index_remove_many(self, keys: List[int], descriptions: List[str]) -> None:
+        """Drop many tasks from the postings, computing grams once per distinct description."""
+        by_gram = self._keys_by_gram((k, d) for k, d in zip(keys, descriptions) if self._indexed(k))
+        for gram, gram_keys in by_gram.items():
+            postings = self._postings[gram]
+            if len(gram_keys) == len(postings):
+                del self._postings[gram]
+            elif len(gram_keys) <= 8:
+                for key in gram_keys:
+                    del postings[bisect_left(postings, key)]
+            else:
+                drop = set(gram_keys)
+                self._postings[gram] = array("q", (k for k in postings if k not in drop))
+
+    def _keys_by_gram(self, rows: Iterable[Tuple[int, str]]) -> Dict[str, List[int]]:
+        """gram -> keys of the given (key, description) rows (grams computed once per text)."""
+        by_desc: Dict[str, List[int]] = {}
+        for key, description in rows:
+            by_desc.setdefault(description, []).append(key)
+        by_gram: Dict[str, List[int]] = {}
+        for description, desc_keys in by_desc.items():
+            for gram in self._grams(description):
+                keys = by_gram.get(gram)
+                if keys is None:
+                    by_gram[gram] = list(desc_keys)
+                else:
+                    keys.extend(desc_keys)
+        return by_gram
+
+    def _grow_index(self, limit: int) -> int:
+        """Index up to limit more tasks; return the position of the first unindexed task.
+
+        Tasks are indexed in list order, so the unindexed ones are always a
+        suffix of the list and their keys exceed every indexed key: new keys
+        are appended to the postings without re-sorting.
+        """
+        n = len(self._keys)
+        start = 0 if self._indexed_below is None else bisect_left(self._keys, self._indexed_below)
+        if start == n:
+            self._indexed_below = self._ALL
+            return n
+        stop = min(n, start + limit)
+        by_gram = self._keys_by_gram(zip(self._keys[start:stop], self._desc[start:stop]))
+        for gram, gram_keys in by_gram.items():
+            gram_keys.sort()  # Duplicate texts are grouped, so restore list order
+            postings = self._postings.get(gram)
+            if postings is None:
+                self._postings[gram] = array("q", gram_keys)
+            else:
+                postings.extend(gram_keys)
+        self._indexed_below = self._keys[stop] if stop < n else self._ALL
+        return stop
+
+    def _key_at(self, i: int) -> int:
+        """Order key for a new task placed at position i (renumbers if the gap is exhausted)."""
+        n = len(self._keys)
+        if n == 0:
+            return self.GAP
+        if i >= n:
+            return self._keys[-1] + self.GAP
+        if i == 0:
+            return self._keys[0] - self.GAP
+        lo, hi = self._keys[i - 1], self._keys[i]
+        mid = (lo + hi) // 2
+        if lo < mid < hi:
+            return mid
+        self._renumber()
+        return (self._keys[i - 1] + self._keys[i]) // 2
+
+    def _renumber(self) -> None:
+        """Respace every key by GAP and restart the index (rare)."""
+        self._keys = array("q", ((k + 1) * self.GAP for k in range(len(self._desc))))
+        self._postings = {}
+        self._indexed_below = None
+
+    # ---------- Sequence protocol ----------
+
+    def __len__(self) -> int:
+        return len(self._desc)
+
+    def __iter__(self) -> Iterator[Task]:
+        return (Task(d, bool(c)) for d, c in zip(self._desc, self._done.flags()))
+
+    def __getitem__(self, i: int) -> Task:
+        return Task(self._desc[i], bool(self._done[i]))
+
+    def __setitem__(self, i: int, task: Task) -> None:
+        old = self._desc[i]
+        if old != task.description:
+            key = self._keys[i]
+            self._index_remove(key, old)
+            self._index_add(key, task.description)
+            self._desc[i] = sys.intern(task.description)
+        self._done[i] = task.completed
+
+    def insert(self, i: int, task: Task) -> None:
+        i = max(0, min(i, len(self._desc)))
+        key = self._key_at(i)
+        self._keys.insert(i, key)
+        self._desc.insert(i, sys.intern(task.description))
+        self._done.insert(i, task.completed)
+        self._index_add(key, task.description)
+
+    def append(self, task: Task) -> None:
+        self.insert(len(self._desc), task)
+
+    def pop(self, i: int) -> Task:
+        task = self[i]
+        self._index_remove(self._keys.pop(i), self._desc.pop(i))
+        del self._done[i]
+        return task
+
+    # ---------- Bulk helpers ----------
+
+    def completed_count(self) -> int:
+        """Number of completed tasks."""
+        return self._done.count()
+
+    def completed_indices(self) -> List[int]:
+        """0-based positions of completed tasks, ascending."""
+        return list(compress(range(len(self._done)), self._done.flags()))
+
+    def _compact(self, indices: List[int], keep: bytes) -> List[Task]:
+        """Drop the rows at indices (keep[i] == 0) from every column in one pass."""
+        removed = [self[i] for i in indices]
+        self._index_remove_many([self._keys[i] for i in indices], [t.description for t in removed])
+        self._desc = list(compress(self._desc, keep))
+        self._done = BitArray(bytes(compress(self._done.flags(), keep)))
+        self._keys = array("q", compress(self._keys, keep))
+        return removed
+
+    def delete_many(self, indices: List[int]) -> List[Task]:
+        """Remove tasks at ascending positions in one pass; return them in order."""
+        keep = bytearray(b"\x01") * len(self._desc)
+        for i in indices:
+            keep[i] = 0
+        return self._compact(indices, keep)
+
+    def delete_completed(self) -> Tuple[List[int], List[Task]]:
+        """Remove all completed tasks; the keep mask is just the inverted flags."""
+        indices = self.completed_indices()
+        return indices, self._compact(indices, self._done.flags().translate(self._FLIP))
+
+    def insert_many(self, items: List[Tuple[int, Task]]) -> None:
+        """Insert (final position, task) pairs given in ascending position order."""
+        for i, task in items:
+            self.insert(i, task)
+
+    # ---------- Search ----------
+
+    def search(self, keyword: Optional[str], completed: Optional[bool]) -> TaskView:
+        """Lazy view of tasks whose normalized description contains keyword.
 
         Args:
-            data_file: JSON file path for persistence (default: tasks.json).
+            keyword: Already-normalized substring, or None for no keyword filter.
+            completed: If True/False, filter by completion status.
         """
-        self._data_file: Path = data_file
-        self._tasks: List[Task] = []
-        self._history: List[List[Task]] = []  # LIFO snapshots for undo
-        self.load()
+        n = len(self._desc)
+        if not keyword:
+            if completed is None:
+                return TaskView(self, range(n))
+            flags = self._done.flags()
+            if not completed:
+                flags = flags.translate(self._FLIP)
+            return TaskView(self, list(compress(range(n), flags)))
+        candidates = self._candidates(keyword)
+        if candidates is not None:  # Grow the index only for queries that use it
+            unindexed = self._grow_index(self.INDEX_STEP)
+            candidates = self._candidates(keyword)
+        if candidates is None:
+            positions = self._scan(keyword, 0, n)
+        else:
+            positions = [bisect_left(self._keys, key) for key in candidates]
+            if len(keyword) > self.GRAM:
+                norm, desc = self._norm, self._desc
+                positions = [i for i in positions if keyword in norm(desc[i])]
+            positions += self._scan(keyword, unindexed, n)
+        if completed is not None:
+            done = self._done
+            positions = [i for i in positions if done[i] == completed]
+        return TaskView(self, positions)
 
-    # ---------- Persistence ----------
+    def _candidates(self, keyword: str) -> Optional[array]:
+        """Postings of the keyword's rarest trigram, or None if a scan is cheaper.
 
-    def load(self) -> None:
-        """Load tasks from JSON if the file exists.
+        A scan wins for keywords shorter than a trigram and when even the
+        rarest trigram occurs in more than DENSE of the indexed tasks.
+        """
+        if len(keyword) < self.GRAM:
+            return None
+        empty = array("q")
+        candidates = min((self._postings.get(keyword[i:i + self.GRAM], empty)
+                          for i in range(len(keyword) - self.GRAM + 1)), key=len)
+        indexed = bisect_left(self._keys, self._indexed_below) if self._indexed_below is not None else 0
+        return None if len(candidates) > self.DENSE * indexed else candidates
+
+    def _scan(self, keyword: str, start: int, stop: int) -> List[int]:
+        """Positions in [start, stop) whose normalized description contains keyword."""
+        hits = [keyword in text for text in self._norm_all(self._desc[start:stop])]
+        return list(compress(range(start, stop), hits))
+
+
+# -------------------------
+# Mutation ops
+# -------------------------
+
+def apply_op(tasks: "TaskContainer", op: dict) -> dict:
+    """Apply one mutation op to a task list in place and return its inverse.
+
+    Ops are plain dicts so they can be written to the journal as JSON lines
+    and replayed on load with exactly the same code the live list uses:
+        {"op": "add", "description": str}
+        {"op": "insert", "index": int, "task": task dict}
+        {"op": "toggle", "index": int}
+        {"op": "edit", "index": int, "description": str}
+        {"op": "delete", "index": int}
+        {"op": "clear_completed"}
+        {"op": "insert_many", "items": [[index, task dict], ...]}   (ascending)
+        {"op": "delete_many", "indices": [int, ...]}                (ascending)
+        {"op": "toggle_many", "indices": [int, ...]}
+        {"op": "batch", "ops": [op, ...]}                           (applied in order)
+
+    The returned inverse op undoes this one when applied to the result,
+    which is how undo/redo work without copying the list. Modified tasks
+    are assigned back (tasks[i] = task) so disk-backed containers persist
+    them.
+
+    Raises:
+        ValueError: If the op kind is unknown.
+        IndexError: If an index is out of range.
+    """
+    kind = op.get("op")
+    if kind == "add":
+        tasks.append(Task(op["description"], False))
+        return {"op": "delete", "index": len(tasks) - 1}
+    if kind == "insert":
+        tasks.insert(op["index"], Task.from_dict(op["task"]))
+        return {"op": "delete", "index": op["index"]}
+    if kind == "toggle":
+        task = tasks[op["index"]]
+        task.toggle()
+        tasks[op["index"]] = task
+        return {"op": "toggle", "index": op["index"]}
+    if kind == "toggle_many":
+        for i in op["indices"]:
+            task = tasks[i]
+            task.toggle()
+            tasks[i] = task
+        return {"op": "toggle_many", "indices": op["indices"]}
+    if kind == "edit":
+        task = tasks[op["index"]]
+        old = task.description
+        task.description = op["description"]
+        tasks[op["index"]] = task
+        return {"op": "edit", "index": op["index"], "description": old}
+    if kind == "delete":
+        removed = tasks.pop(op["index"])
+        return {"op": "insert", "index": op["index"], "task": removed.to_dict()}
+    if kind in ("clear_completed", "delete_many"):
+        if kind == "clear_completed":
+            indices, removed = tasks.delete_completed()
+        else:
+            indices, removed = op["indices"], tasks.delete_many(op["indices"])
+        return {"op": "insert_many", "items": [[i, t.to_dict()] for i, t in zip(indices, removed)]}
+    if kind == "batch":
+        inverses = [apply_op(tasks, sub) for sub in op["ops"]]
+        return {"op": "batch", "ops": inverses[::-1]}
+    if kind == "insert_many":
+        tasks.insert_many([(i, Task.from_dict(d)) for i, d in op["items"]])
+        return {"op": "delete_many", "indices": [i for i, _ in op["items"]]}
+    raise ValueError(f"Unknown op: {kind!r}")
+
+
+# -------------------------
+# Durable writes
+# -------------------------
+
+def fsync_dir(path: Path) -> None:
+    """Make a create/rename of path durable by syncing its directory.
+
+    POSIX only: on platforms that cannot open directories (Windows) this
+    is a no-op, and renames there are already metadata-journaled.
+    """
+    try:
+        fd = os.open(path.parent, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write_json(path: Path, payload) -> None:
+    """Replace path with payload as JSON so a crash leaves the old or new file.
+
+    Writes a sibling temp file, fsyncs it, swaps it in with os.replace
+    (atomic on POSIX and Windows) and fsyncs the directory so the rename
+    itself survives a power loss.
+
+    Raises:
+        OSError: If any step fails; the original file is left untouched.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    fsync_dir(path)
+
+
+class GroupCommit:
+    """Coalesce bursts of changes into one durable write per time window.
+
+    Storage backends call changed() after each change (with lock held).
+    With window == 0 the flush callback runs immediately, so every change
+    is durable before record() returns. With window > 0 the first change
+    starts a timer and every change within the next `window` seconds rides
+    along in the same flush: a crash loses at most that window of changes.
+
+    The lock is shared with ToDoList, which holds it while applying an op,
+    so the timer thread never flushes a half-applied change. on_timer runs
+    after a timer-driven flush (e.g. to release a file lock held for the
+    window).
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[], None],
+        window: float = 0.0,
+        on_timer: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.lock = threading.RLock()
+        self.window = window
+        self._flush = flush
+        self._on_timer = on_timer
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+
+    @property
+    def pending(self) -> bool:
+        """True while changes are waiting for their flush."""
+        return self._dirty
+
+    def changed(self) -> None:
+        """Note a change; flush now or schedule the window's flush."""
+        with self.lock:
+            self._dirty = True
+            if self.window <= 0:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.window, self._timer_flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Run the pending flush now (no-op when nothing changed)."""
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._dirty:
+                self._dirty = False
+                self._flush()
+
+    def _timer_flush(self) -> None:
+        with self.lock:
+            self.flush()
+            if self._on_timer is not None:
+                self._on_timer()
+
+    def discard(self) -> None:
+        """Forget pending changes (they were persisted some other way)."""
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._dirty = False
+
+
+class FileLock:
+    """Cross-process exclusive lock on a sidecar file (fcntl.flock).
+
+    The lock is counted per process: the first acquire() takes the flock,
+    nested or concurrent acquires from other threads of the same process
+    just bump the count, and the last release() drops it. So a background
+    thread can work "under the lock" that the main thread is already
+    holding, while other processes wait. Where fcntl is unavailable
+    (Windows) only the in-process counting is done.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._mutex = threading.Lock()
+        self._count = 0
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> None:
+        with self._mutex:
+            if self._count == 0:
+                fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)  # Blocks while another process holds it
+                self._fd = fd
+            self._count += 1
+
+    def release(self) -> None:
+        with self._mutex:
+            self._count -= 1
+            if self._count == 0:
+                if fcntl is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+                os.close(self._fd)
+                self._fd = None
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+def file_stamp(path: Path) -> Optional[Tuple[int, int, int]]:
+    """(inode, mtime in ns, size) of path, or None if it does not exist.
+
+    Atomic rewrites create a new inode and appends change size and mtime,
+    so comparing stamps detects any write by another process.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+# -------------------------
+# Storage backends
+# -------------------------
+
+class JsonStorage:
+    """Whole-file JSON storage: the entire list is rewritten on every change.
+
+    Each rewrite is atomic and fsynced (see atomic_write_json). With
+    commit_window > 0, changes within that many seconds share one rewrite.
+
+    Several processes may share one file. A mutation calls begin(), which
+    takes the tasks.json.lock file lock and reloads if the file's stamp
+    differs from the one we last read or wrote; the lock is held until the
+    change is durably written (the end of the commit window), so writers
+    never overwrite each other.
+    """
+
+    def __init__(self, data_file: Path = Path("tasks.json"), commit_window: float = 0.0) -> None:
+        self.data_file: Path = data_file
+        self._group = GroupCommit(self._flush, commit_window, on_timer=self.release_if_idle)
+        self.lock = self._group.lock
+        self._file_lock = FileLock(data_file.with_name(data_file.name + ".lock"))
+        self._holding = False  # file lock held by begin() until the next flush
+        self._seen: Optional[Tuple[int, int, int]] = None  # stamp of the file we last read/wrote
+        self._tasks: Optional[TaskStore] = None  # latest list passed to record()
+
+    def load(self) -> TaskStore:
+        """Read tasks from JSON if the file exists.
 
         Behavior:
-            - Clears current tasks, then parses the JSON array.
-            - Invalid entries (e.g., missing description) are skipped.
-            - On read/parse error, prints a warning and starts empty.
+            - Parses the JSON array; invalid entries are skipped.
+            - On read/parse error, prints a warning and returns an empty list.
         """
-        self._tasks.clear()
-        if not self._data_file.exists():
-            return
+        self._group.flush()
+        with self._file_lock:
+            self._seen = file_stamp(self.data_file)
+            return self._read_snapshot()
+
+    def _read_snapshot(self) -> TaskStore:
+        tasks = TaskStore()
+        if not self.data_file.exists():
+            return tasks
         try:
-            with self._data_file.open("r", encoding="utf-8") as f:
+            with self.data_file.open("r", encoding="utf-8") as f:
                 data = json.load(f)
             if isinstance(data, list):
                 for item in data:
                     t = Task.from_dict(item)
                     if t:
-                        self._tasks.append(t)
+                        tasks.append(t)
         except (OSError, json.JSONDecodeError) as e:
             print(f"Warning: Could not read JSON tasks file ({e}). Starting empty.")
+        return tasks
 
-    def save(self) -> None:
-        """Persist current tasks to JSON.
+    # ---------- Multi-process coordination ----------
+
+    def begin(self, tasks: TaskStore) -> Optional[TaskStore]:
+        """Lock the file for a mutation; return reloaded tasks if another process wrote it.
+
+        Returns:
+            None if the file is unchanged since we last read/wrote it,
+            otherwise the current tasks (callers must drop index-based
+            state such as undo history).
+        """
+        with self.lock:
+            if self._holding:
+                return None  # Still inside our own commit window: nobody else could write
+            self._file_lock.acquire()
+            self._holding = True
+            if file_stamp(self.data_file) == self._seen:
+                return None
+            return self.load()
+
+    def release_if_idle(self) -> None:
+        """Drop the file lock taken by begin() unless a write is still pending.
+
+        Called when a mutation ends and after each timer-driven flush.
+        """
+        with self.lock:
+            if self._holding and not self._group.pending:
+                self._holding = False
+                self._file_lock.release()
+
+    # ---------- Writing ----------
+
+    def record(self, op: dict, tasks: TaskStore) -> None:
+        """Persist the effect of one applied op (here: rewrite everything, per window)."""
+        self._tasks = tasks
+        self._group.changed()
+
+    def _flush(self) -> None:
+        self._write_snapshot(self._tasks)
+
+    def save(self, tasks: TaskStore) -> None:
+        """Persist the given tasks to JSON now (pending window writes included)."""
+        with self.lock, self._file_lock:
+            self._group.discard()
+            self._write_snapshot(tasks)
+        self.release_if_idle()
+
+    def close(self) -> None:
+        """Write any changes still waiting for their commit window."""
+        self._group.flush()
+        self.release_if_idle()
+
+    def _write_snapshot(self, tasks: TaskStore) -> None:
+        """Atomically replace the JSON file with the given tasks.
 
         Notes:
             - Skips tasks whose descriptions are blank after strip().
             - Uses pretty printing for readability; change indent if needed.
         """
         try:
-            payload = [t.to_dict() for t in self._tasks if t.description.strip()]
-            with self._data_file.open("w", encoding="utf-8") as f:
-                json.dump(payload, f, ensure_ascii=False, indent=2)
+            payload = [t.to_dict() for t in tasks if t.description.strip()]
+            atomic_write_json(self.data_file, payload)
+            self._seen = file_stamp(self.data_file)
         except OSError as e:
             print(f"Warning: Could not save tasks ({e}).")
 
-    # ---------- History / Undo ----------
 
-    def _snapshot(self) -> None:
-        """Capture a deep-copy snapshot before mutation to support undo."""
-        self._history.append(copy.deepcopy(self._tasks))
+class JournalStorage(JsonStorage):
+    """Snapshot + append-only journal storage for large lists.
 
-    def undo(self) -> bool:
-        """Revert to the most recent snapshot, if any, and save.
+    Files:
+        tasks.json                   snapshot, same format as JsonStorage
+        tasks.json.journal           one compact JSON op per line, appended per mutation
+        tasks.json.journal.compact   journal being folded into the snapshot
 
-        Returns:
-            True if a snapshot was applied; False if no history exists.
+    Each mutation appends a single line (O(1)) instead of rewriting the whole
+    file (O(n)). load() reads the snapshot and replays the journal(s). When the
+    journal passes compact_bytes, it is renamed aside (atomic, O(1)) and a
+    background thread rebuilds the snapshot from disk, so the caller never
+    waits for the O(n) rewrite.
+
+    Appended lines are made durable with fsync; with commit_window > 0 all
+    lines appended within the window share one fsync (group commit).
+
+    With several processes, begin() merges instead of reloading when it
+    can: if only the journal grew since we last saw it, just the other
+    writers' new lines are replayed onto our list.
+    """
+
+    def __init__(
+        self,
+        data_file: Path = Path("tasks.json"),
+        compact_bytes: int = 1_000_000,
+        commit_window: float = 0.0,
+    ) -> None:
+        super().__init__(data_file, commit_window)
+        self.journal_file: Path = data_file.with_name(data_file.name + ".journal")
+        self.compacting_file: Path = data_file.with_name(data_file.name + ".journal.compact")
+        self.compact_bytes = compact_bytes
+        self._journal = None
+        self._journal_size = 0  # bytes of the journal reflected in our list
+        self._journal_ino: Optional[int] = None
+        self._compact_seen: Optional[Tuple[int, int, int]] = None
+        self._state_lock = threading.Lock()  # stamps shared with the compactor thread
+        self._compactor: Optional[threading.Thread] = None
+
+    # ---------- Reading ----------
+
+    @staticmethod
+    def _replay(journal: Path, tasks: TaskStore, offset: int = 0) -> int:
+        """Apply every op in a journal file from offset; return the end offset.
+
+        A torn last line (a writer crashed mid-append) is ignored.
+        """
+        if not journal.exists():
+            return 0
+        with journal.open("rb") as f:
+            f.seek(offset)
+            data = f.read()
+        for line_no, line in enumerate(data.decode("utf-8", errors="replace").splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                apply_op(tasks, json.loads(line))
+            except (json.JSONDecodeError, KeyError, IndexError, ValueError) as e:
+                print(f"Warning: Skipping journal entry {journal.name}:+{line_no} ({e}).")
+        return offset + len(data)
+
+    def load(self) -> TaskStore:
+        """Read the snapshot, then replay pending and current journals."""
+        self._group.flush()
+        self._wait_for_compaction()
+        self._close_journal()
+        with self._file_lock, self._state_lock:
+            self._seen = file_stamp(self.data_file)
+            self._compact_seen = file_stamp(self.compacting_file)
+            journal = file_stamp(self.journal_file)
+            self._journal_ino = journal[0] if journal else None
+            tasks = self._read_snapshot()
+            self._replay(self.compacting_file, tasks)
+            self._journal_size = self._replay(self.journal_file, tasks)
+        return tasks
+
+    def begin(self, tasks: TaskStore) -> Optional[TaskStore]:
+        """Lock for a mutation; merge or reload if another process wrote in between."""
+        with self.lock:
+            if self._holding:
+                return None
+            self._file_lock.acquire()
+            self._holding = True
+            with self._state_lock:
+                journal = file_stamp(self.journal_file)
+                unchanged = (
+                    file_stamp(self.data_file) == self._seen
+                    and file_stamp(self.compacting_file) == self._compact_seen
+                    and (journal is None or self._journal_ino in (None, journal[0]))
+                )
+                if unchanged and (journal is None or journal[2] == self._journal_size):
+                    return None
+                if unchanged:
+                    # Only the journal grew: replay just the other writers' lines
+                    offset = self._journal_size if self._journal_ino is not None else 0
+                    self._journal_size = self._replay(self.journal_file, tasks, offset)
+                    self._journal_ino = journal[0]
+                    return tasks
+            return self.load()
+
+    # ---------- Writing ----------
+
+    def record(self, op: dict, tasks: TaskStore) -> None:
+        """Append one op as a compact JSON line; compact when the journal is large."""
+        with self.lock:
+            try:
+                if self._journal is None:
+                    self._journal = self.journal_file.open("a", encoding="utf-8")
+                    self._journal_ino = os.fstat(self._journal.fileno()).st_ino
+                    fsync_dir(self.journal_file)
+                line = json.dumps(op, ensure_ascii=False, separators=(",", ":")) + "\n"
+                self._journal.write(line)
+                self._journal_size += len(line.encode("utf-8"))
+            except OSError as e:
+                print(f"Warning: Could not append to journal ({e}).")
+                return
+            self._group.changed()
+            if self._journal_size >= self.compact_bytes:
+                self._start_compaction()
+
+    def _flush(self) -> None:
+        """Make every appended line durable (one fsync for the whole window)."""
+        if self._journal is not None:
+            try:
+                self._journal.flush()
+                os.fsync(self._journal.fileno())
+            except OSError as e:
+                print(f"Warning: Could not sync journal ({e}).")
+
+    def save(self, tasks: TaskStore) -> None:
+        """Write a full snapshot of the given tasks and drop the journals."""
+        self._group.discard()
+        self._wait_for_compaction()
+        self._close_journal()
+        with self.lock, self._file_lock, self._state_lock:
+            self._write_snapshot(tasks)
+            for journal in (self.compacting_file, self.journal_file):
+                try:
+                    journal.unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    print(f"Warning: Could not remove {journal.name} ({e}).")
+            self._journal_size = 0
+            self._journal_ino = None
+            self._compact_seen = None
+        self.release_if_idle()
+
+    def close(self) -> None:
+        """Sync pending lines, finish background compaction and close the journal."""
+        self._group.flush()
+        self._wait_for_compaction()
+        self._close_journal()
+        self.release_if_idle()
+
+    # ---------- Compaction ----------
+
+    def _close_journal(self) -> None:
+        """Sync and close the journal handle (pending window flush included)."""
+        with self.lock:
+            self._group.flush()
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
+    def _wait_for_compaction(self) -> None:
+        if self._compactor is not None:
+            self._compactor.join()
+            self._compactor = None
+
+    def _start_compaction(self) -> None:
+        """Rotate the journal aside and fold it into the snapshot in a thread."""
+        if self._compactor is not None and self._compactor.is_alive():
+            return  # Previous compaction still running; try again on a later write
+        if self.compacting_file.exists():
+            return  # Another process's compaction is still pending
+        self._wait_for_compaction()
+        self._close_journal()
+        with self._state_lock:
+            try:
+                os.replace(self.journal_file, self.compacting_file)
+                fsync_dir(self.compacting_file)
+            except OSError as e:
+                print(f"Warning: Could not rotate journal ({e}).")
+                return
+            self._journal_size = 0
+            self._journal_ino = None
+            self._compact_seen = file_stamp(self.compacting_file)
+            snapshot, rotated = self._seen, self._compact_seen
+        self._compactor = threading.Thread(
+            target=self._compact, args=(snapshot, rotated), name="todo-compactor", daemon=True
+        )
+        self._compactor.start()
+
+    def _compact(self, snapshot, rotated) -> None:
+        """Background: snapshot + rotated journal -> new snapshot.
+
+        The new snapshot is built without any lock, then swapped in under
+        the file lock only if nobody replaced the snapshot or the rotated
+        journal meanwhile (e.g. an explicit save() from another process).
         """
-        if not self._history:
+        tasks = self._read_snapshot()
+        self._replay(self.compacting_file, tasks)
+        with self._file_lock, self._state_lock:
+            if file_stamp(self.data_file) != snapshot or file_stamp(self.compacting_file) != rotated:
+                return
+            self._write_snapshot(tasks)
+            try:
+                self.compacting_file.unlink()
+                self._compact_seen = None
+            except OSError as e:
+                print(f"Warning: Could not remove {self.compacting_file.name} ({e}).")
+
+
+class SQLiteTaskList:
+    """Ordered task container stored in SQLite (same methods as TaskStore).
+
+    Only the row ids (and their sort keys) are kept in memory, in two compact
+    arrays, so positional access is O(1) without loading descriptions. Order
+    is a REAL "pos" column: inserting between two tasks takes the midpoint of
+    their keys, and keys are renumbered in the rare case the gap runs out.
+    Statements run inside the connection's open transaction; SQLiteStorage
+    decides when to commit.
+    """
+
+    GAP = 1024.0
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+        rows = conn.execute("SELECT id, pos FROM tasks ORDER BY pos").fetchall()
+        self._ids = array("q", (r[0] for r in rows))
+        self._pos = array("d", (r[1] for r in rows))
+
+    # ---------- Sequence protocol ----------
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _index(self, i: int) -> int:
+        if i < 0:
+            i += len(self._ids)
+        if not 0 <= i < len(self._ids):
+            raise IndexError("task index out of range")
+        return i
+
+    def __getitem__(self, i: int) -> Task:
+        row = self._conn.execute(
+            "SELECT description, completed FROM tasks WHERE id = ?", (self._ids[self._index(i)],)
+        ).fetchone()
+        return Task(row[0], bool(row[1]))
+
+    def __setitem__(self, i: int, task: Task) -> None:
+        self._conn.execute(
+            "UPDATE tasks SET description = ?, completed = ? WHERE id = ?",
+            (task.description, int(task.completed), self._ids[self._index(i)]),
+        )
+
+    def __iter__(self) -> Iterator[Task]:
+        for desc, comp in self._conn.execute("SELECT description, completed FROM tasks ORDER BY pos"):
+            yield Task(desc, bool(comp))
+
+    def _key_between(self, i: int) -> float:
+        """Sort key for a new task placed at position i."""
+        n = len(self._pos)
+        if n == 0:
+            return self.GAP
+        if i >= n:
+            return self._pos[-1] + self.GAP
+        if i == 0:
+            return self._pos[0] - self.GAP
+        lo, hi = self._pos[i - 1], self._pos[i]
+        mid = (lo + hi) / 2
+        if lo < mid < hi:
+            return mid
+        self._renumber()
+        return (self._pos[i - 1] + self._pos[i]) / 2
+
+    def _renumber(self) -> None:
+        """Respace every sort key by GAP (only when a midpoint gap is exhausted)."""
+        self._pos = array("d", ((k + 1) * self.GAP for k in range(len(self._ids))))
+        self._conn.executemany("UPDATE tasks SET pos = ? WHERE id = ?", zip(self._pos, self._ids))
+
+    def insert(self, i: int, task: Task) -> None:
+        i = max(0, min(i, len(self._ids)))
+        pos = self._key_between(i)
+        cur = self._conn.execute(
+            "INSERT INTO tasks (pos, description, completed) VALUES (?, ?, ?)",
+            (pos, task.description, int(task.completed)),
+        )
+        self._ids.insert(i, cur.lastrowid)
+        self._pos.insert(i, pos)
+
+    def append(self, task: Task) -> None:
+        self.insert(len(self._ids), task)
+
+    def pop(self, i: int) -> Task:
+        i = self._index(i)
+        task = self[i]
+        self._conn.execute("DELETE FROM tasks WHERE id = ?", (self._ids[i],))
+        del self._ids[i]
+        del self._pos[i]
+        return task
+
+    # ---------- Bulk helpers ----------
+
+    def completed_count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM tasks WHERE completed = 1").fetchone()[0]
+
+    def completed_indices(self) -> List[int]:
+        done = {r[0] for r in self._conn.execute("SELECT id FROM tasks WHERE completed = 1")}
+        return [i for i, task_id in enumerate(self._ids) if task_id in done]
+
+    def delete_many(self, indices: List[int]) -> List[Task]:
+        removed = [self[i] for i in indices]
+        self._conn.executemany("DELETE FROM tasks WHERE id = ?", ((self._ids[i],) for i in indices))
+        drop = set(indices)
+        keep = [k for k in range(len(self._ids)) if k not in drop]
+        self._ids = array("q", (self._ids[k] for k in keep))
+        self._pos = array("d", (self._pos[k] for k in keep))
+        return removed
+
+    def insert_many(self, items: List[Tuple[int, Task]]) -> None:
+        for i, task in items:
+            self.insert(i, task)
+
+    def delete_completed(self) -> Tuple[List[int], List[Task]]:
+        indices = self.completed_indices()
+        return indices, self.delete_many(indices)
+
+    # ---------- Search ----------
+
+    def search(self, keyword: Optional[str], completed: Optional[bool]) -> List[Task]:
+        """Indexed search: FTS5 trigram MATCH for keywords, partial indexes for status.
+
+        keyword is already casefolded (ToDoList._norm). The FTS index holds
+        casefold(description), so matches agree with the in-memory backends.
+        """
+        where, params = [], []
+        if completed is not None:
+            where.append("t.completed = ?")
+            params.append(int(completed))
+        if keyword and len(keyword) >= 3:
+            # Trigram tokenizer: a quoted phrase matches any substring of the folded text
+            sql = "SELECT t.description, t.completed FROM tasks_fts f JOIN tasks t ON t.id = f.rowid"
+            where.insert(0, "tasks_fts MATCH ?")
+            params.insert(0, '"' + keyword.replace('"', '""') + '"')
+        else:
+            sql = "SELECT t.description, t.completed FROM tasks t"
+            if keyword:  # 1-2 chars: too short for trigrams, fall back to a scan
+                where.append("instr(casefold(t.description), ?) > 0")
+                params.append(keyword)
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY t.pos"
+        rows = self._conn.execute(sql, params).fetchall()
+        return [Task(desc, bool(comp)) for desc, comp in rows]
+
+
+class SQLiteStorage:
+    """SQLite storage: stable row ids, FTS5 search, batched WAL transactions.
+
+    The database is the list: SQLiteTaskList writes each change as it is
+    applied, and record() only counts changes. The open transaction is
+    committed every batch_size ops, after a ToDoList.batch(), on
+    save()/close(), and at the latest commit_window seconds after its first
+    change (0 commits every op). WAL mode lets readers run during writes and
+    makes each commit a sequential append.
+
+    Several processes may share one database: begin() opens the write
+    transaction with BEGIN IMMEDIATE (other writers wait up to `timeout`
+    seconds) and reloads the cached row order if PRAGMA data_version shows
+    another connection committed since we last looked.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY,
+            pos REAL NOT NULL,
+            description TEXT NOT NULL,
+            completed INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS tasks_pos ON tasks(pos);
+        CREATE INDEX IF NOT EXISTS tasks_completed ON tasks(pos) WHERE completed = 1;
+        CREATE INDEX IF NOT EXISTS tasks_open ON tasks(pos) WHERE completed = 0;
+    """
+
+    # Keyword index over casefold(description): a contentless FTS5 table
+    # (case_sensitive, since the text is already folded) kept in sync by
+    # triggers that call the casefold() SQL function registered in load().
+    # Version 0 databases indexed the raw text; this script rebuilds the index.
+    FTS_VERSION = 1
+    FTS_SCHEMA = """
+        BEGIN IMMEDIATE;
+        DROP TRIGGER IF EXISTS tasks_ai;
+        DROP TRIGGER IF EXISTS tasks_ad;
+        DROP TRIGGER IF EXISTS tasks_au;
+        DROP TABLE IF EXISTS tasks_fts;
+        CREATE VIRTUAL TABLE tasks_fts USING fts5(
+            folded, content='', tokenize='trigram case_sensitive 1'
+        );
+        CREATE TRIGGER tasks_ai AFTER INSERT ON tasks BEGIN
+            INSERT INTO tasks_fts(rowid, folded) VALUES (new.id, casefold(new.description));
+        END;
+        CREATE TRIGGER tasks_ad AFTER DELETE ON tasks BEGIN
+            INSERT INTO tasks_fts(tasks_fts, rowid, folded) VALUES ('delete', old.id, casefold(old.description));
+        END;
+        CREATE TRIGGER tasks_au AFTER UPDATE OF description ON tasks BEGIN
+            INSERT INTO tasks_fts(tasks_fts, rowid, folded) VALUES ('delete', old.id, casefold(old.description));
+            INSERT INTO tasks_fts(rowid, folded) VALUES (new.id, casefold(new.description));
+        END;
+        INSERT INTO tasks_fts(rowid, folded) SELECT id, casefold(description) FROM tasks;
+        PRAGMA user_version = 1;
+        COMMIT;
+    """
+
+    def __init__(
+        self,
+        db_file: Path = Path("tasks.db"),
+        batch_size: int = 500,
+        commit_window: float = 1.0,
+        timeout: float = 30.0,
+    ) -> None:
+        self.data_file: Path = db_file
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self._conn: Optional[sqlite3.Connection] = None
+        self._version: Optional[int] = None
+        self._pending = 0
+        self._group = GroupCommit(self._flush, commit_window)
+        self.lock = self._group.lock
+
+    def load(self) -> SQLiteTaskList:
+        """Open (or create) the database and return its task container."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.data_file), timeout=self.timeout, check_same_thread=False)
+            self._conn.create_function("casefold", 1, str.casefold, deterministic=True)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(self.SCHEMA)
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] < self.FTS_VERSION:
+                self._conn.executescript(self.FTS_SCHEMA)
+        self._version = self._data_version()
+        return SQLiteTaskList(self._conn)
+
+    # ---------- Multi-process coordination ----------
+
+    def _data_version(self) -> int:
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def begin(self, tasks: SQLiteTaskList) -> Optional[SQLiteTaskList]:
+        """Take the write lock; return a fresh container if another connection committed."""
+        with self.lock:
+            if self._conn is None or self._conn.in_transaction:
+                return None  # Our transaction is still open: nobody else could write
+            self._conn.execute("BEGIN IMMEDIATE")
+            version = self._data_version()
+            if version == self._version:
+                return None
+            self._version = version
+            return SQLiteTaskList(self._conn)
+
+    def release_if_idle(self) -> None:
+        """End the transaction opened by begin() if nothing is waiting to commit."""
+        with self.lock:
+            if self._conn is not None and self._conn.in_transaction and not self._group.pending:
+                self._conn.commit()
+
+    def record(self, op: dict, tasks: SQLiteTaskList) -> None:
+        """Count an applied op; commit when the batch or its time window is full."""
+        with self.lock:
+            self._pending += 1
+            self._group.changed()
+            if self._pending >= self.batch_size or op["op"] == "batch":
+                self._group.flush()
+
+    def _flush(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: Could not save tasks ({e}).")
+        self._pending = 0
+
+    def save(self, tasks: SQLiteTaskList) -> None:
+        """Commit all pending changes now."""
+        with self.lock:
+            self._group.discard()
+            self._flush()
+
+    def close(self) -> None:
+        """Commit pending changes and close the connection."""
+        with self.lock:
+            if self._conn is not None:
+                self.save(None)
+                self._conn.close()
+                self._conn = None
+
+
+# Backends ToDoList accepts (JournalStorage is a JsonStorage) and the task
+# containers they load; both pairs share the same duck-typed methods.
+Storage = Union[JsonStorage, SQLiteStorage]
+TaskContainer = Union[TaskStore, SQLiteTaskList]
+
+
+# -------------------------
+# Application Model (Manager)
+# -------------------------
+
+class ToDoList:
+    """Manage a collection of Task objects with pluggable persistence and undo."""
+
+    def __init__(
+        self,
+        data_file: Path = Path("tasks.json"),
+        storage: Optional[Storage] = None,
+        max_undo: Optional[int] = 100,
+    ) -> None:
+        """Initialize the manager and eagerly load from disk if present.
+
+        Args:
+            data_file: JSON file path for persistence (default: tasks.json).
+            storage: Storage backend; defaults to JsonStorage(data_file).
+                Pass JournalStorage(data_file) for append-only persistence
+                or SQLiteStorage(db_file) for indexed on-disk storage.
+            max_undo: Maximum undo depth (oldest entries are dropped);
+                None keeps the full session history.
+        """
+        self._storage = storage if storage is not None else JsonStorage(data_file)
+        self._data_file: Path = self._storage.data_file
+        self._tasks: TaskContainer = TaskStore()
+        self._undo: Deque[dict] = deque(maxlen=max_undo)  # inverse ops, newest last
+        self._redo: List[dict] = []  # ops undone, newest last
+        self._batch: Optional[List[Tuple[dict, dict]]] = None  # (op, inverse) inside batch()
+        self._depth = 0  # nesting of _writing() sections
+        self.load()
+
+    # ---------- Persistence ----------
+
+    def load(self) -> None:
+        """Load tasks from the storage backend (replaces current tasks)."""
+        self._tasks = self._storage.load()
+
+    def save(self) -> None:
+        """Persist a full copy of the current tasks (journal backends compact).
+
+        Runs under _writing() like any mutation, so changes other processes
+        made since we last read are picked up first, not overwritten.
+        """
+        with self._writing():
+            self._storage.save(self._tasks)
+
+    def close(self) -> None:
+        """Flush pending work and release storage resources."""
+        self._storage.close()
+
+    # ---------- Multi-process coordination ----------
+
+    @contextmanager
+    def _writing(self) -> Iterator[bool]:
+        """Hold the storage locks for one public mutation.
+
+        The outermost section calls storage.begin(), which takes the
+        cross-process lock and picks up changes other processes made since
+        we last read or wrote, so validation below sees the current list.
+        Yields True if the tasks were reloaded. The lock is released at the
+        end unless a commit window is still pending.
+        """
+        with self._storage.lock:
+            self._depth += 1
+            try:
+                yield self._sync() if self._depth == 1 else False
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._storage.release_if_idle()
+
+    def _sync(self) -> bool:
+        fresh = self._storage.begin(self._tasks)
+        if fresh is None:
             return False
-        prev = self._history.pop()
-        self._tasks = prev
-        self.save()
+        self._tasks = fresh
+        # Undo entries hold positions in the old list, so they no longer apply
+        self._undo.clear()
+        self._redo.clear()
+        print("Note: Tasks were changed by another process; reloaded.")
         return True
 
+    def refresh(self) -> bool:
+        """Pick up changes made by other processes (a stat call when there are none).
+
+        Returns:
+            True if the tasks were reloaded or merged.
+        """
+        with self._writing() as reloaded:
+            return reloaded
+
+    def _commit(self, op: dict) -> None:
+        """Apply a new op, persist it, and remember its inverse for undo.
+
+        Inside batch() the op is only applied and collected; persistence
+        and history happen once when the batch ends. Callers hold
+        _writing(), so a group-commit flush never sees a half-applied op.
+        """
+        inverse = apply_op(self._tasks, op)
+        if self._batch is not None:
+            self._batch.append((op, inverse))
+            return
+        self._storage.record(op, self._tasks)
+        self._undo.append(inverse)
+        self._redo.clear()
+
+    @contextmanager
+    def batch(self) -> Iterator["ToDoList"]:
+        """Group many changes into one undo entry and one storage write.
+
+        Usage:
+            with todo.batch():
+                todo.add("Buy milk")
+                todo.toggle(3)
+
+        All changes are applied immediately (so later calls see earlier
+        ones), then recorded on exit as a single {"op": "batch"} op: one
+        rewrite for JSON, one journal line, one SQLite commit. If the block
+        raises, every change made inside it is rolled back and the exception
+        propagates. Nested batch() calls join the outermost one. The storage
+        locks are held throughout, so a group commit never persists half a
+        batch and no other process writes in between.
+        """
+        if self._batch is not None:
+            yield self
+            return
+        with self._writing():
+            self._batch = []
+            try:
+                yield self
+            except BaseException:
+                entries, self._batch = self._batch, None
+                for _, inverse in reversed(entries):
+                    apply_op(self._tasks, inverse)
+                raise
+            entries, self._batch = self._batch, None
+            if entries:
+                self._storage.record({"op": "batch", "ops": [op for op, _ in entries]}, self._tasks)
+        if entries:
+            self._undo.append({"op": "batch", "ops": [inv for _, inv in reversed(entries)]})
+            self._redo.clear()
+
+    # ---------- History / Undo ----------
+
+    def undo(self) -> bool:
+        """Apply the most recent inverse op, if any, and persist it.
+
+        Returns:
+            True if a change was undone; False if no history exists.
+        """
+        if self._batch is not None:
+            raise RuntimeError("undo() is not allowed inside batch()")
+        with self._writing():
+            if not self._undo:
+                return False
+            inverse = self._undo.pop()
+            self._redo.append(apply_op(self._tasks, inverse))
+            self._storage.record(inverse, self._tasks)
+            return True
+
+    def redo(self) -> bool:
+        """Re-apply the most recently undone change, if any, and persist it.
+
+        Returns:
+            True if a change was redone; False if there is nothing to redo.
+        """
+        if self._batch is not None:
+            raise RuntimeError("redo() is not allowed inside batch()")
+        with self._writing():
+            if not self._redo:
+                return False
+            op = self._redo.pop()
+            self._undo.append(apply_op(self._tasks, op))
+            self._storage.record(op, self._tasks)
+            return True
+
     # ---------- Query helpers ----------
 
     @staticmethod
     def _norm(s: str) -> str:
-        """Normalize a string for case-insensitive matching."""
-        return s.strip().lower()
+        """Normalize a string for case-insensitive matching (Unicode casefold, e.g. ß == ss)."""
+        return s.strip().casefold()
 
     # ---------- CRUD operations ----------
 
-    def list(self) -> List[Task]:
-        """Return a shallow copy of the current tasks."""
-        return list(self._tasks)
+    def list(self) -> Sequence[Task]:
+        """Return a lazy read-only view of the current tasks (valid until the next change)."""
+        return TaskView(self._tasks, range(len(self._tasks)))
+
+    def get(self, index_1based: int) -> Optional[Task]:
+        """Return the task at a 1-based index, or None if out of range."""
+        i = index_1based - 1
+        return self._tasks[i] if 0 <= i < len(self._tasks) else None
 
     def add(self, description: str) -> bool:
         """Add a new task with validation and persistence.
@@ -158,15 +1538,14 @@ class ToDoList:
         Returns:
             True if added; False if validation fails.
         """
-        name = description.strip()
-        if not name:
-            print("Error: Task cannot be empty.")
-            return False
-        self._snapshot()
-        self._tasks.append(Task(name, False))
-        self.save()
-        print(f"Success: Task '{name}' was added to your list.")
-        return True
+        with self._writing():
+            name = description.strip()
+            if not name:
+                print("Error: Task cannot be empty.")
+                return False
+            self._commit({"op": "add", "description": name})
+            print(f"Success: Task '{name}' was added to your list.")
+            return True
 
     def toggle(self, index_1based: int) -> bool:
         """Toggle a task's completion by its 1-based index.
@@ -174,15 +1553,14 @@ class ToDoList:
         Returns:
             True on success; False if index is out of range.
         """
-        i = index_1based - 1
-        if 0 <= i < len(self._tasks):
-            self._snapshot()
-            self._tasks[i].toggle()
-            self.save()
-            print(f"Success: Task {index_1based} toggled.")
-            return True
-        print("Error: Invalid task number. Please try again.")
-        return False
+        with self._writing():
+            i = index_1based - 1
+            if 0 <= i < len(self._tasks):
+                self._commit({"op": "toggle", "index": i})
+                print(f"Success: Task {index_1based} toggled.")
+                return True
+            print("Error: Invalid task number. Please try again.")
+            return False
 
     def edit(self, index_1based: int, new_text: str) -> bool:
         """Edit a task's description by its 1-based index.
@@ -190,19 +1568,18 @@ class ToDoList:
         Returns:
             True on success; False for invalid index or empty new text.
         """
-        i = index_1based - 1
-        if not (0 <= i < len(self._tasks)):
-            print("Error: Invalid task number.")
-            return False
-        new_text = new_text.strip()
-        if not new_text:
-            print("Error: Description cannot be empty.")
-            return False
-        self._snapshot()
-        self._tasks[i].description = new_text
-        self.save()
-        print("Success: Task updated.")
-        return True
+        with self._writing():
+            i = index_1based - 1
+            if not (0 <= i < len(self._tasks)):
+                print("Error: Invalid task number.")
+                return False
+            new_text = new_text.strip()
+            if not new_text:
+                print("Error: Description cannot be empty.")
+                return False
+            self._commit({"op": "edit", "index": i, "description": new_text})
+            print("Success: Task updated.")
+            return True
 
     def delete(self, index_1based: int) -> bool:
         """Delete a task by its 1-based index.
@@ -210,15 +1587,71 @@ class ToDoList:
         Returns:
             True on success; False if index is out of range.
         """
-        i = index_1based - 1
-        if 0 <= i < len(self._tasks):
-            self._snapshot()
-            removed = self._tasks.pop(i)
-            self.save()
-            print(f"Deleted: {removed.description}")
-            return True
-        print("Error: Invalid task number.")
-        return False
+        with self._writing():
+            i = index_1based - 1
+            if 0 <= i < len(self._tasks):
+                removed = self._tasks[i]
+                self._commit({"op": "delete", "index": i})
+                print(f"Deleted: {removed.description}")
+                return True
+            print("Error: Invalid task number.")
+            return False
+
+    # ---------- Bulk operations (one op, one undo entry, one write) ----------
+
+    def _valid_indices(self, indices_1based: Iterable[int]) -> Optional[List[int]]:
+        """Sorted unique 0-based indices, or None if any index is out of range."""
+        indices = sorted({i - 1 for i in indices_1based})
+        if indices and not (0 <= indices[0] and indices[-1] < len(self._tasks)):
+            print("Error: Invalid task number.")
+            return None
+        return indices
+
+    def add_many(self, descriptions: Iterable[str]) -> int:
+        """Append many tasks at once; blank descriptions are skipped.
+
+        Returns:
+            The number of tasks added.
+        """
+        with self._writing():
+            names = [d.strip() for d in descriptions]
+            names = [n for n in names if n]
+            if not names:
+                print("Error: No non-empty tasks to add.")
+                return 0
+            start = len(self._tasks)
+            items = [[start + k, {"description": n, "completed": False}] for k, n in enumerate(names)]
+            self._commit({"op": "insert_many", "items": items})
+            print(f"Success: {len(names)} task(s) added to your list.")
+            return len(names)
+
+    def toggle_many(self, indices_1based: Iterable[int]) -> int:
+        """Toggle several tasks by 1-based index (all or nothing).
+
+        Returns:
+            The number of tasks toggled; 0 if any index is out of range.
+        """
+        with self._writing():
+            indices = self._valid_indices(indices_1based)
+            if not indices:
+                return 0
+            self._commit({"op": "toggle_many", "indices": indices})
+            print(f"Success: {len(indices)} task(s) toggled.")
+            return len(indices)
+
+    def delete_many(self, indices_1based: Iterable[int]) -> int:
+        """Delete several tasks by 1-based index (all or nothing).
+
+        Returns:
+            The number of tasks deleted; 0 if any index is out of range.
+        """
+        with self._writing():
+            indices = self._valid_indices(indices_1based)
+            if not indices:
+                return 0
+            self._commit({"op": "delete_many", "indices": indices})
+            print(f"Deleted {len(indices)} task(s).")
+            return len(indices)
 
     def clear_completed(self) -> int:
         """Remove all completed tasks.
@@ -226,17 +1659,15 @@ class ToDoList:
         Returns:
             The number of tasks removed.
         """
-        before = len(self._tasks)
-        remaining = [t for t in self._tasks if not t.completed]
-        if len(remaining) == before:
-            print("No completed tasks to clear.")
-            return 0
-        self._snapshot()
-        self._tasks = remaining
-        self.save()
-        removed = before - len(self._tasks)
-        print(f"Cleared {removed} completed task(s).")
-        return removed
+        with self._writing():
+            before = len(self._tasks)
+            if not self._tasks.completed_count():
+                print("No completed tasks to clear.")
+                return 0
+            self._commit({"op": "clear_completed"})
+            removed = before - len(self._tasks)
+            print(f"Cleared {removed} completed task(s).")
+            return removed
 
     # ---------- Search / Filter ----------
 
@@ -244,30 +1675,28 @@ class ToDoList:
         self,
         keyword: Optional[str] = None,
         completed: Optional[bool] = None,
-    ) -> List[Task]:
-        """Return a filtered view of tasks (no persistence).
+    ) -> Sequence[Task]:
+        """Return the tasks matching the criteria, in list order (no persistence).
 
         Args:
             keyword: Case-insensitive substring to match in descriptions.
             completed: If True/False, filter by completion status.
 
         Returns:
-            A new list of tasks matching the criteria.
+            A read-only sequence of Task copies. The JSON/journal backends
+            return a lazy TaskView, valid until the next change; SQLite
+            returns a list. Modifying a returned task does not change the
+            stored one.
         """
-        items = self._tasks
-        if keyword is not None and keyword.strip():
-            q = self._norm(keyword)
-            items = [t for t in items if q in self._norm(t.description)]
-        if completed is not None:
-            items = [t for t in items if t.completed is completed]
-        return list(items)
+        q = self._norm(keyword) if keyword is not None and keyword.strip() else None
+        return self._tasks.search(q, completed)
 
 
 # -------------------------
 # Presentation (CLI)
 # -------------------------
 
-def print_tasks(tasks: List[Task]) -> None:
+def print_tasks(tasks: Sequence[Task]) -> None:
     """Pretty-print the current task list."""
     print("\n--- YOUR TO-DO LIST ---")
     if not tasks:
@@ -279,7 +1708,7 @@ def print_tasks(tasks: List[Task]) -> None:
     print("-----------------------\n")
 
 
-def print_filtered(tasks: List[Task]) -> None:
+def print_filtered(tasks: Sequence[Task]) -> None:
     """Pretty-print a filtered set of tasks."""
     if not tasks:
         print("(no matching tasks)")
@@ -293,8 +1722,29 @@ def print_filtered(tasks: List[Task]) -> None:
 
 def main() -> None:
     """Interactive CLI entry point."""
+    parser = argparse.ArgumentParser(description="To-Do List Manager (OOP, JSON)")
+    parser.add_argument("--file", type=Path, help="tasks file (default: tasks.json, or tasks.db for sqlite)")
+    parser.add_argument(
+        "--storage", choices=["json", "journal", "sqlite"], default="json",
+        help="json rewrites the file per change; journal appends one line per change; "
+             "sqlite stores tasks in an indexed database",
+    )
+    parser.add_argument(
+        "--commit-window", type=float, metavar="SECONDS",
+        help="coalesce changes made within SECONDS into one durable write "
+             "(default: 0 for json/journal, 1 for sqlite)",
+    )
+    args = parser.parse_args()
+
     print("Welcome to your personal To-Do List Manager (OOP, JSON)!")
-    todo = ToDoList()  # loads from tasks.json automatically
+    window = {} if args.commit_window is None else {"commit_window": args.commit_window}
+    if args.storage == "sqlite":
+        storage = SQLiteStorage(args.file or Path("tasks.db"), **window)
+    elif args.storage == "journal":
+        storage = JournalStorage(args.file or Path("tasks.json"), **window)
+    else:
+        storage = JsonStorage(args.file or Path("tasks.json"), **window)
+    todo = ToDoList(storage=storage)  # loads from tasks.json automatically
 
     while True:
         print("\nPlease choose an option:")
@@ -306,15 +1756,17 @@ def main() -> None:
         print("6. Clear completed tasks")
         print("7. Search / Filter")
         print("8. Undo last action")
-        print("9. Exit the application")
+        print("9. Redo last undone action")
+        print("10. Exit the application")
 
-        choice = input("Enter your choice (1-9): ").strip()
+        choice = input("Enter your choice (1-10): ").strip()
 
         if choice == "1":
             task_name = input("What task would you like to add? ")
             todo.add(task_name)
 
         elif choice == "2":
+            todo.refresh()  # Show edits made from other terminals/cron jobs
             print_tasks(todo.list())
 
         elif choice == "3":
@@ -327,9 +1779,9 @@ def main() -> None:
         elif choice == "4":
             try:
                 num = int(input("Enter the task number to edit: ").strip())
-                current_list = todo.list()
-                if 1 <= num <= len(current_list):
-                    print(f"Current: {current_list[num-1].description}")
+                current = todo.get(num)
+                if current is not None:
+                    print(f"Current: {current.description}")
                 new_text = input("Enter new description: ").strip()
                 todo.edit(num, new_text)
             except ValueError:
@@ -349,6 +1801,7 @@ def main() -> None:
             q = input("Keyword (press Enter to skip): ")
             s = input("Status [a]ll/[c]ompleted/[i]ncomplete (default a): ").strip().lower()
             status = True if s == "c" else False if s == "i" else None
+            todo.refresh()
             print_filtered(todo.filter(keyword=q, completed=status))
 
         elif choice == "8":
@@ -358,12 +1811,18 @@ def main() -> None:
                 print("Nothing to undo.")
 
         elif choice == "9":
+            if todo.redo():
+                print("Redo successful.")
+            else:
+                print("Nothing to redo.")
+
+        elif choice == "10":
             print("Thank you for using the To-Do List Manager. Goodbye!")
-            todo.save()
+            todo.close()  # Every change is already persisted; only pending windows flush
             break
 
         else:
-            print("Invalid choice. Please enter a number between 1 and 9.")
+            print("Invalid choice. Please enter a number between 1 and 10.")
 
 
 if __name__ == "__main__":
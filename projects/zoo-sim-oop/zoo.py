@@ -1,8 +1,22 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import argparse
+import gc
+import heapq
+import json
+import math
+import os
 import random
+import struct
+
+try:
+    import numpy as np  # Optional: only Zoo(vectorized=True) needs it
+except ImportError:
+    np = None
 
 # -------------------------------------------
 # Domain model for a simple Zoo Management app
@@ -11,8 +25,76 @@ import random
 # -------------------------------------------
 
 
+# ========== Time Sources ==========
+
+class Clock:
+    """Wall-clock time source; every time-based rule asks a Clock for now()."""
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+
+class VirtualClock(Clock):
+    """Clock that only moves when told to (used by Simulation)."""
+
+    def __init__(self, start: datetime):
+        self.current = start
+
+    def now(self) -> datetime:
+        return self.current
+
+
+WALL_CLOCK = Clock()
+
+
 # ========== Base Classes ==========
 
+class PopulationField:
+    """
+    Descriptor for per-animal numeric state.
+
+    Detached animals keep the value on the instance (as _<name>). Once a
+    Population attaches the animal, reads and writes go to one cell of the
+    population's column, so the animal object is only a view.
+
+    tracked fields also report every write to the owning zoo's ZooStats.
+    """
+
+    def __init__(
+        self,
+        load: Callable[[Any], Any] = lambda v: v,
+        store: Callable[[Any], Any] = lambda v: v,
+        tracked: bool = False,
+    ):
+        self.load = load    # array cell -> Python value
+        self.store = store  # Python value -> array cell
+        self.tracked = tracked
+
+    def __set_name__(self, owner, name: str):
+        self.column = name
+        self.attr = "_" + name
+
+    def __get__(self, animal, owner=None):
+        if animal is None:
+            return self
+        population = animal._population
+        if population is None:
+            return getattr(animal, self.attr)
+        return self.load(population.columns[self.column][animal._slot])
+
+    def __set__(self, animal, value):
+        stats = animal._stats if self.tracked else None
+        if stats is not None:
+            old = self.__get__(animal)
+        population = animal._population
+        if population is None:
+            setattr(animal, self.attr, value)
+        else:
+            population.columns[self.column][animal._slot] = self.store(value)
+        if stats is not None:
+            stats.changed(self.column, old, self.__get__(animal))
+
+
 class Animal(ABC):
     """
     Abstract base class for all animals.
@@ -28,8 +110,19 @@ class Animal(ABC):
 
     Note:
     - ABC ensures concrete species must implement the abstract methods. [19][20]
+    - age, weight, hunger_level and last_fed are PopulationFields: plain
+      values until a vectorized Zoo attaches the animal to its Population.
     """
 
+    age = PopulationField(load=int)
+    weight = PopulationField(load=float, tracked=True)
+    hunger_level = PopulationField(load=int, tracked=True)
+    last_fed = PopulationField(load=datetime.fromtimestamp, store=lambda when: when.timestamp())
+    _population: Optional["Population"] = None
+    _slot = -1
+    _stats: Optional["ZooStats"] = None  # Set while the animal belongs to a Zoo
+    clock: Clock = WALL_CLOCK  # A Zoo sets its own clock on the animals it holds
+
     def __init__(self, name: str, age: int, weight: float):
         """
         Initialize a new Animal.
@@ -48,7 +141,7 @@ class Animal(ABC):
         self.weight = weight
         self.hunger_level = 50  # 0–100 scale; 100 is very hungry
         self.health_status = "Healthy"
-        self.last_fed = datetime.now() - timedelta(hours=8)  # seed meaningful elapsed time
+        self.last_fed = self.clock.now() - timedelta(hours=8)  # seed meaningful elapsed time
 
     @abstractmethod
     def make_sound(self) -> str:
@@ -72,7 +165,7 @@ class Animal(ABC):
         - Updates last_fed to now so time‑based hunger resets [21]
         """
         self.hunger_level = max(0, self.hunger_level - food_amount)
-        self.last_fed = datetime.now()
+        self.last_fed = self.clock.now()
         return f"{self.name} has been fed. Hunger level: {self.hunger_level}"
 
     def get_status(self) -> str:
@@ -86,7 +179,7 @@ class Animal(ABC):
         Note:
         - This method mutates hunger_level when a long time passed to reflect reality. [21]
         """
-        hours_since_fed = (datetime.now() - self.last_fed).total_seconds() / 3600
+        hours_since_fed = (self.clock.now() - self.last_fed).total_seconds() / 3600
         if hours_since_fed > 12:
             # Late feeding penalty: increase hunger by elapsed hours (clamped to 100)
             self.hunger_level = min(100, self.hunger_level + int(hours_since_fed))
@@ -248,24 +341,261 @@ class Snake(Reptile):
         return f"{self.name} coils and strikes{venom_note}"
 
 
+# Species classes by name (scenario specs, snapshots)
+SPECIES = {"Lion": Lion, "Eagle": Eagle, "Penguin": Penguin, "Snake": Snake}
+
+
+# ========== Vectorized Population Store ==========
+
+class Population:
+    """
+    Struct-of-arrays store for animal state (requires NumPy).
+
+    One array per field (age, weight, hunger_level, last_fed as epoch
+    seconds) plus a species code and an alive mask. Every attached animal
+    owns one slot; its PopulationField attributes read and write that slot.
+    Feeding, hunger decay and statistics are then single array operations
+    instead of per-object Python loops.
+
+    Slots of removed animals are reused; arrays grow by doubling.
+    """
+
+    DTYPES = {
+        "age": "int32",
+        "weight": "float64",
+        "hunger_level": "int16",
+        "last_fed": "float64",
+        "species": "int16",
+        "alive": "bool",
+    }
+
+    def __init__(self, capacity: int = 1024):
+        if np is None:
+            raise ImportError("Population requires NumPy (pip install numpy)")
+        self.columns: Dict[str, "np.ndarray"] = {
+            field: np.zeros(capacity, dtype=dtype) for field, dtype in self.DTYPES.items()
+        }
+        self.zoo_stats: Optional[ZooStats] = None  # Kept in step by the bulk operations
+        self.species_names: List[str] = []
+        self._species_codes: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._used = 0  # High-water mark: slots [0, _used) have been handed out
+
+    def __len__(self) -> int:
+        return self._used - len(self._free)
+
+    def _grow(self) -> None:
+        for field, column in self.columns.items():
+            grown = np.zeros(max(1, 2 * len(column)), dtype=column.dtype)  # capacity=0 must grow too
+            grown[:len(column)] = column
+            self.columns[field] = grown
+
+    def species_code(self, species: str) -> int:
+        code = self._species_codes.get(species)
+        if code is None:
+            code = self._species_codes[species] = len(self.species_names)
+            self.species_names.append(species)
+        return code
+
+    def attach(self, animal: Animal) -> None:
+        """Move the animal's state into a slot; the animal becomes a view."""
+        if animal._population is not None:
+            raise ValueError(f"{animal.name} already belongs to a population")
+        if self._free:
+            slot = self._free.pop()
+        else:
+            if self._used == len(self.columns["alive"]):
+                self._grow()
+            slot = self._used
+            self._used += 1
+        columns = self.columns
+        columns["age"][slot] = animal._age  # Detached: values live on the instance
+        columns["weight"][slot] = animal._weight
+        columns["hunger_level"][slot] = animal._hunger_level
+        columns["last_fed"][slot] = animal._last_fed.timestamp()
+        columns["species"][slot] = self.species_code(animal.__class__.__name__)
+        columns["alive"][slot] = True
+        animal._population, animal._slot = self, slot
+
+    def detach(self, animal: Animal) -> None:
+        """Copy the slot back onto the animal and free the slot."""
+        if animal._population is not self:
+            return
+        values = {field: getattr(animal, field) for field in ("age", "weight", "hunger_level", "last_fed")}
+        self.columns["alive"][animal._slot] = False
+        self._free.append(animal._slot)
+        animal._population, animal._slot = None, -1
+        for field, value in values.items():
+            setattr(animal, field, value)
+
+    def _live(self) -> "np.ndarray":
+        return self.columns["alive"][:self._used]
+
+    # ---- Vectorized operations ----
+
+    def feed_all(self, food_amount: int = 20, now: Optional[datetime] = None) -> int:
+        """Animal.eat() for every animal at once; returns how many were fed."""
+        live = self._live()
+        hunger = self.columns["hunger_level"][:self._used]
+        was_hungry = int((hunger[live] > ZooStats.HUNGRY).sum())
+        hunger[live] = np.maximum(0, hunger[live] - food_amount)
+        if self.zoo_stats is not None:
+            self.zoo_stats.hungry_animals += int((hunger[live] > ZooStats.HUNGRY).sum()) - was_hungry
+        self.columns["last_fed"][:self._used][live] = (now or datetime.now()).timestamp()
+        return int(live.sum())
+
+    def update_hunger(self, now: Optional[datetime] = None) -> None:
+        """The late-feeding rule of Animal.get_status(), applied to every animal."""
+        live = self._live()
+        hours = ((now or datetime.now()).timestamp() - self.columns["last_fed"][:self._used]) / 3600
+        late = live & (hours > 12)
+        hunger = self.columns["hunger_level"][:self._used]
+        was_hungry = int((hunger[late] > ZooStats.HUNGRY).sum())
+        hunger[late] = np.minimum(100, hunger[late] + hours[late].astype(np.int64))
+        if self.zoo_stats is not None:
+            self.zoo_stats.hungry_animals += int((hunger[late] > ZooStats.HUNGRY).sum()) - was_hungry
+
+    def stats(self) -> Dict[str, Any]:
+        """Species counts, total weight and hungry count in a few array passes."""
+        live = self._live()
+        counts = np.bincount(self.columns["species"][:self._used][live], minlength=len(self.species_names))
+        return {
+            "animal_types": {name: int(n) for name, n in zip(self.species_names, counts) if n},
+            "total_weight": float(self.columns["weight"][:self._used][live].sum()),
+            "hungry_animals": int((self.columns["hunger_level"][:self._used][live] > ZooStats.HUNGRY).sum()),
+        }
+
+    def status_labels(self, animals: Iterable[Animal]) -> List[str]:
+        """Coarse hunger status ("Content"/"Hungry"/"Very Hungry") for the given animals."""
+        slots = np.fromiter((animal._slot for animal in animals), dtype=np.int64)
+        hunger = self.columns["hunger_level"][slots]
+        labels = np.array(["Content", "Hungry", "Very Hungry"])
+        return labels[np.searchsorted([30, 70], hunger, side="right")].tolist()
+
+
 # ========== Zoo Management ==========
 
+class AnimalIndex:
+    """
+    Insertion-ordered collection of animals with O(1) add, remove and name lookup.
+
+    Storage:
+    - _items: id(animal) -> animal (dicts keep insertion order; O(1) delete)
+    - _by_name: key(name) -> {id(animal): animal}, so duplicate names are
+      allowed and find() returns the earliest one still present
+
+    Note:
+    - Names are treated as fixed once an animal is indexed; rename by
+      removing and re-adding.
+    - Indexing, slicing, append() and remove() behave as on the list this
+      replaced; indexing walks the insertion order, so it is O(n).
+    """
+
+    def __init__(self, key: Callable[[str], str] = str.casefold):
+        self._key = key
+        self._items: Dict[int, Animal] = {}
+        self._by_name: Dict[str, Dict[int, Animal]] = {}
+
+    def add(self, animal: Animal) -> None:
+        """Index an animal (no-op if it is already present)."""
+        ident = id(animal)
+        self._items[ident] = animal
+        name = self._key(animal.name)
+        same_name = self._by_name.get(name)
+        if same_name is None:
+            self._by_name[name] = {ident: animal}
+        else:
+            same_name[ident] = animal
+
+    def discard(self, animal: Animal) -> bool:
+        """Remove an animal; returns True if it was present."""
+        if self._items.pop(id(animal), None) is None:
+            return False
+        name = self._key(animal.name)
+        same_name = self._by_name[name]
+        del same_name[id(animal)]
+        if not same_name:
+            del self._by_name[name]
+        return True
+
+    def append(self, animal: Animal) -> None:
+        """List-style alias of add()."""
+        self.add(animal)
+
+    def remove(self, animal: Animal) -> None:
+        """Remove an animal; raises ValueError if it is not present (as list.remove does)."""
+        if not self.discard(animal):
+            raise ValueError(f"{animal.name!r} is not in the index")
+
+    def find(self, name: str) -> Optional[Animal]:
+        """First animal added under this name (per the index key), or None."""
+        same_name = self._by_name.get(self._key(name))
+        return next(iter(same_name.values())) if same_name else None
+
+    def __contains__(self, animal: object) -> bool:
+        return id(animal) in self._items
+
+    def __iter__(self) -> Iterator[Animal]:
+        return iter(list(self._items.values()))  # Snapshot: safe to remove while iterating
+
+    def __getitem__(self, index):
+        """Animal(s) at an insertion-order position or slice, as for a list."""
+        return list(self._items.values())[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class ZooStats:
+    """
+    Running totals behind Zoo.get_zoo_stats().
+
+    Updated on every change instead of recomputed per call: add/remove
+    adjust them, and tracked PopulationFields (weight, hunger_level) report
+    each write, whether it comes from eat(), get_status() or a Simulation.
+    Vectorized Population operations adjust hungry_animals themselves.
+    """
+
+    HUNGRY = 50  # hunger_level above this counts as hungry
+
+    def __init__(self):
+        self.total_weight = 0.0
+        self.hungry_animals = 0
+
+    def add(self, animal: Animal) -> None:
+        self.total_weight += animal.weight
+        self.hungry_animals += animal.hunger_level > self.HUNGRY
+        animal._stats = self
+
+    def remove(self, animal: Animal) -> None:
+        animal._stats = None
+        self.total_weight -= animal.weight
+        self.hungry_animals -= animal.hunger_level > self.HUNGRY
+
+    def changed(self, field: str, old, new) -> None:
+        if field == "weight":
+            self.total_weight += new - old
+        elif field == "hunger_level":
+            self.hungry_animals += (new > self.HUNGRY) - (old > self.HUNGRY)
+
+
 class Exhibit:
     """
     Exhibit/enclosure container.
 
     Responsibilities:
-    - Hold a bounded list of animals
+    - Hold a bounded, indexed set of animals
     - Describe climate and capacity
     - Provide simple add/remove/info APIs
     """
 
-    def __init__(self, name: str, capacity: int, climate: str = "Temperate"):
+    def __init__(self, name: str, capacity: int, climate: str = "Temperate", clock: Clock = WALL_CLOCK):
         self.name = name
         self.capacity = capacity
         self.climate = climate
-        self.animals: List[Animal] = []
-        self.last_cleaned = datetime.now()
+        self.animals = AnimalIndex(key=str)  # Exact names, as remove_animal() matches
+        self.clock = clock
+        self.last_cleaned = clock.now()
 
     def add_animal(self, animal: Animal) -> bool:
         """
@@ -276,17 +606,14 @@ class Exhibit:
         - False if at capacity
         """
         if len(self.animals) < self.capacity:
-            self.animals.append(animal)
+            self.animals.add(animal)
             return True
         return False
 
     def remove_animal(self, animal_name: str) -> bool:
-        """Remove by name; returns True if removed, else False."""
-        for animal in self.animals:
-            if animal.name == animal_name:
-                self.animals.remove(animal)
-                return True
-        return False
+        """Remove by name in O(1); returns True if removed, else False."""
+        animal = self.animals.find(animal_name)
+        return animal is not None and self.animals.discard(animal)
 
     def get_info(self) -> str:
         """One‑line summary of enclosure occupancy."""
@@ -303,18 +630,54 @@ class Zoo:
     Main zoo management façade.
 
     Composition:
-    - animals: flat registry of all animals in the zoo
+    - animals: registry of all animals, indexed by case-folded name
     - exhibits: optional grouping/assignment
 
+    Indexes (kept consistent by add_animal/remove_animal):
+    - _species: species name -> AnimalIndex
+    - _exhibits_by_name: case-folded exhibit name -> Exhibit
+    - _exhibit_of: id(animal) -> Exhibit it was placed in
+
+    With vectorized=True, animal state lives in a NumPy Population and
+    feed_all_animals() and list_all_animals() update state as array
+    operations (their report lines are still built per animal).
+
+    get_zoo_stats() reads running counters (ZooStats plus the species
+    index). With check_stats=True every call also recomputes the figures
+    from scratch and raises AssertionError on any mismatch (for tests).
+
     Also tracks simple operational data like visitors_today. [2]
     """
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, vectorized: bool = False, clock: Clock = WALL_CLOCK, check_stats: bool = False):
         self.name = name
-        self.animals: List[Animal] = []
-        self.exhibits: List[Exhibit] = []
+        self.clock = clock
+        self.stats = ZooStats()
+        self.check_stats = check_stats
+        self.population = Population() if vectorized else None
+        if self.population is not None:
+            self.population.zoo_stats = self.stats
+        self._animals = AnimalIndex()
+        self._exhibits: List[Exhibit] = []
+        self._lazy: Optional[Dict[str, Any]] = None  # Restored snapshot not yet turned into objects
         self.visitors_today = 0
-        self.established_date = datetime.now()
+        self.established_date = clock.now()
+        self._species: Dict[str, AnimalIndex] = {}
+        self._exhibits_by_name: Dict[str, Exhibit] = {}
+        self._exhibit_of: Dict[int, Exhibit] = {}
+
+    @property
+    def animals(self) -> AnimalIndex:
+        """Registry of all animals (builds the objects of a lazily restored snapshot first)."""
+        if self._lazy is not None:
+            self._materialize()
+        return self._animals
+
+    @property
+    def exhibits(self) -> List[Exhibit]:
+        if self._lazy is not None:
+            self._materialize()  # Exhibit contents are filled in with the animals
+        return self._exhibits
 
     def _species_label(self, animal: Animal) -> str:
         """
@@ -363,13 +726,27 @@ class Zoo:
         - If exhibit_name is given:
           - Attempts to place animal; reports success/failure reason
         - Returns a human‑friendly status line including species label
+        - An animal belongs to at most one zoo at a time
         """
-        self.animals.append(animal)
+        if animal in self.animals:
+            return f"{animal.name} is already in the zoo"
+        if animal._stats is not None:
+            return f"{animal.name} belongs to another zoo"
+        if self.population is not None:
+            self.population.attach(animal)
+        animal.clock = self.clock
+        self.animals.add(animal)
+        self.stats.add(animal)
+        species = self._species.get(animal.__class__.__name__)
+        if species is None:
+            species = self._species[animal.__class__.__name__] = AnimalIndex()
+        species.add(animal)
         label = self._species_label(animal)
 
         if exhibit_name:
             exhibit = self.find_exhibit(exhibit_name)
             if exhibit and exhibit.add_animal(animal):
+                self._exhibit_of[id(animal)] = exhibit
                 return (
                     f"{animal.name} has been added to {exhibit_name} exhibit\n"
                     f"Category: {label}"
@@ -389,23 +766,71 @@ class Zoo:
 
     def create_exhibit(self, name: str, capacity: int, climate: str = "Temperate") -> str:
         """Create a new exhibit and register it with the zoo."""
-        exhibit = Exhibit(name, capacity, climate)
-        self.exhibits.append(exhibit)
+        exhibit = Exhibit(name, capacity, climate, clock=self.clock)
+        self._exhibits.append(exhibit)
+        self._exhibits_by_name.setdefault(name.casefold(), exhibit)  # First one wins, as before
         return f"Created exhibit '{name}' with capacity {capacity}"
 
-    def find_exhibit(self, name: str) -> Optional[Exhibit]:
-        """Case‑insensitive exhibit lookup by name; returns None if not found."""
+    def use_clock(self, clock: Clock) -> None:
+        """Switch the zoo, its animals and exhibits to another time source."""
+        self.clock = clock
+        for animal in self.animals:
+            animal.clock = clock
         for exhibit in self.exhibits:
-            if exhibit.name.lower() == name.lower():
-                return exhibit
-        return None
+            exhibit.clock = clock
+
+    def find_exhibit(self, name: str) -> Optional[Exhibit]:
+        """Case‑insensitive exhibit lookup by name (O(1)); returns None if not found."""
+        if self._lazy is not None:
+            self._materialize()
+        return self._exhibits_by_name.get(name.casefold())
 
     def find_animal(self, name: str) -> Optional[Animal]:
-        """Case‑insensitive animal lookup by display name; returns None if not found."""
-        for animal in self.animals:
-            if animal.name.lower() == name.lower():
-                return animal
-        return None
+        """Case‑insensitive animal lookup by display name (O(1)); returns None if not found."""
+        if self._lazy is not None:
+            return self._lazy_find(name)
+        return self.animals.find(name)
+
+    def find_by_species(self, species: str) -> List[Animal]:
+        """All animals of a species class name (e.g. "Lion"), in insertion order."""
+        if self._lazy is not None:
+            self._materialize()
+        index = self._species.get(species)
+        return list(index) if index else []
+
+    def exhibit_of(self, animal: Animal) -> Optional[Exhibit]:
+        """Exhibit the animal is currently placed in, or None."""
+        if self._lazy is not None:
+            self._materialize()
+        exhibit = self._exhibit_of.get(id(animal))
+        # Exhibit.remove_animal() may have been called directly; trust the exhibit
+        if exhibit is not None and animal not in exhibit.animals:
+            del self._exhibit_of[id(animal)]
+            return None
+        return exhibit
+
+    def remove_animal(self, name: str) -> str:
+        """
+        Remove an animal from the zoo and its exhibit by name (O(1)).
+
+        Uses the same case-insensitive lookup as find_animal().
+        """
+        animal = self.animals.find(name)
+        if animal is None:
+            return f"Animal '{name}' not found"
+        exhibit = self.exhibit_of(animal)
+        if exhibit is not None:
+            exhibit.animals.discard(animal)
+            del self._exhibit_of[id(animal)]
+        self.animals.discard(animal)
+        self.stats.remove(animal)
+        if self.population is not None:
+            self.population.detach(animal)
+        species = animal.__class__.__name__
+        self._species[species].discard(animal)
+        if not self._species[species]:
+            del self._species[species]
+        return f"{animal.name} has been removed from the zoo"
 
     def feed_animal(self, animal_name: str) -> str:
         """Feed a specific animal by name; returns status or error string."""
@@ -414,14 +839,26 @@ class Zoo:
             return animal.eat()
         return f"Animal '{animal_name}' not found"
 
-    def feed_all_animals(self) -> List[str]:
+    def feed_all_animals(self, report: bool = True) -> List[str]:
         """
         Feed every animal in one go.
 
         Polymorphism:
         - Calls eat() on each Animal regardless of concrete type. [22]
+
+        Vectorized zoos update every animal with one array operation; the
+        per-animal report lines are then the only per-animal work. Pass
+        report=False to get a single summary line instead (milliseconds
+        for 10⁶ animals, and a lazily restored zoo stays unmaterialized).
         """
-        return [animal.eat() for animal in self.animals]
+        if self.population is None:
+            lines = [animal.eat() for animal in self.animals]
+            return lines if report else [f"Fed {len(lines)} animals"]
+        fed = self.population.feed_all(now=self.clock.now())
+        if not report:
+            return [f"Fed {fed} animals"]
+        hunger = self.population.columns["hunger_level"]
+        return [f"{animal.name} has been fed. Hunger level: {hunger[animal._slot]}" for animal in self.animals]
 
     def daily_animal_show(self) -> List[str]:
         """
@@ -435,7 +872,7 @@ class Zoo:
 
     def get_zoo_stats(self) -> Dict:
         """
-        Compute basic operational metrics in one pass.
+        Report basic operational metrics in O(number of species).
 
         Returns a dict with:
         - total_animals: count of registered animals
@@ -448,7 +885,30 @@ class Zoo:
 
         Rationale:
         - Handy for dashboards/logs without scanning lists in multiple places.
+        - Counters are maintained on every change, so polling is cheap.
         """
+        if self.check_stats:
+            self.verify_stats()
+        return {
+            "total_animals": self._animal_count(),
+            "animal_types": self._species_counts(),
+            "total_exhibits": len(self._exhibits),
+            "total_weight": round(self.stats.total_weight, 2),
+            "hungry_animals": self.stats.hungry_animals,
+            "visitors_today": self.visitors_today,
+            "established_date": self.established_date.strftime('%d-%m-%Y'),
+        }
+
+    def _animal_count(self) -> int:
+        return self._lazy["count"] if self._lazy is not None else len(self._animals)
+
+    def _species_counts(self) -> Dict[str, int]:
+        if self._lazy is not None:
+            return dict(self._lazy["species_counts"])
+        return {species: len(index) for species, index in self._species.items()}
+
+    def recompute_stats(self) -> Dict:
+        """The same figures as get_zoo_stats(), from a full scan of every animal."""
         animal_types: Dict[str, int] = {}
         total_weight = 0.0
         hungry_animals = 0
@@ -457,7 +917,7 @@ class Zoo:
             species = animal.__class__.__name__
             animal_types[species] = animal_types.get(species, 0) + 1
             total_weight += animal.weight
-            if animal.hunger_level > 50:
+            if animal.hunger_level > ZooStats.HUNGRY:
                 hungry_animals += 1
 
         return {
@@ -470,14 +930,758 @@ class Zoo:
             "established_date": self.established_date.strftime('%d-%m-%Y'),
         }
 
+    def verify_stats(self) -> None:
+        """Raise AssertionError if the running counters disagree with a full recompute."""
+        expected = self.recompute_stats()
+        counted = {
+            "total_animals": len(self.animals),
+            "animal_types": self._species_counts(),
+            "hungry_animals": self.stats.hungry_animals,
+        }
+        for key, value in counted.items():
+            if value != expected[key]:
+                raise AssertionError(f"{key}: counter {value!r} != recomputed {expected[key]!r}")
+        # Weight is a float sum; allow rounding drift from many += / -= updates
+        if abs(round(self.stats.total_weight, 2) - expected["total_weight"]) > 0.01 + 1e-9 * abs(expected["total_weight"]):
+            raise AssertionError(
+                f"total_weight: counter {self.stats.total_weight!r} != recomputed {expected['total_weight']!r}"
+            )
+
     def list_all_animals(self) -> List[str]:
         """Return status strings for all animals (delegates to Animal.get_status)."""
-        return [animal.get_status() for animal in self.animals]
+        if self.population is None:
+            return [animal.get_status() for animal in self.animals]
+        # Same late-feeding rule and buckets as get_status(), for all animals at once
+        self.population.update_hunger(now=self.clock.now())
+        animals = list(self.animals)
+        return [
+            f"{animal.name} ({animal.__class__.__name__}): {status} | Health: {animal.health_status}"
+            for animal, status in zip(animals, self.population.status_labels(animals))
+        ]
 
     def list_all_exhibits(self) -> List[str]:
         """Return human‑readable info lines for each exhibit."""
         return [exhibit.get_info() for exhibit in self.exhibits]
 
+    # ---- Snapshot & restore ----
+
+    def snapshot(self, path: str) -> int:
+        """
+        Write the whole zoo to a compact columnar binary file; returns its size in bytes.
+
+        One row per animal (in registry order): species code, age, weight,
+        hunger, last_fed, exhibit index and health code as fixed-width
+        columns, names as one UTF-8 blob plus offsets, and species-specific
+        attributes (fur_color, pride_leader, body_temperature, ...) as
+        constants or columns. Zoo and exhibit fields go into a small JSON
+        header. Requires NumPy.
+        """
+        if np is None:
+            raise ImportError("snapshots require NumPy (pip install numpy)")
+        animals = list(self.animals)
+        species_names = list(dict.fromkeys(animal.__class__.__name__ for animal in animals))
+        species_codes = {name: code for code, name in enumerate(species_names)}
+        exhibit_codes = {id(exhibit): code for code, exhibit in enumerate(self._exhibits)}
+        health_table: Dict[str, int] = {}
+        n = len(animals)
+
+        arrays: Dict[str, "np.ndarray"] = {
+            "species": np.fromiter((species_codes[a.__class__.__name__] for a in animals), np.int16, n),
+            "exhibit": np.fromiter(
+                (exhibit_codes.get(id(self.exhibit_of(a)), -1) for a in animals), np.int32, n
+            ),
+            "health": np.fromiter(
+                (health_table.setdefault(a.health_status, len(health_table)) for a in animals), np.int32, n
+            ),
+        }
+        if self.population is not None:
+            slots = np.fromiter((a._slot for a in animals), np.int64, n)
+            for field in ("age", "weight", "hunger_level", "last_fed"):
+                arrays[field] = self.population.columns[field][slots]
+        else:
+            arrays["age"] = np.fromiter((a.age for a in animals), np.int32, n)
+            arrays["weight"] = np.fromiter((a.weight for a in animals), np.float64, n)
+            arrays["hunger_level"] = np.fromiter((a.hunger_level for a in animals), np.int16, n)
+            arrays["last_fed"] = np.fromiter((a.last_fed.timestamp() for a in animals), np.float64, n)
+        names = [a.name.encode("utf-8") for a in animals]
+        arrays["name_offsets"] = np.zeros(n + 1, dtype=np.uint64)
+        np.cumsum(np.fromiter(map(len, names), np.uint64, n), out=arrays["name_offsets"][1:])
+        arrays["names"] = np.frombuffer(b"".join(names), dtype=np.uint8)
+
+        extras = _encode_extras(animals, arrays["species"], arrays)
+        meta = {
+            "version": 1,
+            "count": n,
+            "zoo": {
+                "name": self.name,
+                "visitors_today": self.visitors_today,
+                "established": self.established_date.timestamp(),
+            },
+            "exhibits": [[e.name, e.capacity, e.climate, e.last_cleaned.timestamp()] for e in self._exhibits],
+            "species": species_names,
+            "health": list(health_table),
+            "extras": extras,
+        }
+        return _write_snapshot_file(path, meta, arrays)
+
+    @classmethod
+    def restore(cls, path: str, vectorized: bool = True, clock: Clock = WALL_CLOCK) -> "Zoo":
+        """
+        Load a zoo written by snapshot(), lazily.
+
+        The file is memory-mapped; only the header is parsed up front.
+        Statistics are computed from the columns right away (with
+        vectorized=True the columns become the Population), but Animal
+        objects are only built when needed: find_animal() builds just the
+        animal it finds, and the first access to zoo.animals, the exhibits
+        or a Simulation builds all of them in one bulk pass (seconds for
+        10⁵-10⁶ animals).
+        """
+        meta, arrays = _read_snapshot_file(path)
+        info = meta["zoo"]
+        zoo = cls(info["name"], vectorized=vectorized, clock=clock)
+        zoo.visitors_today = info["visitors_today"]
+        zoo.established_date = datetime.fromtimestamp(info["established"])
+        for name, capacity, climate, last_cleaned in meta["exhibits"]:
+            zoo.create_exhibit(name, capacity, climate)
+            zoo._exhibits[-1].last_cleaned = datetime.fromtimestamp(last_cleaned)
+
+        n = meta["count"]
+        unknown = set(meta["species"]) - set(SPECIES)
+        if unknown:
+            raise ValueError(f"unknown species in snapshot: {', '.join(sorted(unknown))}")
+        if zoo.population is not None:
+            population = zoo.population
+            population.species_names = []
+            population._species_codes = {}
+            for name in meta["species"]:
+                population.species_code(name)  # Same codes as in the file
+            if n > len(population.columns["alive"]):
+                population.columns = {
+                    field: np.zeros(n, dtype=column.dtype) for field, column in population.columns.items()
+                }
+            for field in ("species", "age", "weight", "hunger_level", "last_fed"):
+                population.columns[field][:n] = arrays[field]
+            population.columns["alive"][:n] = True
+            population._used = n
+
+        counts = np.bincount(arrays["species"], minlength=len(meta["species"]))
+        zoo.stats.total_weight = float(arrays["weight"].sum())
+        zoo.stats.hungry_animals = int((arrays["hunger_level"] > ZooStats.HUNGRY).sum())
+        zoo._lazy = {
+            "meta": meta,
+            "arrays": arrays,
+            "count": n,
+            "species_counts": {name: int(c) for name, c in zip(meta["species"], counts) if c},
+            "built": {},  # Row -> animal built early by a name lookup
+        }
+        return zoo
+
+    def _lazy_columns(self) -> Dict[str, Any]:
+        """The lazy snapshot's columns as Python lists, decoded once."""
+        lazy = self._lazy
+        columns = lazy.get("columns")
+        if columns is not None:
+            return columns
+        meta, arrays = lazy["meta"], lazy["arrays"]
+        blob = arrays["names"].tobytes()
+        offsets = arrays["name_offsets"].tolist()
+        templates, varying = _decode_extras(meta["extras"], arrays, len(meta["species"]))
+        columns = lazy["columns"] = {
+            "names": [blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(lazy["count"])],
+            "species": arrays["species"].tolist(),
+            "exhibit": arrays["exhibit"].tolist(),
+            "health": arrays["health"].tolist(),
+            "templates": templates,
+            "varying": varying,
+        }
+        if self.population is None:
+            for field in ("age", "weight", "hunger_level", "last_fed"):
+                columns[field] = arrays[field].tolist()
+        return columns
+
+    def _lazy_animals(self, indices: Iterable[int]) -> Iterator[Animal]:
+        """Animal objects for snapshot rows; rows built earlier are reused, not rebuilt."""
+        lazy = self._lazy
+        columns = self._lazy_columns()
+        classes = [SPECIES[name] for name in lazy["meta"]["species"]]
+        health = lazy["meta"]["health"]
+        names, species, health_codes = columns["names"], columns["species"], columns["health"]
+        templates, varying = columns["templates"], columns["varying"]
+        ages, weights = columns.get("age"), columns.get("weight")
+        hunger, last_fed = columns.get("hunger_level"), columns.get("last_fed")
+        built = lazy["built"]
+        population, clock, stats = self.population, self.clock, self.stats
+        for i in indices:
+            animal = built.get(i)
+            if animal is None:
+                code = species[i]
+                animal = classes[code].__new__(classes[code])  # No __init__: state comes from the file
+                state = animal.__dict__
+                state.update(templates[code])
+                for key, values in varying:
+                    value = values[i]
+                    if value is not None:
+                        state[key] = value
+                state["name"] = names[i]
+                state["health_status"] = health[health_codes[i]]
+                if population is None:
+                    state["_age"], state["_weight"], state["_hunger_level"] = ages[i], weights[i], hunger[i]
+                    state["_last_fed"] = datetime.fromtimestamp(last_fed[i])
+                else:
+                    state["_population"], state["_slot"] = population, i
+                state["clock"] = clock
+                state["_stats"] = stats
+            yield animal
+
+    def _lazy_find(self, name: str) -> Optional[Animal]:
+        """find_animal() on a lazy snapshot: builds only the animal found."""
+        lazy = self._lazy
+        first = lazy.get("first_by_name")
+        if first is None:
+            names = self._lazy_columns()["names"]
+            first = lazy["first_by_name"] = {}
+            for i, animal_name in enumerate(names):
+                first.setdefault(animal_name.casefold(), i)  # Earliest wins, as in AnimalIndex.find()
+        i = first.get(name.casefold())
+        if i is None:
+            return None
+        animal = lazy["built"][i] = next(self._lazy_animals([i]))
+        return animal
+
+    def _materialize(self) -> None:
+        """Build the Animal objects of a lazily restored snapshot, in bulk."""
+        lazy = self._lazy
+        meta = lazy["meta"]
+        exhibit_codes = self._lazy_columns()["exhibit"]
+        species = lazy["columns"]["species"]
+        exhibits = self._exhibits
+        exhibit_of = self._exhibit_of
+        add_to_zoo = self._animals.add
+        add_to_species = [self._species.setdefault(name, AnimalIndex()).add for name in meta["species"]]
+        gc_enabled = gc.isenabled()
+        gc.disable()  # Millions of new objects would trigger many useless collections
+        try:
+            for i, animal in enumerate(self._lazy_animals(range(lazy["count"]))):
+                add_to_zoo(animal)
+                add_to_species[species[i]](animal)
+                if exhibit_codes[i] >= 0:
+                    exhibit = exhibits[exhibit_codes[i]]
+                    exhibit.animals.add(animal)
+                    exhibit_of[id(animal)] = exhibit
+        finally:
+            if gc_enabled:
+                gc.enable()
+        self._lazy = None
+        self._species = {name: index for name, index in self._species.items() if len(index)}
+
+
+# ========== Snapshot File Format ==========
+#
+# MAGIC (8 bytes) | header length (uint64) | JSON header | arrays
+# Each array starts on an 8-byte boundary; the header lists
+# {name: [dtype, length, offset]} so readers can map them directly.
+
+SNAPSHOT_MAGIC = b"ZOOSNAP1"
+_CORE_ATTRS = {
+    "name", "health_status", "_age", "_weight", "_hunger_level", "_last_fed",
+    "_population", "_slot", "_stats", "clock",
+}
+
+
+def _write_snapshot_file(path: str, meta: Dict[str, Any], arrays: Dict[str, "np.ndarray"]) -> int:
+    layout, offset = {}, 0
+    for name, array in arrays.items():
+        layout[name] = [array.dtype.str, len(array), offset]
+        offset += -(-array.nbytes // 8) * 8
+    header = json.dumps({**meta, "arrays": layout}).encode("utf-8")
+    header += b" " * (-(len(SNAPSHOT_MAGIC) + 8 + len(header)) % 8)  # Align the array section
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(SNAPSHOT_MAGIC + struct.pack("<Q", len(header)) + header)
+        for array in arrays.values():
+            data = np.ascontiguousarray(array).tobytes()
+            f.write(data + b"\0" * (-len(data) % 8))
+        size = f.tell()
+    os.replace(tmp, path)  # Never leave a half-written snapshot under the real name
+    return size
+
+
+def _read_snapshot_file(path: str) -> Tuple[Dict[str, Any], Dict[str, "np.ndarray"]]:
+    """Parse the header and map every array (copy-on-write, read on demand)."""
+    if np is None:
+        raise ImportError("snapshots require NumPy (pip install numpy)")
+    with open(path, "rb") as f:
+        magic, header_len = f.read(8), struct.unpack("<Q", f.read(8))[0]
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"{path} is not a zoo snapshot")
+        meta = json.loads(f.read(header_len))
+    base = 16 + header_len
+    arrays = {}
+    for name, (dtype, length, offset) in meta.pop("arrays").items():
+        if length == 0:
+            arrays[name] = np.zeros(0, dtype=dtype)
+        else:
+            arrays[name] = np.memmap(path, dtype=dtype, mode="c", offset=base + offset, shape=(length,))
+    return meta, arrays
+
+
+def _encode_extras(animals: List[Animal], species: "np.ndarray", arrays: Dict[str, "np.ndarray"]) -> Dict[str, Any]:
+    """
+    Species-specific attributes (everything outside _CORE_ATTRS).
+
+    Per species, an attribute that every animal has with the same value
+    (fur_color, wingspan, ...) is stored once in the header; the rest
+    (pride_leader, ...) become a column: int8 for bools, int32 codes into
+    a string table, float64 otherwise, with -1/NaN for "absent".
+    """
+    values: Dict[str, List[Any]] = {}
+    for row, animal in enumerate(animals):
+        for key, value in vars(animal).items():
+            if key not in _CORE_ATTRS:
+                column = values.get(key)
+                if column is None:
+                    column = values[key] = [None] * len(animals)
+                column[row] = value
+    codes = species.tolist()
+    extras = {}
+    for key, column in values.items():
+        kinds = {type(v) for v in column if v is not None}
+        if kinds <= {bool}:
+            kind = "bool"
+        elif kinds <= {int}:
+            kind = "int"
+        elif kinds <= {int, float}:
+            kind = "float"
+        elif kinds <= {str}:
+            kind = "str"
+        else:
+            raise TypeError(f"cannot snapshot attribute {key!r} of type {', '.join(t.__name__ for t in kinds)}")
+        seen: Dict[int, set] = {}
+        for code, value in zip(codes, column):
+            seen.setdefault(code, set()).add(value)
+        varies = {code for code, vals in seen.items() if len(vals) > 1}
+        const = {code: vals.pop() for code, vals in seen.items() if code not in varies and None not in vals}
+        extras[key] = spec = {"kind": kind, "const": {str(code): value for code, value in const.items()}}
+        if not varies:
+            continue
+        column = [None if code in const else v for code, v in zip(codes, column)]
+        if kind == "str":
+            table: Dict[str, int] = {}
+            arrays["x_" + key] = np.fromiter(
+                (-1 if v is None else table.setdefault(v, len(table)) for v in column), np.int32, len(column)
+            )
+            spec["table"] = list(table)
+        elif kind == "bool":
+            arrays["x_" + key] = np.fromiter((-1 if v is None else v for v in column), np.int8, len(column))
+        else:
+            arrays["x_" + key] = np.array([np.nan if v is None else float(v) for v in column], dtype=np.float64)
+    return extras
+
+
+def _decode_extras(
+    extras: Dict[str, Any], arrays: Dict[str, "np.ndarray"], n_species: int
+) -> Tuple[List[Dict[str, Any]], List[Tuple[str, List[Any]]]]:
+    """Per-species constant attributes, and (key, per-animal values or None) columns."""
+    templates: List[Dict[str, Any]] = [{} for _ in range(n_species)]
+    varying = []
+    cast = {"int": int, "float": float}
+    for key, spec in extras.items():
+        for code, value in spec["const"].items():
+            templates[int(code)][key] = value
+        column = arrays.get("x_" + key)
+        if column is None:
+            continue
+        if spec["kind"] == "str":
+            table = spec["table"]
+            varying.append((key, [None if c < 0 else table[c] for c in column.tolist()]))
+        elif spec["kind"] == "bool":
+            varying.append((key, [None if c < 0 else bool(c) for c in column.tolist()]))
+        else:
+            to_value = cast[spec["kind"]]
+            varying.append((key, [None if v != v else to_value(v) for v in column.tolist()]))
+    return templates, varying
+
+
+# ========== Discrete-Event Simulation ==========
+
+class Simulation:
+    """
+    Discrete-event simulation of one Zoo on a virtual clock.
+
+    Events sit in a heapq priority queue as (time, seq, kind, target,
+    version) tuples, with time in seconds since start and seq breaking
+    ties, so runs are reproducible. Nothing happens between events, which
+    is why days of zoo time take milliseconds. Event kinds:
+
+    - "feeding": keeper round at each hour in feeding_hours (eat() on every animal)
+    - "hunger": an animal's hunger reaches alert_level ("Very Hungry")
+    - "cleaning": an exhibit is cleaned every cleaning_hours (Exhibit.last_cleaned)
+    - "visitors": a visitor group arrives (Poisson arrivals while open)
+    - "day_end": daily metrics are recorded and daily counters reset
+
+    Hunger grows by hunger_per_hour. It is brought up to date lazily (on
+    feeding and alert events), and each animal has at most one pending
+    alert: feeding bumps the animal's version, which voids older alerts.
+
+    Parameters:
+    - seed: seeds the simulation's own random.Random (visitor arrivals and group sizes)
+    - start: virtual start time; default is midnight of the current day
+    """
+
+    def __init__(
+        self,
+        zoo: Zoo,
+        seed: int = 0,
+        start: Optional[datetime] = None,
+        hunger_per_hour: float = 2.5,
+        alert_level: int = 70,
+        feeding_hours: Sequence[float] = (8, 13, 18),
+        feed_amount: int = 20,
+        cleaning_hours: float = 24,
+        opening_hours: Tuple[float, float] = (9, 17),
+        visitor_groups_per_hour: float = 30,
+        group_size: Tuple[int, int] = (1, 6),
+    ):
+        self.zoo = zoo
+        self.rng = random.Random(seed)
+        if start is None:
+            start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.start = start
+        self.clock = VirtualClock(start)
+        zoo.use_clock(self.clock)
+        self.hunger_per_hour = hunger_per_hour
+        self.alert_level = alert_level
+        self.feeding_hours = sorted(feeding_hours)
+        self.feed_amount = feed_amount
+        self.cleaning_hours = cleaning_hours
+        self.opening_hours = opening_hours
+        self.visitor_groups_per_hour = visitor_groups_per_hour
+        self.group_size = group_size
+
+        self.time = 0.0  # Seconds since start
+        self.events_processed = 0
+        self.daily: List[Dict[str, Any]] = []
+        self._queue: List[Tuple[float, int, str, Any, int]] = []
+        self._seq = 0
+        self._hunger: Dict[int, float] = {}   # id(animal) -> exact (fractional) hunger
+        self._synced: Dict[int, float] = {}   # id(animal) -> time of that value
+        self._version: Dict[int, int] = {}    # id(animal) -> bumps on feeding
+        self._today = {"feedings": 0, "alerts": 0, "cleanings": 0, "visitor_groups": 0}
+
+        for animal in zoo.animals:
+            animal.last_fed = min(animal.last_fed, start)
+            self._schedule_alert(animal)
+        for hour in self.feeding_hours:
+            self.schedule(hour * 3600, "feeding")
+        for exhibit in zoo.exhibits:
+            exhibit.last_cleaned = min(exhibit.last_cleaned, start)
+            due = (exhibit.last_cleaned - start).total_seconds() + cleaning_hours * 3600
+            self.schedule(max(due, 0.0), "cleaning", exhibit)
+        self.schedule(opening_hours[0] * 3600, "visitors")
+        self.schedule(86400, "day_end")
+
+    # ---- Scheduling ----
+
+    def schedule(self, at: float, kind: str, target: Any = None, version: int = 0) -> None:
+        """Queue an event at `at` seconds since start."""
+        heapq.heappush(self._queue, (at, self._seq, kind, target, version))
+        self._seq += 1
+
+    def run(self, days: float = 1.0) -> List[Dict[str, Any]]:
+        """Advance the virtual clock by `days`; returns the daily reports completed meanwhile."""
+        return self.run_until(self.time + days * 86400)
+
+    def run_until(self, end: float) -> List[Dict[str, Any]]:
+        reports_before = len(self.daily)
+        handlers = {
+            "feeding": self._on_feeding,
+            "hunger": self._on_hunger,
+            "cleaning": self._on_cleaning,
+            "visitors": self._on_visitors,
+            "day_end": self._on_day_end,
+        }
+        queue = self._queue
+        while queue and queue[0][0] <= end:
+            at, _, kind, target, version = heapq.heappop(queue)
+            self._advance(at)
+            handlers[kind](target, version)
+            self.events_processed += 1
+        self._advance(end)
+        return self.daily[reports_before:]
+
+    def _advance(self, at: float) -> None:
+        self.time = at
+        self.clock.current = self.start + timedelta(seconds=at)
+
+    # ---- Hunger model ----
+
+    def _sync(self, animal: Animal) -> float:
+        """Bring one animal's hunger up to the current time."""
+        key = id(animal)
+        level = self._hunger.get(key)
+        if level is None or int(level) != animal.hunger_level:
+            level = float(animal.hunger_level)  # New animal, or fed/changed outside the simulation
+        else:
+            level += self.hunger_per_hour * (self.time - self._synced[key]) / 3600
+        level = min(100.0, level)
+        self._hunger[key], self._synced[key] = level, self.time
+        animal.hunger_level = int(level)
+        return level
+
+    def _schedule_alert(self, animal: Animal) -> None:
+        level = self._sync(animal)
+        if level < self.alert_level and self.hunger_per_hour > 0:
+            at = self.time + (self.alert_level - level) / self.hunger_per_hour * 3600
+            self.schedule(at, "hunger", animal, self._version.get(id(animal), 0))
+
+    # ---- Event handlers ----
+
+    def _on_feeding(self, _target, _version) -> None:
+        for animal in self.zoo.animals:
+            self._sync(animal)
+            animal.eat(self.feed_amount)
+            self._hunger[id(animal)] = float(animal.hunger_level)
+            self._version[id(animal)] = self._version.get(id(animal), 0) + 1
+            self._schedule_alert(animal)
+        self._today["feedings"] += 1
+        self.schedule(self.time + 86400, "feeding")
+
+    def _on_hunger(self, animal: Animal, version: int) -> None:
+        if version != self._version.get(id(animal), 0) or animal not in self.zoo.animals:
+            return  # Voided by a feeding, or the animal left the zoo
+        self._sync(animal)
+        self._today["alerts"] += 1
+
+    def _on_cleaning(self, exhibit: Exhibit, _version) -> None:
+        exhibit.last_cleaned = self.clock.now()
+        self._today["cleanings"] += 1
+        self.schedule(self.time + self.cleaning_hours * 3600, "cleaning", exhibit)
+
+    def _on_visitors(self, _target, _version) -> None:
+        opens, closes = (hour * 3600 for hour in self.opening_hours)
+        second_of_day = self.time % 86400
+        if opens <= second_of_day < closes:
+            self.zoo.admit_visitors(self.rng.randint(*self.group_size))
+            self._today["visitor_groups"] += 1
+        gap = self.rng.expovariate(self.visitor_groups_per_hour / 3600)
+        next_at = self.time + gap
+        if next_at % 86400 >= closes or next_at // 86400 > self.time // 86400:
+            next_at = (self.time // 86400 + 1) * 86400 + opens  # Next morning
+        self.schedule(next_at, "visitors")
+
+    def _on_day_end(self, _target, _version) -> None:
+        stats = self.zoo.get_zoo_stats()
+        self.daily.append({
+            "day": len(self.daily) + 1,
+            "visitors": self.zoo.visitors_today,
+            **self._today,
+            "hungry_animals": stats["hungry_animals"],
+        })
+        self.zoo.reset_daily_counters()
+        self._today = dict.fromkeys(self._today, 0)
+        self.schedule(self.time + 86400, "day_end")
+
+
+# ========== Scenario Runner (many zoos, many cores) ==========
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    One Monte Carlo run: how to build a zoo and how to operate it.
+
+    Small and picklable, so scenarios (not zoos) are sent to workers and
+    each worker builds its zoo locally. seed drives everything random in
+    the run, so a scenario gives the same result on any worker.
+    """
+    seed: int
+    days: int = 7
+    animals: Tuple[Tuple[str, int], ...] = (("Lion", 2), ("Eagle", 2), ("Penguin", 4), ("Snake", 2))
+    feeding_hours: Tuple[float, ...] = (8, 13, 18)
+    feed_amount: int = 20
+    visitor_groups_per_hour: float = 30
+    vectorized: bool = False
+
+    def build_zoo(self) -> Zoo:
+        """One exhibit per species ("Lion House", ...) sized for its animals."""
+        zoo = Zoo(f"Scenario {self.seed}", vectorized=self.vectorized)
+        for species, count in self.animals:
+            zoo.create_exhibit(f"{species} House", count)
+            for i in range(count):
+                zoo.add_animal(SPECIES[species](f"{species}-{i + 1}", age=1 + i % 10), f"{species} House")
+        return zoo
+
+
+def scenarios_from_seed(base_seed: int, count: int, **params) -> List[Scenario]:
+    """count scenarios with independent seeds derived from base_seed."""
+    rng = random.Random(base_seed)
+    return [Scenario(seed=rng.getrandbits(63), **params) for _ in range(count)]
+
+
+class RunningStats:
+    """
+    Count, mean, variance, min and max of a stream of numbers, mergeable.
+
+    add() is Welford's update; merge() combines two partial results
+    exactly (Chan et al.), so shards can be reduced in any grouping.
+    """
+
+    __slots__ = ("count", "mean", "m2", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        if other.count:
+            total = self.count + other.count
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / total
+            self.m2 += other.m2 + delta * delta * self.count * other.count / total
+            self.count = total
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (0 for fewer than two values)."""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def __getstate__(self):
+        return (self.count, self.mean, self.m2, self.min, self.max)
+
+    def __setstate__(self, state):
+        self.count, self.mean, self.m2, self.min, self.max = state
+
+
+class DailyMetrics:
+    """
+    Mergeable reducer over Simulation daily reports.
+
+    Keeps one RunningStats per (day, metric), so memory depends on days x
+    metrics, not on the number of scenarios. Shards reduce their own runs
+    and the parent merges the shard results.
+    """
+
+    def __init__(self):
+        self.scenarios = 0
+        self.days: Dict[int, Dict[str, RunningStats]] = {}
+
+    def add_run(self, reports: Iterable[Dict[str, Any]]) -> None:
+        self.scenarios += 1
+        for report in reports:
+            day = self.days.setdefault(report["day"], {})
+            for metric, value in report.items():
+                if metric != "day":
+                    day.setdefault(metric, RunningStats()).add(value)
+
+    def merge(self, other: "DailyMetrics") -> "DailyMetrics":
+        self.scenarios += other.scenarios
+        for day, metrics in other.days.items():
+            mine = self.days.setdefault(day, {})
+            for metric, stats in metrics.items():
+                mine.setdefault(metric, RunningStats()).merge(stats)
+        return self
+
+    def summary(self, metric: str) -> List[Tuple[int, float, float, float, float]]:
+        """(day, mean, std, min, max) of one metric for every simulated day."""
+        rows = []
+        for day, metrics in sorted(self.days.items()):
+            stats = metrics[metric]
+            rows.append((day, stats.mean, stats.std, stats.min, stats.max))
+        return rows
+
+
+def run_scenario(scenario: Scenario) -> List[Dict[str, Any]]:
+    """Build, simulate and report one scenario (daily reports plus show acts per day)."""
+    # Lion() draws pride_leader from the module-level random; seed it per
+    # scenario and restore it so in-process runs do not disturb the caller
+    saved = random.getstate()
+    random.seed(scenario.seed)
+    try:
+        zoo = scenario.build_zoo()
+    finally:
+        random.setstate(saved)
+    simulation = Simulation(
+        zoo,
+        seed=scenario.seed,
+        start=datetime(2025, 1, 1),
+        feeding_hours=scenario.feeding_hours,
+        feed_amount=scenario.feed_amount,
+        visitor_groups_per_hour=scenario.visitor_groups_per_hour,
+    )
+    reports = []
+    for _ in range(scenario.days):
+        for report in simulation.run(days=1):
+            report["show_acts"] = len(zoo.daily_animal_show())
+            reports.append(report)
+    return reports
+
+
+def _run_shard(scenarios: List[Scenario]) -> DailyMetrics:
+    """Worker: run a shard of scenarios and send back one small reducer."""
+    metrics = DailyMetrics()
+    for scenario in scenarios:
+        metrics.add_run(run_scenario(scenario))
+    return metrics
+
+
+class ScenarioRunner:
+    """
+    Run many scenarios across a process pool and aggregate per-day metrics.
+
+    Scenarios are cut into shards (several per worker, for load balance);
+    each worker reduces its shard to one DailyMetrics, and shard results
+    are merged in submission order, so the output does not depend on
+    which worker ran what.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, shard_size: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.shard_size = shard_size
+
+    def shards(self, scenarios: Sequence[Scenario]) -> List[List[Scenario]]:
+        size = self.shard_size or max(1, math.ceil(len(scenarios) / (4 * self.max_workers)))
+        return [list(scenarios[i:i + size]) for i in range(0, len(scenarios), size)]
+
+    def run(self, scenarios: Sequence[Scenario], parallel: bool = True) -> DailyMetrics:
+        shards = self.shards(scenarios)
+        total = DailyMetrics()
+        if not parallel or self.max_workers == 1 or len(shards) <= 1:
+            for partial in map(_run_shard, shards):
+                total.merge(partial)
+            return total
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            for partial in pool.map(_run_shard, shards):
+                total.merge(partial)
+        return total
+
+
+def scenarios_main(args: argparse.Namespace) -> None:
+    """Non-interactive Monte Carlo run: print mean/std of daily metrics."""
+    scenarios = scenarios_from_seed(args.seed, args.scenarios, days=args.days)
+    runner = ScenarioRunner(max_workers=args.workers)
+    start = datetime.now()
+    metrics = runner.run(scenarios)
+    elapsed = (datetime.now() - start).total_seconds()
+    print(f"🎲 {metrics.scenarios} scenarios × {args.days} days on {runner.max_workers} workers in {elapsed:.2f}s")
+    for metric in ("visitors", "alerts", "hungry_animals"):
+        print(f"\n{metric}:")
+        for day, mean, std, low, high in metrics.summary(metric):
+            print(f"  day {day:>2}: mean {mean:8.1f}  std {std:7.1f}  min {low:6.0f}  max {high:6.0f}")
+
 
 # ========== Interactive CLI ==========
 
@@ -532,8 +1736,8 @@ def add_animal_interactive(zoo: Zoo):
         print("❌ Invalid animal type")
 
 
-def main():
-    """Main event loop for the CLI demo."""
+def seed_zoo() -> Zoo:
+    """The demo zoo used when there is no saved state."""
     zoo = Zoo("Safari Adventure Zoo")
 
     # Seed a few exhibits so “add to exhibit” works immediately.
@@ -546,6 +1750,27 @@ def main():
     zoo.add_animal(Eagle("Freedom", 3), "Savanna")
     zoo.add_animal(Penguin("Pingu", 2), "Arctic")
     zoo.add_animal(Snake("Kaa", 4), "Rainforest")
+    return zoo
+
+
+def main():
+    """Main event loop for the CLI demo (or a scenario run with --scenarios)."""
+    parser = argparse.ArgumentParser(description="Zoo Management System")
+    parser.add_argument("--scenarios", type=int, metavar="N", help="run N simulated scenarios and exit")
+    parser.add_argument("--days", type=int, default=7, help="simulated days per scenario (default: 7)")
+    parser.add_argument("--seed", type=int, default=0, help="base seed for --scenarios (default: 0)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--state", metavar="PATH", help="restore the zoo from this snapshot and save it on exit")
+    args = parser.parse_args()
+    if args.scenarios is not None:
+        scenarios_main(args)
+        return
+
+    if args.state and os.path.exists(args.state):
+        zoo = Zoo.restore(args.state)
+        print(f"📂 Restored {zoo.name} from {args.state}")
+    else:
+        zoo = seed_zoo()
 
     while True:
         display_menu()
@@ -624,6 +1849,9 @@ def main():
             print(f"♻️  {result}")
 
         elif choice == "12":
+            if args.state:
+                zoo.snapshot(args.state)
+                print(f"💾 Saved {zoo.name} to {args.state}")
             print(f"🙏 Thank you for visiting {zoo.name}!")
             break
 